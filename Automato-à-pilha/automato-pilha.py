@@ -1,6 +1,15 @@
 import math
+import os
+import sys
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, filedialog
+
+from pda import PDA, INDECIDIDO, TODOS
+
+# Formato de arquivo e layout compartilhados com os outros simuladores (pasta comum/)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum.formato import carregar, salvar
+from comum.layout import GradeEspacial, LayoutCamadas
 
 # ============================================================
 #           CONFIGURAÇÃO DO ESTILO MODERNO (TKINTER)
@@ -78,108 +87,135 @@ subtitle.pack(anchor="w")
 main_frame = tk.Frame(root, bg="#f1f5f9")
 main_frame.pack(fill="both", expand=True, padx=15)
 
-# Canvas onde os estados e transições são desenhados
+# Canvas onde os estados e transições são desenhados, com barras de rolagem
 canvas_frame = tk.Frame(main_frame, bg="white", bd=1, relief="solid")
 canvas_frame.pack(side="left", expand=True, fill="both", padx=(0,15))
 
-canvas = tk.Canvas(canvas_frame, bg="white")
+def rolar_x(*args):
+    canvas.xview(*args)
+    desenhar_visiveis()
+
+def rolar_y(*args):
+    canvas.yview(*args)
+    desenhar_visiveis()
+
+scroll_x = tk.Scrollbar(canvas_frame, orient="horizontal", command=rolar_x)
+scroll_x.pack(side="bottom", fill="x")
+scroll_y = tk.Scrollbar(canvas_frame, orient="vertical", command=rolar_y)
+scroll_y.pack(side="right", fill="y")
+
+canvas = tk.Canvas(canvas_frame, bg="white",
+                   xscrollcommand=scroll_x.set, yscrollcommand=scroll_y.set)
 canvas.pack(fill="both", expand=True)
 
 # ============================================================
 #      ESTRUTURAS DE DADOS DO AUTÔMATO (MEMÓRIA DO AP)
 # ============================================================
 
-estados = {}          # Ex.: {"q0": {"inicial": True, "final": False}}
-transicoes = []       # Lista de regras do AP
-posicoes_estados = {} # Posições (x,y) no canvas
-objetos_canvas = {}   # IDs dos objetos desenhados
-
+ap = PDA()                    # Estados e transições; simulação em pda.py
+layout = LayoutCamadas()      # Posições calculadas uma vez e guardadas
+posicoes_estados = layout.posicoes  # (x,y) no modelo, sem zoom
+grade = GradeEspacial()       # O que está em cada região, para desenhar só o visível
+objetos_canvas = {}           # IDs dos estados desenhados
+objetos_transicoes = {}       # IDs das transições desenhadas, por índice em ap.transicoes
+visao_atual = {"zoom": 1.0}
 
-# ============================================================
-#                   SIMULAÇÃO DO AUTÔMATO A PILHA
-# ============================================================
-def simular_automato(entrada):
-    # Achar o estado inicial
-    inicios = [e for e, info in estados.items() if info.get("inicial")]
-    if not inicios:
-        return "ERRO: nenhum estado inicial definido."
-    inicial = inicios[0]
-
-    # Fila da BFS: (estado, índice da cadeia, pilha)
-    fila = [(inicial, 0, "Z")] 
-    visitados = set()
-
-    while fila:
-        estado, i, pilha = fila.pop(0)
-
-        # Evitar estados repetidos (loop infinito)
-        chave = (estado, i, pilha)
-        if chave in visitados:
-            continue
-        visitados.add(chave)
-
-        # Condição de aceitação: fim da cadeia + estado final + pilha vazia ou Z
-        if i == len(entrada) and estados[estado].get("final") and (pilha == "Z" or pilha == ""):
-            return "ACEITA"
-
-        # Testar todas transições
-        for t in transicoes:
-            if t["origem"] != estado:
-                continue
-
-            ler = t["entrada"]
-            desempilha = t["pilha"]
-            empilha = t["empilha"]
-            prox = t["destino"]
-
-            # Verifica leitura do símbolo
-            if ler != "ε":
-                if i >= len(entrada) or entrada[i] != ler:
-                    continue
-                prox_i = i + 1
-            else:
-                prox_i = i
-
-            # Verifica topo da pilha
-            if desempilha != "ε":
-                if not pilha or pilha[-1] != desempilha:
-                    continue
-                nova_pilha = pilha[:-1]
-            else:
-                nova_pilha = pilha
-
-            # Empilha novo símbolo
-            if empilha != "ε":
-                nova_pilha = nova_pilha + empilha
-
-            # Empilha nova configuração na fila
-            fila.append((prox, prox_i, nova_pilha))
-
-    return "REJEITA"
+RAIO = 35
+LACO = 30
 
 
 # ============================================================
 #            FUNÇÕES DE DESENHO NO CANVAS (DIAGRAMA)
 # ============================================================
+#
+# Só o que cruza a área visível tem itens no canvas: ao rolar, dar zoom ou
+# redimensionar, desenhar_visiveis() cria o que entrou e apaga o que saiu.
+
+def area_visivel():
+    """Retângulo visível em coordenadas do modelo (sem zoom)."""
+    f = visao_atual["zoom"]
+    x0, y0 = canvas.canvasx(0), canvas.canvasy(0)
+    return (x0 / f, y0 / f,
+            (x0 + canvas.winfo_width()) / f, (y0 + canvas.winfo_height()) / f)
+
+def atualizar_regiao():
+    """Ajusta a área rolável ao tamanho do diagrama no zoom atual."""
+    f = visao_atual["zoom"]
+    limites = layout.limites() or (0, 0, 0, 0)
+    margem = RAIO + 3 * LACO + 60
+    canvas.configure(scrollregion=(min(0, limites[0] - margem) * f,
+                                   min(0, limites[1] - margem) * f,
+                                   (limites[2] + margem) * f,
+                                   (limites[3] + margem) * f))
+
+def indexar_estado(nome):
+    x, y = posicoes_estados[nome]
+    # Caixa com a seta de estado inicial e o rótulo de um laço acima
+    grade.inserir(("estado", nome), x - RAIO - 30, y - RAIO - 2 * LACO - 20, x + RAIO, y + RAIO)
+
+def indexar_transicao(k):
+    t = ap.transicoes[k]
+    x1, y1 = posicoes_estados[t["origem"]]
+    x2, y2 = posicoes_estados[t["destino"]]
+    grade.inserir(("transicao", k), min(x1, x2) - RAIO, min(y1, y2) - RAIO - 2 * LACO - 20,
+                  max(x1, x2) + RAIO, max(y1, y2) + RAIO)
+
+def apagar_desenho():
+    for objs in objetos_canvas.values():
+        canvas.delete(objs["circulo"], objs["texto"], *(objs.get("extra") or ()))
+    for ids in objetos_transicoes.values():
+        canvas.delete(*ids)
+    objetos_canvas.clear()
+    objetos_transicoes.clear()
+
+def desenhar_visiveis():
+    """Cria os itens que entraram na área visível e apaga os que saíram."""
+    visiveis = grade.consultar(*area_visivel())
+
+    for nome in [n for n in objetos_canvas if ("estado", n) not in visiveis]:
+        objs = objetos_canvas.pop(nome)
+        canvas.delete(objs["circulo"], objs["texto"], *(objs.get("extra") or ()))
+    for k in [k for k in objetos_transicoes if ("transicao", k) not in visiveis]:
+        canvas.delete(*objetos_transicoes.pop(k))
+
+    for tipo, chave in visiveis:
+        if tipo == "estado" and chave not in objetos_canvas:
+            criar_estado(chave)
+        elif tipo == "transicao" and chave not in objetos_transicoes:
+            objetos_transicoes[chave] = criar_transicao(chave)
+
+def redesenhar_canvas():
+    """Reindexa todas as posições (depois de um novo layout) e redesenha."""
+    apagar_desenho()
+    grade.limpar()
+    for nome in ap.estados:
+        indexar_estado(nome)
+    for k in range(len(ap.transicoes)):
+        indexar_transicao(k)
+    atualizar_regiao()
+    desenhar_visiveis()
 
 def desenhar_estado(nome):
-    """Desenha um estado (bolinha) se ainda não existir."""
+    """Posiciona o estado, se for novo, e o desenha se estiver visível."""
     if nome in objetos_canvas:
         atualizar_decoracoes_estado(nome)
         return
+    layout.adicionar(nome)
+    indexar_estado(nome)
+    atualizar_regiao()
+    desenhar_visiveis()
 
-    # Distribuição simples horizontal
-    total = len(objetos_canvas)
-    x = 150 + (total * 150)
-    y = 150
-
-    posicoes_estados[nome] = (x, y)
+def criar_estado(nome):
+    f = visao_atual["zoom"]
+    x, y = posicoes_estados[nome]
+    x, y, r = x * f, y * f, RAIO * f
 
-    r = 35
+    destacado = nome == animacao["estado"]
     circ = canvas.create_oval(x - r, y - r, x + r, y + r,
-                              fill="#e2e8f0", outline="#475569", width=3)
+                              fill="#fde68a" if destacado else "#e2e8f0",
+                              outline="#475569", width=3)
 
-    txt = canvas.create_text(x, y, text=nome, font=("Segoe UI", 14, "bold"),
+    txt = canvas.create_text(x, y, text=nome, font=("Segoe UI", max(6, round(14 * f)), "bold"),
                              fill="#1e293b")
 
     objetos_canvas[nome] = {"circulo": circ, "texto": txt, "r": r}
@@ -189,6 +225,9 @@ def desenhar_estado(nome):
 
 def atualizar_decoracoes_estado(nome):
     """Desenha círculo duplo e seta de inicial quando necessário."""
+    if nome not in objetos_canvas:
+        return  # fora da área visível: será desenhado ao aparecer
+
     # Remove extras antigos
     extra_id = objetos_canvas[nome].get("extra")
     if extra_id:
@@ -199,45 +238,57 @@ def atualizar_decoracoes_estado(nome):
             canvas.delete(extra_id)
         objetos_canvas[nome]["extra"] = None
 
+    f = visao_atual["zoom"]
     x, y = posicoes_estados[nome]
+    x, y = x * f, y * f
     r = objetos_canvas[nome]["r"]
     extras = []
 
     # Se for inicial, desenha seta de entrada
-    if estados[nome].get("inicial"):
-        line = canvas.create_line(x - r - 30, y, x - r - 5, y,
+    if ap.estados[nome].get("inicial"):
+        line = canvas.create_line(x - r - 30 * f, y, x - r - 5 * f, y,
                                   arrow=tk.LAST, width=2)
         extras.append(line)
 
     # Se for final, desenha círculo duplo
-    if estados[nome].get("final"):
-        inner = canvas.create_oval(x - r + 6, y - r + 6,
-                                   x + r - 6, y + r - 6,
+    if ap.estados[nome].get("final"):
+        inner = canvas.create_oval(x - r + 6 * f, y - r + 6 * f,
+                                   x + r - 6 * f, y + r - 6 * f,
                                    outline="#475569", width=2)
         extras.append(inner)
 
     objetos_canvas[nome]["extra"] = extras
 
 
-def desenhar_transicao(origem, destino, simbolo_label=None):
+def desenhar_transicao(k):
+    """Indexa a transição k de ap.transicoes e a desenha se estiver visível."""
+    t = ap.transicoes[k]
+    # Se o estado ainda não foi posicionado, posiciona agora
+    for nome in (t["origem"], t["destino"]):
+        if nome not in posicoes_estados:
+            desenhar_estado(nome)
+    indexar_transicao(k)
+    desenhar_visiveis()
+
+
+def criar_transicao(k):
     """
     Desenha linha ou laço representando a transição entre dois estados.
     """
+    t = ap.transicoes[k]
+    origem, destino = t["origem"], t["destino"]
+    simbolo_label = f"{t['entrada']}, {t['pilha']}→{t['empilha']}"
 
-    # Se o estado ainda não foi desenhado, desenha agora
-    if origem not in posicoes_estados:
-        desenhar_estado(origem)
-    if destino not in posicoes_estados:
-        desenhar_estado(destino)
-
+    f = visao_atual["zoom"]
     x1, y1 = posicoes_estados[origem]
     x2, y2 = posicoes_estados[destino]
-    r1 = objetos_canvas[origem]["r"]
-    r2 = objetos_canvas[destino]["r"]
+    x1, y1, x2, y2 = x1 * f, y1 * f, x2 * f, y2 * f
+    r1 = r2 = RAIO * f
+    fonte = ("Segoe UI", max(6, round(10 * f)))
 
     # Caso seja laço (self-loop)
     if origem == destino:
-        loop_r = 30
+        loop_r = LACO * f
         loop = canvas.create_oval(x1 - loop_r,
                                   y1 - r1 - 2*loop_r,
                                   x1 + loop_r,
@@ -245,14 +296,12 @@ def desenhar_transicao(origem, destino, simbolo_label=None):
                                   outline="#0f172a", width=2)
         arrow_x = x1 + loop_r
         arrow_y = y1 - r1 - loop_r/2
-        arrow = canvas.create_line(arrow_x - 10, arrow_y + 6,
+        arrow = canvas.create_line(arrow_x - 10 * f, arrow_y + 6 * f,
                                    arrow_x, arrow_y,
                                    arrow=tk.LAST, width=2)
-        if simbolo_label:
-            lbl = canvas.create_text(x1, y1 - r1 - loop_r - 10,
-                                     text=simbolo_label, font=("Segoe UI", 10))
-            return (loop, arrow, lbl)
-        return (loop, arrow)
+        lbl = canvas.create_text(x1, y1 - r1 - loop_r - 10 * f,
+                                 text=simbolo_label, font=fonte)
+        return (loop, arrow, lbl)
 
     # Transição normal (linha entre estados)
     dx = x2 - x1
@@ -271,13 +320,60 @@ def desenhar_transicao(origem, destino, simbolo_label=None):
                               offset_x2, offset_y2,
                               arrow=tk.LAST, width=2, smooth=True)
 
-    if simbolo_label:
-        xm = (offset_x1 + offset_x2) / 2
-        ym = (offset_y1 + offset_y2) / 2
-        lbl = canvas.create_text(xm, ym - 10,
-                                 text=simbolo_label, font=("Segoe UI", 10))
-        return (line, lbl)
-    return (line,)
+    xm = (offset_x1 + offset_x2) / 2
+    ym = (offset_y1 + offset_y2) / 2
+    lbl = canvas.create_text(xm, ym - 10 * f,
+                             text=simbolo_label, font=fonte)
+    return (line, lbl)
+
+
+# ============================================================
+#              ZOOM, ROLAGEM E REORGANIZAÇÃO
+# ============================================================
+
+def aplicar_zoom(evento, fator):
+    antigo = visao_atual["zoom"]
+    novo = min(3.0, max(0.2, antigo * fator))
+    if novo == antigo:
+        return
+    # O ponto do modelo sob o mouse continua sob o mouse
+    mx, my = canvas.canvasx(evento.x) / antigo, canvas.canvasy(evento.y) / antigo
+    visao_atual["zoom"] = novo
+    apagar_desenho()
+    atualizar_regiao()
+    x0, y0, x1, y1 = (float(v) for v in canvas.cget("scrollregion").split())
+    canvas.xview_moveto((mx * novo - evento.x - x0) / (x1 - x0))
+    canvas.yview_moveto((my * novo - evento.y - y0) / (y1 - y0))
+    desenhar_visiveis()
+
+def roda_do_mouse(evento):
+    para_cima = evento.num == 4 or evento.delta > 0
+    if evento.state & 0x0004:  # Ctrl: zoom
+        aplicar_zoom(evento, 1.1 if para_cima else 1 / 1.1)
+    elif evento.state & 0x0001:  # Shift: rolagem horizontal
+        rolar_x("scroll", -1 if para_cima else 1, "units")
+    else:
+        rolar_y("scroll", -1 if para_cima else 1, "units")
+
+def iniciar_arraste(evento):
+    canvas.scan_mark(evento.x, evento.y)
+
+def arrastar(evento):
+    canvas.scan_dragto(evento.x, evento.y, gain=1)
+    desenhar_visiveis()
+
+def reorganizar():
+    """Recalcula o layout em camadas a partir do estado inicial."""
+    layout.calcular(ap.estados, [(t["origem"], t["destino"]) for t in ap.transicoes],
+                    ap.estado_inicial())
+    redesenhar_canvas()
+
+canvas.bind("<MouseWheel>", roda_do_mouse)
+canvas.bind("<Button-4>", roda_do_mouse)
+canvas.bind("<Button-5>", roda_do_mouse)
+canvas.bind("<ButtonPress-2>", iniciar_arraste)
+canvas.bind("<B2-Motion>", arrastar)
+canvas.bind("<Configure>", lambda evento: desenhar_visiveis())
 
 
 # ============================================================
@@ -336,35 +432,32 @@ chk_final.pack(anchor="w")
 
 def update_comboboxes():
     """Atualiza comboboxes com estados existentes."""
-    vals = list(estados.keys())
+    vals = list(ap.estados.keys())
     cb_origem['values'] = vals
     cb_destino['values'] = vals
 
+def rotulo_estado(nome):
+    """Texto de exibição do estado na lista."""
+    label = nome
+    tags = []
+    if ap.estados[nome]["inicial"]: tags.append("I")
+    if ap.estados[nome]["final"]: tags.append("F")
+    if tags:
+        label += " (" + ", ".join(tags) + ")"
+    return label
+
 def adicionar_estado():
     nome = entry_estado.get().strip()
     if nome == "":
         return
 
     # Atualizar se já existir
-    if nome in estados:
-        estados[nome]["inicial"] = var_inicial.get()
-        estados[nome]["final"] = var_final.get()
+    existe = nome in ap.estados
+    ap.adicionar_estado(nome, var_inicial.get(), var_final.get())
+    if existe:
         atualizar_decoracoes_estado(nome)
     else:
-        estados[nome] = {
-            "inicial": var_inicial.get(),
-            "final": var_final.get()
-        }
-
-        # Texto de exibição
-        label = nome
-        tags = []
-        if estados[nome]["inicial"]: tags.append("I")
-        if estados[nome]["final"]: tags.append("F")
-        if tags:
-            label += " (" + ", ".join(tags) + ")"
-
-        estados_listbox.insert(tk.END, label)
+        estados_listbox.insert(tk.END, rotulo_estado(nome))
         desenhar_estado(nome)
 
     update_comboboxes()
@@ -447,19 +540,10 @@ def salvar_transicao():
         return
 
     # Cria dicionário da transição
-    transicao = {
-        "origem": origem,
-        "destino": destino,
-        "entrada": entrada,
-        "pilha": pilha,
-        "empilha": empilha if empilha != "" else "ε"
-    }
-
-    transicoes.append(transicao)
+    transicao = ap.adicionar_transicao(origem, destino, entrada, pilha, empilha)
 
     # Desenhar visualmente
-    simbolo_label = f"{entrada}, {pilha}→{transicao['empilha']}"
-    desenhar_transicao(origem, destino, simbolo_label)
+    desenhar_transicao(len(ap.transicoes) - 1)
 
     print("Transição adicionada:", transicao)
 
@@ -494,8 +578,88 @@ sim_label.pack(anchor="w")
 entry_sim = ttk.Entry(sim_frame, style="Rounded.TEntry")
 entry_sim.pack(fill="x", pady=10)
 
+# Motor de decisão: busca em largura nas configurações ou Earley na gramática
+MOTORES = {"Busca (BFS)": "busca", "Gramática (Earley)": "earley"}
+cb_motor = ttk.Combobox(sim_frame, values=list(MOTORES), state="readonly")
+cb_motor.set("Busca (BFS)")
+cb_motor.pack(fill="x", pady=(0, 10))
+
+# Critério de aceitação; "Todos" avalia os três na mesma busca
+ACEITACOES = {
+    "Estado final + pilha vazia": "final_e_pilha",
+    "Estado final": "estado_final",
+    "Pilha vazia": "pilha_vazia",
+    "Todos os critérios": TODOS,
+}
+cb_aceitacao = ttk.Combobox(sim_frame, values=list(ACEITACOES), state="readonly")
+cb_aceitacao.set("Estado final + pilha vazia")
+cb_aceitacao.pack(fill="x", pady=(0, 10))
+
 from tkinter import messagebox
 
+# Painel da pilha: mostra o conteúdo (topo em cima) em cada passo da animação
+passo_label = tk.Label(sim_frame, text="", font=("Segoe UI", 10),
+                       bg="white", fg="#475569", justify="left", anchor="w")
+passo_label.pack(fill="x")
+
+pilha_canvas = tk.Canvas(sim_frame, width=120, height=220, bg="white",
+                         highlightthickness=0)
+pilha_canvas.pack(pady=(5, 10))
+
+ATRASO_PASSO = 700  # ms entre passos da animação
+animacao = {"id": None, "estado": None}
+
+def desenhar_pilha(pilha):
+    pilha_canvas.delete("all")
+    altura, largura = 24, 80
+    base = int(pilha_canvas["height"]) - 5
+    x = (int(pilha_canvas["width"]) - largura) / 2
+    # Só cabem as células do topo; o resto vira "…"
+    visiveis = pilha[-((base - 20) // altura):] if pilha else ""
+    for k, simbolo in enumerate(visiveis):
+        y = base - k * altura
+        topo = k == len(visiveis) - 1
+        pilha_canvas.create_rectangle(x, y - altura, x + largura, y,
+                                      fill="#bfdbfe" if topo else "#e2e8f0",
+                                      outline="#475569")
+        pilha_canvas.create_text(x + largura / 2, y - altura / 2, text=simbolo,
+                                 font=("Segoe UI", 11, "bold"))
+    if len(visiveis) < len(pilha):
+        pilha_canvas.create_text(x + largura / 2, 10, text="…")
+
+def destacar_estado(nome):
+    anterior = animacao["estado"]
+    if anterior in objetos_canvas:
+        canvas.itemconfig(objetos_canvas[anterior]["circulo"], fill="#e2e8f0")
+    if nome in objetos_canvas:
+        canvas.itemconfig(objetos_canvas[nome]["circulo"], fill="#fde68a")
+    animacao["estado"] = nome
+
+def animar_caminho(cadeia, passos, k=0):
+    """Mostra o passo k do caminho de aceitação e agenda o próximo."""
+    passo = passos[k]
+    destacar_estado(passo["estado"])
+    desenhar_pilha(passo["pilha"])
+
+    t = passo["transicao"]
+    regra = f"{t['entrada']}, {t['pilha']}→{t['empilha']}" if t else "início"
+    lido, resto = cadeia[:passo["lidos"]], cadeia[passo["lidos"]:]
+    passo_label.config(text=f"Passo {k}/{len(passos) - 1}: {passo['estado']}  ({regra})\n"
+                            f"Entrada: {lido}|{resto or 'ε'}")
+
+    if k + 1 < len(passos):
+        animacao["id"] = root.after(ATRASO_PASSO, animar_caminho, cadeia, passos, k + 1)
+    else:
+        animacao["id"] = None
+
+def parar_animacao():
+    if animacao["id"] is not None:
+        root.after_cancel(animacao["id"])
+        animacao["id"] = None
+    destacar_estado(None)
+    passo_label.config(text="")
+    pilha_canvas.delete("all")
+
 def iniciar_simulacao():
     cadeia = entry_sim.get().strip()
 
@@ -503,12 +667,32 @@ def iniciar_simulacao():
         messagebox.showwarning("Aviso", "Digite uma cadeia para simular.")
         return
 
-    resultado = simular_automato(cadeia)
+    parar_animacao()
+    motor = MOTORES[cb_motor.get()]
+    aceitacao = ACEITACOES[cb_aceitacao.get()]
+    if aceitacao == TODOS:
+        resultados = ap.simular(cadeia, motor=motor, aceitacao=TODOS)
+        if isinstance(resultados, str):
+            messagebox.showerror("Erro", resultados)
+            return
+        nomes = {modo: nome for nome, modo in ACEITACOES.items()}
+        linhas = [f"{nomes[modo]}: {veredito}" for modo, veredito in resultados.items()]
+        messagebox.showinfo("Resultado", f"Cadeia '{cadeia}':\n" + "\n".join(linhas))
+        return
+    if motor == "busca":
+        # A busca guarda ponteiros para os pais e devolve o caminho que aceita
+        resultado, passos = ap.rastrear(cadeia, aceitacao=aceitacao)
+    else:
+        resultado, passos = ap.simular(cadeia, motor=motor, aceitacao=aceitacao), []
 
     if resultado == "ACEITA":
+        if passos:
+            animar_caminho(cadeia, passos)
         messagebox.showinfo("Resultado", f"A cadeia '{cadeia}' foi ACEITA.")
     elif resultado.startswith("ERRO"):
         messagebox.showerror("Erro", resultado)
+    elif resultado == INDECIDIDO:
+        messagebox.showwarning("Resultado", f"A cadeia '{cadeia}' ficou indecidida: a busca atingiu o limite de pilha ou de configurações.")
     else:
         messagebox.showwarning("Resultado", f"A cadeia '{cadeia}' foi rejeitada.")
 
@@ -519,6 +703,51 @@ run_button = ttk.Button(sim_frame,
 run_button.pack(fill="x")
 
 
+# ============================================================
+#                  SALVAR / CARREGAR (JSON)
+# ============================================================
+
+def redesenhar_tudo():
+    """Limpa o canvas e desenha de novo estados, transições e listas."""
+    parar_animacao()
+    estados_listbox.delete(0, tk.END)
+    for nome in ap.estados:
+        estados_listbox.insert(tk.END, rotulo_estado(nome))
+    reorganizar()
+    update_comboboxes()
+
+def salvar_json():
+    fname = filedialog.asksaveasfilename(defaultextension=".json",
+                                         filetypes=[("JSON", "*.json")])
+    if fname:
+        salvar(ap, fname)
+
+def carregar_json():
+    global ap
+    fname = filedialog.askopenfilename(filetypes=[("JSON", "*.json")])
+    if not fname:
+        return
+    try:
+        # Aceita o formato comum e o JSON antigo deste simulador
+        novo = carregar(fname)
+        if not isinstance(novo, PDA):
+            raise ValueError("o arquivo não descreve um autômato a pilha")
+        ap = novo
+    except Exception as e:
+        messagebox.showerror("Erro", f"Não foi possível carregar: {e}")
+        return
+    redesenhar_tudo()
+
+file_frame = tk.Frame(sim_frame, bg="white")
+file_frame.pack(fill="x", pady=(10, 0))
+ttk.Button(file_frame, text="Salvar", style="Rounded.TButton",
+           command=salvar_json).pack(side="left", expand=True, fill="x", padx=(0, 5))
+ttk.Button(file_frame, text="Carregar", style="Rounded.TButton",
+           command=carregar_json).pack(side="left", expand=True, fill="x", padx=(0, 5))
+ttk.Button(file_frame, text="Reorganizar", style="Rounded.TButton",
+           command=reorganizar).pack(side="left", expand=True, fill="x")
+
+
 # Inicializa comboboxes
 update_comboboxes()
 
@@ -0,0 +1,213 @@
+"""
+Conversão do autômato a pilha (estados/transições no formato do simulador)
+para uma gramática livre de contexto equivalente, e reconhecimento da
+gramática pelo algoritmo de Earley, que é O(n³) no tamanho da cadeia.
+"""
+
+# Símbolo de fundo e estados auxiliares do AP normalizado. São tuplas para
+# nunca colidirem com os nomes (strings) usados pelo usuário.
+FUNDO = ("fundo",)
+INICIO = ("inicio",)
+DRENO = ("dreno",)
+ESVAZIA = ("esvazia",)
+FIM = ("fim",)
+
+# Critérios de aceitação: estado final com pilha vazia ou só "Z" (o padrão do
+# simulador), só estado final, ou só pilha vazia/"Z" em qualquer estado.
+MODOS_ACEITACAO = ("final_e_pilha", "estado_final", "pilha_vazia")
+
+
+def aceita_configuracao(modo, final, vazia):
+    if modo == "final_e_pilha":
+        return final and vazia
+    if modo == "estado_final":
+        return final
+    return vazia
+
+
+class Gramatica:
+    """Variáveis são tuplas (p, X, q); terminais são strings de um símbolo."""
+
+    def __init__(self, inicial, producoes):
+        self.inicial = inicial
+        self.producoes = producoes
+        self.por_variavel = {}
+        for indice, (variavel, _) in enumerate(producoes):
+            self.por_variavel.setdefault(variavel, []).append(indice)
+        self.nulaveis = self._calcular_nulaveis()
+
+    def _calcular_nulaveis(self):
+        nulaveis = set()
+        mudou = True
+        while mudou:
+            mudou = False
+            for variavel, corpo in self.producoes:
+                if variavel not in nulaveis and all(s in nulaveis for s in corpo):
+                    nulaveis.add(variavel)
+                    mudou = True
+        return nulaveis
+
+
+def _normalizar(estados, transicoes, aceitacao="final_e_pilha"):
+    """
+    Gera um AP equivalente em que toda regra desempilha exatamente um símbolo
+    e empilha no máximo dois, e que aceita por pilha vazia no estado FIM.
+    Regras: (origem, lido ou None, desempilha, [empilha...], destino), com o
+    topo no fim da lista, como nas strings de pilha do simulador.
+    """
+    inicial = next(e for e, info in estados.items() if info.get("inicial"))
+
+    alfabeto_pilha = {FUNDO, "Z"}
+    for t in transicoes:
+        if t["pilha"] != "ε":
+            alfabeto_pilha.add(t["pilha"])
+        if t["empilha"] != "ε":
+            alfabeto_pilha.update(t["empilha"])
+
+    regras = [(INICIO, None, FUNDO, [FUNDO, "Z"], ("q", inicial))]
+
+    for numero, t in enumerate(transicoes):
+        # Regras que nunca disparam no simulador (lê ou desempilha mais de um símbolo)
+        if len(t["entrada"]) != 1 or len(t["pilha"]) != 1:
+            continue
+        lido = None if t["entrada"] == "ε" else t["entrada"]
+        empilha = [] if t["empilha"] == "ε" else list(t["empilha"])
+        origem, destino = ("q", t["origem"]), ("q", t["destino"])
+
+        if t["pilha"] == "ε":
+            alternativas = [(topo, [topo] + empilha) for topo in alfabeto_pilha]
+        else:
+            alternativas = [(t["pilha"], empilha)]
+
+        for variante, (topo, nova) in enumerate(alternativas):
+            if len(nova) <= 2:
+                regras.append((origem, lido, topo, nova, destino))
+                continue
+            # Empilhamentos longos viram uma cadeia de passos ε de dois símbolos
+            atual = ("meio", numero, variante, 1)
+            regras.append((origem, lido, topo, nova[:2], atual))
+            for k in range(1, len(nova) - 1):
+                proximo = destino if k == len(nova) - 2 else ("meio", numero, variante, k + 1)
+                regras.append((atual, None, nova[k], [nova[k], nova[k + 1]], proximo))
+                atual = proximo
+
+    # Aceitação: dos estados que aceitam, esvazia a pilha até FUNDO e vai para
+    # FIM. DRENO só tira o "Z" do fundo; ESVAZIA tira qualquer coisa.
+    for nome, info in estados.items():
+        if aceitacao == "estado_final":
+            if info.get("final"):
+                for topo in alfabeto_pilha - {FUNDO}:
+                    regras.append((("q", nome), None, topo, [], ESVAZIA))
+                regras.append((("q", nome), None, FUNDO, [], FIM))
+        elif info.get("final") or aceitacao == "pilha_vazia":
+            regras.append((("q", nome), None, "Z", [], DRENO))
+            regras.append((("q", nome), None, FUNDO, [], FIM))
+    regras.append((DRENO, None, FUNDO, [], FIM))
+    for topo in alfabeto_pilha - {FUNDO}:
+        regras.append((ESVAZIA, None, topo, [], ESVAZIA))
+    regras.append((ESVAZIA, None, FUNDO, [], FIM))
+    return regras
+
+
+def ap_para_gramatica(estados, transicoes, aceitacao="final_e_pilha"):
+    """
+    Construção das triplas: a variável (p, X, q) gera as cadeias que levam o
+    AP de p a q desempilhando X. Só variáveis alcançáveis a partir da inicial
+    são geradas, e as que não geram nenhuma cadeia terminal são removidas.
+    """
+    regras = _normalizar(estados, transicoes, aceitacao)
+
+    por_origem = {}
+    estados_norm = set()
+    for origem, lido, topo, empilha, destino in regras:
+        por_origem.setdefault((origem, topo), []).append((lido, empilha, destino))
+        estados_norm.update((origem, destino))
+
+    inicial = (INICIO, FUNDO, FIM)
+    producoes = []
+    vistas = {inicial}
+    pendentes = [inicial]
+
+    while pendentes:
+        variavel = pendentes.pop()
+        p, topo, q = variavel
+        for lido, empilha, r in por_origem.get((p, topo), ()):
+            prefixo = (lido,) if lido is not None else ()
+            if not empilha:
+                corpos = [prefixo] if r == q else []
+            elif len(empilha) == 1:
+                corpos = [prefixo + ((r, empilha[0], q),)]
+            else:
+                corpos = [prefixo + ((r, empilha[1], s), (s, empilha[0], q)) for s in estados_norm]
+
+            for corpo in corpos:
+                producoes.append((variavel, corpo))
+                for simbolo in corpo:
+                    if isinstance(simbolo, tuple) and simbolo not in vistas:
+                        vistas.add(simbolo)
+                        pendentes.append(simbolo)
+
+    geradoras = set()
+    mudou = True
+    while mudou:
+        mudou = False
+        for variavel, corpo in producoes:
+            if variavel not in geradoras and all(not isinstance(s, tuple) or s in geradoras for s in corpo):
+                geradoras.add(variavel)
+                mudou = True
+
+    producoes = [
+        (variavel, corpo) for variavel, corpo in producoes
+        if variavel in geradoras and all(not isinstance(s, tuple) or s in geradoras for s in corpo)
+    ]
+    return Gramatica(inicial, producoes)
+
+
+def reconhece_earley(gramatica, cadeia):
+    """Reconhecedor de Earley com o tratamento de nuláveis de Aycock–Horspool."""
+    producoes = gramatica.producoes
+    por_variavel = gramatica.por_variavel
+    nulaveis = gramatica.nulaveis
+    n = len(cadeia)
+
+    conjuntos = [set() for _ in range(n + 1)]
+    esperando = [{} for _ in range(n + 1)]
+    for indice in por_variavel.get(gramatica.inicial, ()):
+        conjuntos[0].add((indice, 0, 0))
+
+    for k in range(n + 1):
+        conjunto = conjuntos[k]
+        agenda = list(conjunto)
+
+        def adicionar(item):
+            if item not in conjunto:
+                conjunto.add(item)
+                agenda.append(item)
+
+        while agenda:
+            item = agenda.pop()
+            indice, ponto, origem = item
+            variavel, corpo = producoes[indice]
+
+            if ponto == len(corpo):
+                # Completar
+                for pai, ponto_pai, origem_pai in list(esperando[origem].get(variavel, ())):
+                    adicionar((pai, ponto_pai + 1, origem_pai))
+                continue
+
+            simbolo = corpo[ponto]
+            if isinstance(simbolo, tuple):
+                # Predizer
+                esperando[k].setdefault(simbolo, []).append(item)
+                for filho in por_variavel.get(simbolo, ()):
+                    adicionar((filho, 0, k))
+                if simbolo in nulaveis:
+                    adicionar((indice, ponto + 1, origem))
+            elif k < n and cadeia[k] == simbolo:
+                # Ler
+                conjuntos[k + 1].add((indice, ponto + 1, origem))
+
+    return any(
+        origem == 0 and ponto == len(producoes[indice][1]) and producoes[indice][0] == gramatica.inicial
+        for indice, ponto, origem in conjuntos[n]
+    )
@@ -0,0 +1,608 @@
+"""
+Núcleo do autômato a pilha, sem interface gráfica: pode ser importado,
+testado e executado em outros processos sem Tk nem display.
+"""
+from array import array
+from collections import deque
+
+from gramatica import MODOS_ACEITACAO, aceita_configuracao, ap_para_gramatica, reconhece_earley
+
+# Limites da busca: sem eles, uma transição ε que empilha (ex.: ε, ε→X num
+# laço) gera configurações novas para sempre.
+LIMITE_CONFIGURACOES = 200_000
+
+ACEITA = "ACEITA"
+REJEITA = "REJEITA"
+INDECIDIDO = "INDECIDIDO: limite atingido"
+
+# aceitacao=TODOS avalia todos os MODOS_ACEITACAO numa única busca
+TODOS = "todos"
+
+
+class Celula:
+    """Célula imutável da pilha: símbolo do topo + resto da pilha."""
+    __slots__ = ("topo", "resto", "altura")
+
+    def __init__(self, topo, resto):
+        self.topo = topo
+        self.resto = resto
+        self.altura = 1 + (resto.altura if resto is not None else 0)
+
+
+class Pilhas:
+    """
+    Fábrica de pilhas persistentes (pilha vazia = None). Cada par
+    (topo, resto) gera uma única célula, então pilhas iguais são o mesmo
+    objeto: configurações irmãs compartilham o sufixo comum, empilhar e
+    desempilhar são O(1) e hash/igualdade usam só a identidade.
+    """
+
+    def __init__(self):
+        self._celulas = {}
+
+    def empilhar(self, pilha, simbolos):
+        for simbolo in simbolos:
+            chave = (simbolo, pilha)
+            celula = self._celulas.get(chave)
+            if celula is None:
+                celula = Celula(simbolo, pilha)
+                self._celulas[chave] = celula
+            pilha = celula
+        return pilha
+
+    @staticmethod
+    def para_texto(pilha):
+        simbolos = []
+        while pilha is not None:
+            simbolos.append(pilha.topo)
+            pilha = pilha.resto
+        return "".join(reversed(simbolos))
+
+
+class PDA:
+    """
+    Autômato a pilha. estados: {"q0": {"inicial": True, "final": False}};
+    transicoes: [{"origem", "destino", "entrada", "pilha", "empilha"}], com
+    "ε" para não ler / não desempilhar / não empilhar. A pilha começa com "Z".
+    """
+
+    def __init__(self):
+        self.estados = {}
+        self.transicoes = []
+        self._indice = None
+        self._gramatica = {}
+        self._deterministico = None
+        self._resumos = None
+
+    # -------------------------
+    # Edição
+    # -------------------------
+    def adicionar_estado(self, nome, inicial=False, final=False):
+        self.estados[nome] = {"inicial": inicial, "final": final}
+        self._gramatica = {}
+        self._deterministico = None
+        self._resumos = None
+
+    def adicionar_transicao(self, origem, destino, entrada, pilha, empilha="ε"):
+        transicao = {
+            "origem": origem,
+            "destino": destino,
+            "entrada": entrada,
+            "pilha": pilha,
+            "empilha": empilha if empilha != "" else "ε",
+        }
+        self.transicoes.append(transicao)
+        self._indice = None
+        self._gramatica = {}
+        self._deterministico = None
+        self._resumos = None
+        return transicao
+
+    def estado_inicial(self):
+        return next((e for e, info in self.estados.items() if info.get("inicial")), None)
+
+    # -------------------------
+    # Simulação
+    # -------------------------
+    def indice(self):
+        """
+        Agrupa as transições por (origem, entrada, topo). Regras que não leem
+        ou não desempilham ficam no balde "ε" da respectiva posição. Cada regra
+        guarda também o número da transição em self.transicoes.
+        """
+        if self._indice is None:
+            indice = {}
+            for numero, t in enumerate(self.transicoes):
+                chave = (t["origem"], t["entrada"], t["pilha"])
+                empilha = t["empilha"] if t["empilha"] != "ε" else ""
+                regra = (t["destino"], t["entrada"] != "ε", t["pilha"] != "ε", empilha, numero)
+                indice.setdefault(chave, []).append(regra)
+            self._indice = indice
+        return self._indice
+
+    def gramatica(self, aceitacao="final_e_pilha"):
+        if aceitacao not in self._gramatica:
+            self._gramatica[aceitacao] = ap_para_gramatica(self.estados, self.transicoes, aceitacao)
+        return self._gramatica[aceitacao]
+
+    def deterministico(self):
+        """
+        True se em nenhuma configuração duas regras diferentes podem disparar:
+        para o mesmo estado, leituras compatíveis (iguais ou alguma ε) e topos
+        compatíveis (iguais ou algum ε).
+        """
+        if self._deterministico is None:
+            por_origem = {}
+            for (origem, ler, topo), regras in self.indice().items():
+                if len(ler) != 1 or len(topo) != 1:
+                    continue
+                for destino, _, _, empilha, _ in regras:
+                    por_origem.setdefault(origem, set()).add((ler, topo, destino, empilha))
+
+            def compativeis(x, y):
+                return x == y or x == "ε" or y == "ε"
+
+            self._deterministico = not any(
+                compativeis(r1[0], r2[0]) and compativeis(r1[1], r2[1])
+                for regras in por_origem.values()
+                for i, r1 in enumerate(sorted(regras))
+                for r2 in sorted(regras)[i + 1:]
+            )
+        return self._deterministico
+
+    def limite_pilha_padrao(self, entrada):
+        """
+        Altura máxima de pilha considerada na busca. Heurística: cada símbolo lido
+        (e o início) pode ser seguido por uma sequência de movimentos ε que passa
+        no máximo uma vez por estado, cada um crescendo a pilha no máximo o maior
+        crescimento de uma regra.
+        """
+        crescimento = 1
+        for regras in self.indice().values():
+            for _, _, retira, empilha, _ in regras:
+                crescimento = max(crescimento, len(empilha) - (1 if retira else 0))
+        return 1 + (len(entrada) + 1) * crescimento * max(1, len(self.estados))
+
+    def resumos_epsilon(self):
+        """
+        Resumos dos movimentos ε por (estado p, topo X), calculados uma vez por
+        ponto fixo. Partindo de p com X no topo e só com movimentos ε que não
+        descem abaixo de X:
+          neutros[p, X]  = pares (q, Y) alcançáveis com Y no lugar de X;
+          retornos[p, X] = estados q alcançáveis com X já desempilhado.
+        crescem[q, Y] lista as regras ε que aumentam a pilha, como
+        (destino, segmento que substitui Y).
+        """
+        if self._resumos is None:
+            indice = self.indice()
+            gama = {"Z"}
+            for t in self.transicoes:
+                if len(t["pilha"]) == 1 and t["pilha"] != "ε":
+                    gama.add(t["pilha"])
+                if t["empilha"] != "ε":
+                    gama.update(t["empilha"])
+
+            # Toda regra ε troca o topo Y por um segmento (vazio se desempilha sem empilhar)
+            regras_epsilon = {}
+            for q in self.estados:
+                for Y in gama:
+                    regras_epsilon[(q, Y)] = (
+                        [(r, empilha) for r, _, _, empilha, _ in indice.get((q, "ε", Y), ())]
+                        + [(r, Y + empilha) for r, _, _, empilha, _ in indice.get((q, "ε", "ε"), ())]
+                    )
+
+            neutros = {chave: {chave} for chave in regras_epsilon}
+            retornos = {chave: set() for chave in regras_epsilon}
+
+            def desempilhar(estados_atuais, simbolo):
+                alcancados = set()
+                for s in estados_atuais:
+                    alcancados |= retornos.get((s, simbolo), set())
+                return alcancados
+
+            mudou = True
+            while mudou:
+                mudou = False
+                for chave, alcance in neutros.items():
+                    volta = retornos[chave]
+                    for par in list(alcance):
+                        for r, segmento in regras_epsilon.get(par, ()):
+                            # Segmento novo: desempilha do topo até sobrar só o de baixo
+                            atuais = {r}
+                            for simbolo in reversed(segmento[1:]):
+                                atuais = desempilhar(atuais, simbolo)
+                            if segmento:
+                                novos = {(s, segmento[0]) for s in atuais}
+                                if not novos <= alcance:
+                                    alcance |= novos
+                                    mudou = True
+                                atuais = desempilhar(atuais, segmento[0])
+                            if not atuais <= volta:
+                                volta |= atuais
+                                mudou = True
+
+            crescem = {par: [(r, segmento) for r, segmento in regras if len(segmento) >= 2]
+                       for par, regras in regras_epsilon.items()}
+            self._resumos = (neutros, retornos, crescem)
+        return self._resumos
+
+    def _modos(self, aceitacao):
+        if aceitacao == TODOS:
+            return MODOS_ACEITACAO
+        if aceitacao not in MODOS_ACEITACAO:
+            raise ValueError(f"Critério de aceitação desconhecido: {aceitacao}")
+        return (aceitacao,)
+
+    def simular(self, entrada, limite_pilha=None, limite_configuracoes=LIMITE_CONFIGURACOES,
+                motor="busca", aceitacao="final_e_pilha"):
+        """
+        Veredito para a cadeia no critério de aceitação escolhido. Com
+        aceitacao=TODOS, todos os critérios saem da mesma busca e o retorno
+        é um dicionário {critério: veredito}.
+        """
+        modos = self._modos(aceitacao)
+        inicial = self.estado_inicial()
+        if inicial is None:
+            return "ERRO: nenhum estado inicial definido."
+
+        # Motor alternativo: gramática equivalente + Earley, O(n³) e sem limites
+        if motor == "earley":
+            resultados = {modo: ACEITA if reconhece_earley(self.gramatica(modo), entrada) else REJEITA
+                          for modo in modos}
+        else:
+            if limite_pilha is None:
+                limite_pilha = self.limite_pilha_padrao(entrada)
+            executar = self._simular_deterministico if self.deterministico() else self._buscar
+            resultados, _ = executar(inicial, entrada, limite_pilha, limite_configuracoes, modos)
+        return resultados if aceitacao == TODOS else resultados[aceitacao]
+
+    def rastrear(self, entrada, limite_pilha=None, limite_configuracoes=LIMITE_CONFIGURACOES,
+                 aceitacao="final_e_pilha"):
+        """
+        Como simular, mas devolve (resultado, passos) com o caminho que aceita
+        a cadeia (vazio se não aceita). Cada passo é um dicionário com o estado,
+        quantos símbolos já foram lidos, a pilha (topo no fim) e a transição
+        usada para chegar nele (None no primeiro).
+        """
+        modos = self._modos(aceitacao)
+        if len(modos) != 1:
+            raise ValueError("rastrear aceita um único critério de aceitação")
+        inicial = self.estado_inicial()
+        if inicial is None:
+            return "ERRO: nenhum estado inicial definido.", []
+
+        if limite_pilha is None:
+            limite_pilha = self.limite_pilha_padrao(entrada)
+        executar = self._simular_deterministico if self.deterministico() else self._buscar
+        resultados, caminhos = executar(inicial, entrada, limite_pilha, limite_configuracoes, modos, rastrear=True)
+        resultado = resultados[aceitacao]
+        return resultado, (self.reproduzir(inicial, caminhos[aceitacao]) if resultado == ACEITA else [])
+
+    def reproduzir(self, inicial, numeros):
+        """Refaz a sequência de transições (por número) a partir do estado inicial."""
+        estado, lidos, pilha = inicial, 0, "Z"
+        passos = [{"estado": estado, "lidos": lidos, "pilha": pilha, "transicao": None}]
+        for numero in numeros:
+            t = self.transicoes[numero]
+            if t["pilha"] != "ε":
+                pilha = pilha[:-1]
+            if t["empilha"] != "ε":
+                pilha += t["empilha"]
+            if t["entrada"] != "ε":
+                lidos += 1
+            estado = t["destino"]
+            passos.append({"estado": estado, "lidos": lidos, "pilha": pilha, "transicao": t})
+        return passos
+
+    def simular_lote(self, entradas, limite_pilha=None, limite_configuracoes=LIMITE_CONFIGURACOES,
+                     aceitacao="final_e_pilha"):
+        """
+        Vereditos, na ordem de entradas, para muitas cadeias de uma vez. As
+        cadeias são percorridas numa trie: prefixos comuns compartilham a mesma
+        fronteira de configurações, e o fecho ε de cada fronteira usa
+        resumos_epsilon(), calculados uma vez por AP.
+
+        limite_pilha vale para o lote todo (por padrão, o da maior cadeia) e
+        limite_configuracoes para a soma das fronteiras ao longo de cada cadeia.
+        Os limites não cortam nos mesmos pontos que em simular(), que para na
+        primeira aceitação, então uma cadeia pode ficar INDECIDIDO só num dos
+        dois; quando os dois decidem, o veredito é o mesmo.
+        """
+        modos = self._modos(aceitacao)
+        entradas = list(entradas)
+        inicial = self.estado_inicial()
+        if inicial is None:
+            return ["ERRO: nenhum estado inicial definido."] * len(entradas)
+        if limite_pilha is None:
+            limite_pilha = max((self.limite_pilha_padrao(e) for e in entradas), default=1)
+
+        estados = self.estados
+        indice = self.indice()
+        neutros, retornos, crescem = self.resumos_epsilon()
+        pilhas = Pilhas()
+        pilha_z = pilhas.empilhar(None, "Z")
+
+        # Trie: nó = [filhos por símbolo, índices das entradas que terminam nele]
+        raiz = [{}, []]
+        for indice_entrada, entrada in enumerate(entradas):
+            no = raiz
+            for simbolo in entrada:
+                no = no[0].setdefault(simbolo, [{}, []])
+            no[1].append(indice_entrada)
+
+        resultados = [None] * len(entradas)
+
+        def marcar(no, veredito):
+            pendentes = [no]
+            while pendentes:
+                filhos, terminam = pendentes.pop()
+                for k in terminam:
+                    resultados[k] = dict.fromkeys(modos, veredito)
+                pendentes.extend(filhos.values())
+
+        def empilhar(destino, base, segmento, proximas):
+            # Devolve True se a altura passou do limite (configuração podada)
+            nova = pilhas.empilhar(base, segmento)
+            if nova is not None and nova.altura > limite_pilha:
+                return True
+            proximas.append((destino, nova))
+            return False
+
+        def fechar(configuracoes, orcamento):
+            # Devolve (fronteira, podou), ou (None, True) se passou do orçamento
+            fechadas = set()
+            pendentes = list(configuracoes)
+            podou = False
+            while pendentes:
+                configuracao = pendentes.pop()
+                if configuracao in fechadas:
+                    continue
+                if len(fechadas) >= orcamento:
+                    return None, True
+                fechadas.add(configuracao)
+                estado, pilha = configuracao
+
+                if pilha is None:
+                    # Pilha vazia: só regras que não desempilham, um passo por vez
+                    for prox, _, _, empilha, _ in indice.get((estado, "ε", "ε"), ()):
+                        podou |= empilhar(prox, None, empilha, pendentes)
+                    continue
+
+                topo, abaixo = pilha.topo, pilha.resto
+                for q, Y in neutros.get((estado, topo), ((estado, topo),)):
+                    pendentes.append((q, pilhas.empilhar(abaixo, Y)))
+                    for r, segmento in crescem.get((q, Y), ()):
+                        podou |= empilhar(r, abaixo, segmento, pendentes)
+                for r in retornos.get((estado, topo), ()):
+                    pendentes.append((r, abaixo))
+            return fechadas, podou
+
+        def ler(fronteira, simbolo):
+            proximas = []
+            podou = False
+            for estado, pilha in fronteira:
+                topo = pilha.topo if pilha is not None else "ε"
+                for desempilha in ((topo, "ε") if topo != "ε" else ("ε",)):
+                    for prox, _, retira, empilha, _ in indice.get((estado, simbolo, desempilha), ()):
+                        podou |= empilhar(prox, pilha.resto if retira else pilha, empilha, proximas)
+            return proximas, podou
+
+        # DFS na trie; cada item leva a fronteira já fechada do nó
+        fronteira, podou = fechar([(inicial, pilha_z)], limite_configuracoes)
+        if fronteira is None:
+            marcar(raiz, INDECIDIDO)
+            pilha_dfs = []
+        else:
+            pilha_dfs = [(raiz, fronteira, len(fronteira), podou)]
+        while pilha_dfs:
+            no, fronteira, custo, podou = pilha_dfs.pop()
+            filhos, terminam = no
+
+            if terminam:
+                configuracoes = [(bool(estados[estado].get("final")), pilha is pilha_z or pilha is None)
+                                 for estado, pilha in fronteira]
+                for k in terminam:
+                    resultados[k] = {
+                        modo: ACEITA if any(aceita_configuracao(modo, final, vazia) for final, vazia in configuracoes)
+                        else (INDECIDIDO if podou else REJEITA)
+                        for modo in modos
+                    }
+
+            for simbolo, filho in filhos.items():
+                proximas, podou_leitura = ler(fronteira, simbolo)
+                proxima_fronteira, podou_fecho = fechar(proximas, limite_configuracoes - custo)
+                podou_filho = podou or podou_leitura or podou_fecho
+                if proxima_fronteira is None:
+                    marcar(filho, INDECIDIDO)
+                elif not proxima_fronteira:
+                    marcar(filho, INDECIDIDO if podou_filho else REJEITA)
+                else:
+                    pilha_dfs.append((filho, proxima_fronteira, custo + len(proxima_fronteira), podou_filho))
+
+        if aceitacao == TODOS:
+            return resultados
+        return [resultado[aceitacao] for resultado in resultados]
+
+    # Os dois motores abaixo avaliam vários critérios numa só execução e
+    # devolvem (resultados, caminhos): {critério: veredito} e, ao rastrear,
+    # {critério: números das transições do caminho que aceita}.
+
+    def _buscar(self, inicial, entrada, limite_pilha, limite_configuracoes, modos=("final_e_pilha",), rastrear=False):
+        estados = self.estados
+        indice = self.indice()
+        pilhas = Pilhas()
+        pilha_z = pilhas.empilhar(None, "Z")
+        pendentes = list(modos)
+        resultados = {}
+        caminhos = {}
+
+        # Fila da BFS guarda ids em configuracoes: (estado, índice da cadeia, pilha).
+        # Cada configuração entra uma única vez em visitados, que limita a memória
+        # da busca. Para rastrear, pais e regras guardam, por id, a configuração
+        # anterior e o número da transição usada: dois inteiros por configuração.
+        inicio = (inicial, 0, pilha_z)
+        configuracoes = [inicio]
+        visitados = {inicio}
+        pais = array("l", [-1]) if rastrear else None
+        regras = array("l", [-1]) if rastrear else None
+        fila = deque([0])
+        podou = False
+
+        while fila:
+            atual = fila.popleft()
+            estado, i, pilha = configuracoes[atual]
+
+            # Aceitação no fim da cadeia; a busca continua enquanto algum
+            # critério ainda não aceitou
+            if i == len(entrada):
+                final = bool(estados[estado].get("final"))
+                vazia = pilha is pilha_z or pilha is None
+                aceitos = [modo for modo in pendentes if aceita_configuracao(modo, final, vazia)]
+                for modo in aceitos:
+                    pendentes.remove(modo)
+                    resultados[modo] = ACEITA
+                    if rastrear:
+                        numeros = []
+                        k = atual
+                        while pais[k] >= 0:
+                            numeros.append(regras[k])
+                            k = pais[k]
+                        caminhos[modo] = numeros[::-1]
+                if not pendentes:
+                    return resultados, caminhos
+
+            # Só os baldes que podem disparar: símbolo atual ou ε, topo atual ou ε
+            simbolo = entrada[i] if i < len(entrada) else "ε"
+            topo = pilha.topo if pilha is not None else "ε"
+            leituras = (simbolo, "ε") if simbolo != "ε" else ("ε",)
+            topos = (topo, "ε") if topo != "ε" else ("ε",)
+
+            for ler in leituras:
+                for desempilha in topos:
+                    for prox, consome, retira, empilha, numero in indice.get((estado, ler, desempilha), ()):
+                        prox_i = i + 1 if consome else i
+                        nova_pilha = pilhas.empilhar(pilha.resto if retira else pilha, empilha)
+
+                        if nova_pilha is not None and nova_pilha.altura > limite_pilha:
+                            podou = True
+                            continue
+
+                        configuracao = (prox, prox_i, nova_pilha)
+                        if configuracao in visitados:
+                            continue
+                        if len(visitados) >= limite_configuracoes:
+                            resultados.update((modo, INDECIDIDO) for modo in pendentes)
+                            return resultados, caminhos
+                        visitados.add(configuracao)
+                        if rastrear:
+                            pais.append(atual)
+                            regras.append(numero)
+                        fila.append(len(configuracoes))
+                        configuracoes.append(configuracao)
+
+        # Sem aceitação, mas parte da busca foi cortada pela altura da pilha
+        resultados.update((modo, INDECIDIDO if podou else REJEITA) for modo in pendentes)
+        return resultados, caminhos
+
+    def _simular_deterministico(self, inicial, entrada, limite_pilha, limite_configuracoes, modos=("final_e_pilha",), rastrear=False):
+        """
+        Caminho rápido para AP determinístico: uma única configuração, pilha
+        em lista mutável (topo no fim) e memória O(n). Dá o mesmo veredito da
+        busca em largura, inclusive nos limites.
+        """
+        estados = self.estados
+        indice = self.indice()
+        n = len(entrada)
+        estado, i = inicial, 0
+        pilha = ["Z"]
+        pendentes = list(modos)
+        resultados = {}
+        caminhos = {}
+        numeros = array("l")
+
+        # Laço ε: numa sequência de movimentos ε, se o par (estado, topo) se
+        # repete sem que nenhuma configuração intermediária tenha ficado abaixo
+        # da altura em que ele apareceu, o AP nunca consultou o que está por
+        # baixo e vai repetir o mesmo trecho para sempre. vistos guarda a
+        # altura de cada par; por_altura permite invalidar quando a pilha desce.
+        vistos = {}
+        por_altura = {}
+        resultado = INDECIDIDO
+
+        for _ in range(limite_configuracoes):
+            if i == n:
+                final = bool(estados[estado].get("final"))
+                vazia = pilha == ["Z"] or not pilha
+                for modo in [modo for modo in pendentes if aceita_configuracao(modo, final, vazia)]:
+                    pendentes.remove(modo)
+                    resultados[modo] = ACEITA
+                    if rastrear:
+                        caminhos[modo] = list(numeros)
+                if not pendentes:
+                    return resultados, caminhos
+
+            simbolo = entrada[i] if i < n else "ε"
+            topo = pilha[-1] if pilha else "ε"
+            regra = None
+            for ler in ((simbolo, "ε") if simbolo != "ε" else ("ε",)):
+                for desempilha in ((topo, "ε") if topo != "ε" else ("ε",)):
+                    regras = indice.get((estado, ler, desempilha))
+                    if regras:
+                        regra = regras[0]
+                        break
+                if regra is not None:
+                    break
+            if regra is None:
+                resultado = REJEITA
+                break
+
+            prox, consome, retira, empilha, numero = regra
+            if consome:
+                i += 1
+                vistos.clear()
+                por_altura.clear()
+            else:
+                chave = (estado, topo)
+                altura = vistos.get(chave)
+                if altura is not None:
+                    # Laço sem crescer = configuração repetida; crescendo, a busca
+                    # em largura esbarraria no limite da pilha.
+                    resultado = REJEITA if altura == len(pilha) else INDECIDIDO
+                    break
+                vistos[chave] = len(pilha)
+                por_altura.setdefault(len(pilha), []).append(chave)
+
+            if rastrear:
+                numeros.append(numero)
+            altura = len(pilha)
+            if retira:
+                pilha.pop()
+            pilha.extend(empilha)
+            estado = prox
+            if len(pilha) < altura:
+                for chave in por_altura.pop(altura, ()):
+                    del vistos[chave]
+
+            if len(pilha) > limite_pilha:
+                break
+
+        resultados.update((modo, resultado) for modo in pendentes)
+        return resultados, caminhos
+
+    # -------------------------
+    # Persistência
+    # -------------------------
+    def to_json(self):
+        return {
+            "estados": {nome: dict(info) for nome, info in self.estados.items()},
+            "transicoes": [dict(t) for t in self.transicoes],
+        }
+
+    @staticmethod
+    def from_json(d):
+        ap = PDA()
+        for nome, info in d["estados"].items():
+            ap.adicionar_estado(nome, bool(info.get("inicial")), bool(info.get("final")))
+        for t in d["transicoes"]:
+            ap.adicionar_transicao(t["origem"], t["destino"], t["entrada"], t["pilha"], t["empilha"])
+        return ap
@@ -0,0 +1,186 @@
+import os
+import subprocess
+import sys
+import unittest
+from itertools import product
+try:
+    from pda import PDA, ACEITA, REJEITA, INDECIDIDO, TODOS
+except ImportError:
+    raise ImportError("se esse erro aparecer, eh pq nao ta na mesma pasta, verificar isso")
+
+
+def ap_anbn():
+    # L = { aⁿbⁿ | n >= 0 }
+    ap = PDA()
+    ap.adicionar_estado("q0", inicial=True)
+    ap.adicionar_estado("q1")
+    ap.adicionar_estado("q2", final=True)
+    ap.adicionar_transicao("q0", "q0", "a", "ε", "A")
+    ap.adicionar_transicao("q0", "q1", "ε", "ε", "ε")
+    ap.adicionar_transicao("q1", "q1", "b", "A", "ε")
+    ap.adicionar_transicao("q1", "q2", "ε", "Z", "Z")
+    return ap
+
+
+def ap_anbn_deterministico():
+    # Mesma linguagem de ap_anbn, sem escolhas
+    ap = PDA()
+    ap.adicionar_estado("q0", inicial=True, final=True)
+    ap.adicionar_estado("q1")
+    ap.adicionar_estado("q2", final=True)
+    ap.adicionar_transicao("q0", "q0", "a", "ε", "A")
+    ap.adicionar_transicao("q0", "q1", "b", "A", "ε")
+    ap.adicionar_transicao("q1", "q1", "b", "A", "ε")
+    ap.adicionar_transicao("q1", "q2", "ε", "Z", "Z")
+    return ap
+
+
+def ap_palindromo_par():
+    # L = { w wᴿ | w em {a,b}* }, não determinístico
+    ap = PDA()
+    ap.adicionar_estado("q0", inicial=True)
+    ap.adicionar_estado("q1")
+    ap.adicionar_estado("q2", final=True)
+    for s in "ab":
+        ap.adicionar_transicao("q0", "q0", s, "ε", s.upper())
+        ap.adicionar_transicao("q1", "q1", s, s.upper(), "ε")
+    ap.adicionar_transicao("q0", "q1", "ε", "ε", "ε")
+    ap.adicionar_transicao("q1", "q2", "ε", "Z", "ε")
+    return ap
+
+
+class TestPDA(unittest.TestCase):
+
+    def test_anbn(self):
+        ap = ap_anbn()
+        for cadeia in ["", "ab", "aabb", "aaabbb"]:
+            with self.subTest(cadeia=cadeia):
+                self.assertEqual(ap.simular(cadeia), ACEITA)
+        for cadeia in ["a", "b", "aab", "abb", "ba", "abab"]:
+            with self.subTest(cadeia=cadeia):
+                self.assertEqual(ap.simular(cadeia), REJEITA)
+
+    def test_palindromo_par(self):
+        ap = ap_palindromo_par()
+        for cadeia in ["", "aa", "abba", "baab", "abaaba"]:
+            with self.subTest(cadeia=cadeia):
+                self.assertEqual(ap.simular(cadeia), ACEITA)
+        for cadeia in ["a", "ab", "aba", "abab"]:
+            with self.subTest(cadeia=cadeia):
+                self.assertEqual(ap.simular(cadeia), REJEITA)
+
+    def test_sem_estado_inicial(self):
+        ap = PDA()
+        ap.adicionar_estado("q0", final=True)
+        self.assertTrue(ap.simular("").startswith("ERRO"))
+
+    def test_laco_epsilon_que_empilha_termina(self):
+        ap = PDA()
+        ap.adicionar_estado("q0", inicial=True)
+        ap.adicionar_estado("q1", final=True)
+        ap.adicionar_transicao("q0", "q0", "ε", "ε", "X")
+        ap.adicionar_transicao("q0", "q1", "b", "ε", "ε")
+        self.assertEqual(ap.simular("a"), INDECIDIDO)
+        self.assertEqual(ap.simular("b"), ACEITA)
+        self.assertEqual(ap.simular("bb", limite_configuracoes=100), INDECIDIDO)
+
+    def test_earley_igual_busca(self):
+        for ap in (ap_anbn(), ap_palindromo_par()):
+            for cadeia in ["", "a", "ab", "aa", "abba", "aabb", "abab", "baab", "aaabbb"]:
+                with self.subTest(cadeia=cadeia):
+                    self.assertEqual(ap.simular(cadeia, motor="earley"), ap.simular(cadeia))
+
+    def test_deterministico_igual_busca(self):
+        ap = ap_anbn_deterministico()
+        self.assertTrue(ap.deterministico())
+        self.assertFalse(ap_anbn().deterministico())
+        for cadeia in ["", "a", "ab", "ba", "aabb", "aab", "abb", "abab", "aaabbb"]:
+            with self.subTest(cadeia=cadeia):
+                limite = ap.limite_pilha_padrao(cadeia)
+                self.assertEqual(ap._simular_deterministico("q0", cadeia, limite, 1000),
+                                 ap._buscar("q0", cadeia, limite, 1000))
+        self.assertEqual(ap.simular("a" * 5000 + "b" * 5000), ACEITA)
+
+    def test_deterministico_laco_epsilon(self):
+        # Troca o topo para sempre sem crescer: configuração repetida
+        ap = PDA()
+        ap.adicionar_estado("q0", inicial=True, final=True)
+        ap.adicionar_transicao("q0", "q0", "ε", "Z", "X")
+        ap.adicionar_transicao("q0", "q0", "ε", "X", "Z")
+        self.assertTrue(ap.deterministico())
+        self.assertEqual(ap.simular("a"), REJEITA)
+
+    def test_rastrear_caminho(self):
+        for ap, cadeia in ((ap_anbn(), "aabb"), (ap_anbn_deterministico(), "aabb"), (ap_palindromo_par(), "abba")):
+            with self.subTest(cadeia=cadeia, deterministico=ap.deterministico()):
+                resultado, passos = ap.rastrear(cadeia)
+                self.assertEqual(resultado, ACEITA)
+                self.assertEqual(passos[0], {"estado": "q0", "lidos": 0, "pilha": "Z", "transicao": None})
+                for anterior, passo in zip(passos, passos[1:]):
+                    self.assertEqual(passo["transicao"]["origem"], anterior["estado"])
+                self.assertEqual(passos[-1]["lidos"], len(cadeia))
+                self.assertIn(passos[-1]["pilha"], ("", "Z"))
+                self.assertTrue(ap.estados[passos[-1]["estado"]]["final"])
+        self.assertEqual(ap_anbn().rastrear("aab"), (REJEITA, []))
+        self.assertEqual([p["pilha"] for p in ap_anbn().rastrear("ab")[1]], ["Z", "ZA", "ZA", "Z", "Z"])
+
+    def test_criterios_de_aceitacao(self):
+        # Termina em q1 (não final) com a pilha vazia, ou em q2 (final) com X na pilha
+        ap = PDA()
+        ap.adicionar_estado("q0", inicial=True)
+        ap.adicionar_estado("q1")
+        ap.adicionar_estado("q2", final=True)
+        ap.adicionar_transicao("q0", "q1", "a", "ε", "ε")
+        ap.adicionar_transicao("q0", "q2", "b", "ε", "X")
+        esperado = {
+            "a": {"final_e_pilha": REJEITA, "estado_final": REJEITA, "pilha_vazia": ACEITA},
+            "b": {"final_e_pilha": REJEITA, "estado_final": ACEITA, "pilha_vazia": REJEITA},
+            "": {"final_e_pilha": REJEITA, "estado_final": REJEITA, "pilha_vazia": ACEITA},
+        }
+        for cadeia, vereditos in esperado.items():
+            with self.subTest(cadeia=cadeia):
+                self.assertEqual(ap.simular(cadeia, aceitacao=TODOS), vereditos)
+                for modo, veredito in vereditos.items():
+                    self.assertEqual(ap.simular(cadeia, aceitacao=modo), veredito)
+                    self.assertEqual(ap.simular(cadeia, aceitacao=modo, motor="earley"), veredito)
+        self.assertEqual(ap_anbn().simular("aabb", aceitacao=TODOS), dict.fromkeys(vereditos, ACEITA))
+        with self.assertRaises(ValueError):
+            ap.simular("a", aceitacao="outro")
+
+    def test_lote_igual_individual(self):
+        cadeias = ["".join(p) for n in range(7) for p in product("ab", repeat=n)]
+        for ap in (ap_anbn(), ap_anbn_deterministico(), ap_palindromo_par()):
+            with self.subTest(deterministico=ap.deterministico()):
+                self.assertEqual(ap.simular_lote(cadeias), [ap.simular(c) for c in cadeias])
+                self.assertEqual(ap.simular_lote(cadeias, aceitacao=TODOS),
+                                 [ap.simular(c, aceitacao=TODOS) for c in cadeias])
+
+    def test_resumos_epsilon(self):
+        # q0 empilha X, q1 desempilha: de q0 se chega a q2 com o mesmo topo
+        ap = PDA()
+        ap.adicionar_estado("q0", inicial=True)
+        ap.adicionar_estado("q1")
+        ap.adicionar_estado("q2", final=True)
+        ap.adicionar_transicao("q0", "q1", "ε", "ε", "X")
+        ap.adicionar_transicao("q1", "q2", "ε", "X", "ε")
+        neutros, retornos, crescem = ap.resumos_epsilon()
+        self.assertIn(("q2", "Z"), neutros[("q0", "Z")])
+        self.assertEqual(retornos[("q1", "X")], {"q2"})
+        self.assertEqual(crescem[("q0", "Z")], [("q1", "ZX")])
+        self.assertEqual(ap.simular_lote(["", "a"]), [ACEITA, REJEITA])
+
+    def test_json_ida_e_volta(self):
+        ap = ap_palindromo_par()
+        copia = PDA.from_json(ap.to_json())
+        self.assertEqual(copia.to_json(), ap.to_json())
+        self.assertEqual(copia.simular("abba"), ACEITA)
+
+    def test_importa_sem_tkinter(self):
+        codigo = "import sys, pda; sys.exit('tkinter' in sys.modules)"
+        processo = subprocess.run([sys.executable, "-c", codigo], cwd=os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(processo.returncode, 0)
+
+if __name__ == '__main__':
+    unittest.main()
+
+# py -m unittest teste_pda --> para testar
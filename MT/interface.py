@@ -1,19 +1,23 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import json
+import os
+import sys
 import time
 import threading
-import networkx as nx
-import matplotlib
-matplotlib.use("TkAgg")
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+# networkx e matplotlib só são importados no primeiro desenho do grafo
+# (_garantir_figura): importar este módulo, ou o simulador, fica leve
 
 from maquina_turing import MaquinaTuring, Transicao
 from simulador import SimuladorTM
 from exemplos import exemplo_incrementador_binario
 from tema import TemaManager
 
+# Formato de arquivo compartilhado com os outros simuladores (pasta comum/)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum.formato import carregar, salvar
+from comum.layout import LayoutCamadas
+
 
 class InterfaceGrafica(tk.Tk):
     def __init__(self):
@@ -27,14 +31,16 @@ class InterfaceGrafica(tk.Tk):
         self.mt = MaquinaTuring()
         self.sim = SimuladorTM(self.mt)
         self.auto_running = False
+        self.layout = LayoutCamadas()
 
         # Tema
         self.tema = TemaManager(self)
 
         # Layout principal: esquerda (grafo), direita (controles roláveis)
         self._build_layout()
-        self._refresh_graph()
         self._refresh_tape()
+        # A janela aparece antes; o grafo (e o matplotlib) carregam em seguida
+        self.after_idle(self._refresh_graph)
 
     def _build_layout(self):
         main_frame = ttk.Frame(self)
@@ -45,13 +51,9 @@ class InterfaceGrafica(tk.Tk):
         main_frame.rowconfigure(0, weight=1)
 
         # Área esquerda: grafo (2/3)
-        graph_frame = ttk.Frame(main_frame)
-        graph_frame.grid(row=0, column=0, sticky="nsew")
-    
-        self.fig = Figure(figsize=(6, 5), dpi=100)
-        self.ax = self.fig.add_subplot(111)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=graph_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.graph_frame = ttk.Frame(main_frame)
+        self.graph_frame.grid(row=0, column=0, sticky="nsew")
+        self.fig = self.ax = self.canvas = None  # criados em _garantir_figura
 
         # Área direita: controles (1/3) com scrollbar
         right_frame = ttk.Frame(main_frame, width=420)
@@ -363,7 +365,23 @@ class InterfaceGrafica(tk.Tk):
     # -------------------------
     # Visualização
     # -------------------------
+    def _garantir_figura(self):
+        if self.fig is not None:
+            return
+        import matplotlib
+        matplotlib.use("TkAgg")
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.fig = Figure(figsize=(6, 5), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.graph_frame)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
     def _refresh_graph(self):
+        import networkx as nx
+
+        self._garantir_figura()
         self.ax.clear()
 
         # MULTI-GRAFO → permite múltiplas arestas entre os mesmos nós
@@ -391,8 +409,10 @@ class InterfaceGrafica(tk.Tk):
 
 
 
-        # Layout
-        pos = nx.spring_layout(G, seed=42, k=0.8)
+        # Layout em camadas guardado entre redesenhos: só estados novos são
+        # posicionados. Escala de uma coluna por unidade, y para cima no matplotlib
+        self.layout.atualizar(sorted(self.mt.Q), edge_map, self.mt.q0)
+        pos = {q: (x / self.layout.dx, -y / self.layout.dx) for q, (x, y) in self.layout.posicoes.items()}
 
         # Cores e tamanhos dos estados
         node_colors = []
@@ -445,6 +465,7 @@ class InterfaceGrafica(tk.Tk):
 
         
     def _highlight_current_state(self):
+        self._garantir_figura()
         if self.sim.current_state:
             self.ax.set_title(f"Estado atual: {self.sim.current_state}")
         else:
@@ -477,11 +498,9 @@ class InterfaceGrafica(tk.Tk):
     # -------------------------
     def _save_json(self):
         try:
-            d = self.mt.to_json()
             fname = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json")])
             if fname:
-                with open(fname, "w", encoding="utf-8") as f:
-                    json.dump(d, f, ensure_ascii=False, indent=2)
+                salvar(self.mt, fname)
                 self._log(f"Máquina salva em {fname}")
         except Exception as e:
             messagebox.showerror("Erro", str(e))
@@ -490,9 +509,12 @@ class InterfaceGrafica(tk.Tk):
         try:
             fname = filedialog.askopenfilename(filetypes=[("JSON", "*.json")])
             if fname:
-                with open(fname, "r", encoding="utf-8") as f:
-                    d = json.load(f)
-                self.mt = MaquinaTuring.from_json(d)
+                # Aceita o formato comum e o JSON antigo de MaquinaTuring
+                mt = carregar(fname)
+                if not isinstance(mt, MaquinaTuring):
+                    raise ValueError("o arquivo não descreve uma máquina de Turing")
+                self.mt = mt
+                self.layout = LayoutCamadas()  # máquina nova, layout novo
                 self.sim = SimuladorTM(self.mt)
                 self._refresh_graph()
                 self._refresh_tape()
@@ -504,6 +526,7 @@ class InterfaceGrafica(tk.Tk):
         try:
             fname = filedialog.asksaveasfilename(defaultextension=".png", filetypes=[("PNG", "*.png")])
             if fname:
+                self._garantir_figura()
                 self.fig.savefig(fname, dpi=200)
                 self._log(f"Grafo exportado em {fname}")
         except Exception as e:
@@ -511,6 +534,7 @@ class InterfaceGrafica(tk.Tk):
 
     def _load_example(self):
         self.mt = exemplo_incrementador_binario()
+        self.layout = LayoutCamadas()  # máquina nova, layout novo
         self.sim = SimuladorTM(self.mt)
         self._refresh_graph()
         self._refresh_tape()
@@ -518,6 +542,7 @@ class InterfaceGrafica(tk.Tk):
 
     def _clear_all(self):
         self.mt = MaquinaTuring()
+        self.layout = LayoutCamadas()  # máquina nova, layout novo
         self.sim = SimuladorTM(self.mt)
         self.txt_console.delete("1.0", tk.END)
         self._refresh_graph()
@@ -1,6 +1,7 @@
-from interface import InterfaceGrafica
-
 if __name__ == "__main__":
+    # Só a interface gráfica precisa de Tk/matplotlib: importar main.py não a carrega
+    from interface import InterfaceGrafica
+
     app = InterfaceGrafica()
     app.mainloop()
 
@@ -32,6 +32,8 @@ class MaquinaTuring:
     q_accept: Set[str] = field(default_factory=set)
     q_reject: Set[str] = field(default_factory=set)
     transitions: List[Transicao] = field(default_factory=list)
+    # Forma compilada: (estado, símbolo lido) -> transições; None = desatualizada
+    _indice: Optional[Dict[Tuple[str, str], List[Transicao]]] = field(default=None, repr=False, compare=False)
 
 
     def add_state(self, state: str):
@@ -59,8 +61,18 @@ class MaquinaTuring:
                 e.to_state == t.to_state and e.write == t.write and e.move == t.move):
                 return
         self.transitions.append(t)
+        self._indice = None
+
+    def compile(self):
+        indice = {}
+        for t in self.transitions:
+            indice.setdefault((t.from_state, t.read), []).append(t)
+        self._indice = indice
+        return indice
 
     def get_transitions(self, state: str, read: str) -> List[Transicao]:
+        if self._indice is not None:
+            return self._indice.get((state, read), [])
         return [t for t in self.transitions if t.from_state == state and t.read == read]
 
     def to_json(self):
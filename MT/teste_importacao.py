@@ -0,0 +1,45 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+
+# Tempo máximo (s) para importar o núcleo do simulador num processo novo
+ORCAMENTO_IMPORTACAO = 0.5
+
+MEDIR = """
+import json, sys, time
+inicio = time.perf_counter()
+import {modulos}
+tempo = time.perf_counter() - inicio
+print(json.dumps({{"tempo": tempo, "carregados": [m for m in ("matplotlib", "networkx") if m in sys.modules]}}))
+"""
+
+
+def medir(*modulos):
+    """Importa os módulos num interpretador limpo; devolve o tempo e quais bibliotecas de gráfico vieram junto."""
+    saida = subprocess.run([sys.executable, "-c", MEDIR.format(modulos=", ".join(modulos))],
+                           cwd=PASTA, capture_output=True, text=True, check=True).stdout
+    return json.loads(saida.splitlines()[-1])
+
+
+class TestImportacao(unittest.TestCase):
+
+    def test_nucleo_sem_graficos_e_rapido(self):
+        medida = medir("maquina_turing", "simulador", "exemplos", "main")
+        self.assertEqual(medida["carregados"], [])
+        self.assertLess(medida["tempo"], ORCAMENTO_IMPORTACAO)
+
+    def test_interface_carrega_graficos_so_ao_desenhar(self):
+        try:
+            import tkinter  # noqa: F401
+        except ImportError:
+            self.skipTest("tkinter indisponível")
+        self.assertEqual(medir("interface")["carregados"], [])
+
+if __name__ == '__main__':
+    unittest.main()
+
+# py -m unittest teste_importacao --> para testar
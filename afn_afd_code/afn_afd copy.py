@@ -2,6 +2,12 @@ import tkinter as tk
 from tkinter import ttk, messagebox, font
 import math
 import json
+import os
+import sys
+
+# Validação do formato comum aos simuladores (pasta comum/)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum.formato import normalizar
 
 # --- Estrutura de Dados para Autômatos Predefinidos ---
 PREDEFINED_AUTOMATA = {
@@ -284,6 +290,8 @@ class CreateAutomatonWindow(tk.Toplevel):
             for key in required_keys:
                 if key not in data:
                     raise ValueError(f"Faltando chave obrigatória: {key}")
+            # Mesmas regras dos arquivos lidos por comum/formato.py (estados e símbolos existentes)
+            normalizar(data)
             
             self.callback(data)
             self.destroy()
@@ -1,6 +1,26 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, font
+from tkinter import ttk, messagebox, font, filedialog
 import math
+import os
+import sys
+import time
+from array import array
+from collections import deque
+
+# Layout e formato de arquivo compartilhados com os outros simuladores (pasta comum/)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum.formato import carregar, salvar
+from comum.layout import LayoutCamadas
+
+# Intervalo mínimo entre quadros da animação (~60 por segundo)
+FRAME_MS = 16
+# Altura pedida para a tabela de transição (em linhas); as linhas de fato
+# visíveis saem da altura real da Treeview
+TABLE_ROWS = 15
+# Tamanhos do diagrama na escala 1 do layout; o desenho usa a escala atual
+STATE_RADIUS = 30
+STATE_FONT_SIZE = 12
+LABEL_FONT_SIZE = 10
 
 PREDEFINED_AUTOMATA = {
     "AFD: L = a*b+a+b* ": {
@@ -65,6 +85,126 @@ PREDEFINED_AUTOMATA = {
     }
 }
 
+# Subconjuntos já fechados por ε guardados por CompiledDelta (AFN); ao passar
+# disso o cache é esvaziado, para um autômato que explode não esgotar a memória
+CLOSURE_CACHE = 1 << 16
+
+class CompiledDelta:
+    # Forma compilada de delta: estados e símbolos viram índices inteiros.
+    # AFD: array plano de índices de estado (linha = estado, coluna = símbolo,
+    # -1 = sem transição).
+    # AFN: esparsa; cada estado tem um dicionário símbolo -> array de destinos,
+    # só com as células não vazias. Conjuntos de estados são frozensets de
+    # índices, e os ε-fechos são calculados sob demanda e memorizados.
+
+    def __init__(self, automaton, deterministic):
+        self.deterministic = deterministic
+        self.states = sorted(automaton.Q)
+        self.state_index = {state: i for i, state in enumerate(self.states)}
+        self.symbols = sorted(automaton.Sigma)
+        self.symbol_index = {symbol: j for j, symbol in enumerate(self.symbols)}
+        self.width = len(self.symbols)
+        self.start = self.state_index[automaton.q0]
+        self.final = bytearray(state in automaton.F for state in self.states)
+
+        state_index = self.state_index
+        symbol_index = self.symbol_index
+
+        if deterministic:
+            self.table = array("l", [-1]) * (len(self.states) * self.width)
+            for (state, symbol), dest in automaton.delta.items():
+                i = state_index.get(state)
+                j = symbol_index.get(symbol)
+                if i is not None and j is not None and dest in state_index:
+                    self.table[i * self.width + j] = state_index[dest]
+            return
+
+        self.rows = [{} for _ in self.states]
+        self.epsilon = [()] * len(self.states)
+        for (state, symbol), dests in automaton.delta.items():
+            i = state_index.get(state)
+            if i is None:
+                continue
+            targets = array("l", sorted(state_index[dest] for dest in dests if dest in state_index))
+            if not targets:
+                continue
+            if symbol == "epsilon":
+                self.epsilon[i] = targets
+            elif symbol in symbol_index:
+                self.rows[i][symbol_index[symbol]] = targets
+
+        self.has_epsilon = any(self.epsilon)
+        self._state_closure = {}
+        self._closed = {}
+
+    def state_closure(self, i):
+
+        closure = self._state_closure.get(i)
+        if closure is None:
+            seen = {i}
+            stack = [i]
+            epsilon = self.epsilon
+            while stack:
+                for dest in epsilon[stack.pop()]:
+                    if dest not in seen:
+                        seen.add(dest)
+                        stack.append(dest)
+            closure = self._state_closure[i] = frozenset(seen)
+        return closure
+
+    def closure_of(self, states):
+        # ε-fecho de um conjunto de índices, memorizado por conjunto
+        states = frozenset(states)
+        if not self.has_epsilon:
+            return states
+        closure = self._closed.get(states)
+        if closure is None:
+            result = set()
+            for i in states:
+                result |= self.state_closure(i)
+            if len(self._closed) >= CLOSURE_CACHE:
+                self._closed.clear()
+            closure = self._closed[states] = frozenset(result)
+        return closure
+
+    def initial(self):
+
+        return self.state_closure(self.start)
+
+    def step(self, states, j):
+        # ε-fecho de move(states, j)
+        rows = self.rows
+        moved = set()
+        for i in states:
+            targets = rows[i].get(j)
+            if targets:
+                moved.update(targets)
+        return self.closure_of(moved)
+
+    def is_final(self, states):
+
+        final = self.final
+        return any(final[i] for i in states)
+
+    def names(self, states):
+
+        return {self.states[i] for i in states}
+
+    def cell(self, i, symbol):
+
+        if self.deterministic:
+            j = self.symbol_index.get(symbol)
+            if j is None:
+                return "Ø"
+            dest = self.table[i * self.width + j]
+            return self.states[dest] if dest >= 0 else "Ø"
+
+        if symbol == "epsilon":
+            targets = self.epsilon[i]
+        else:
+            targets = self.rows[i].get(self.symbol_index.get(symbol))
+        return self.names(targets) if targets else "Ø"
+
 class Automaton:
    
     def __init__(self, Q, Sigma, delta, q0, F, tipo="Automaton"):
@@ -74,8 +214,11 @@ class Automaton:
         self.q0 = q0
         self.F = set(F)
         self.tipo = tipo
+        self.compiled = None
     
         self.state_positions = {}
+        self.position_transform = None
+        self.layout = LayoutCamadas()
 
     def get_quintupla_info(self):
         
@@ -87,27 +230,51 @@ class Automaton:
             f"F (Finais): {self._format_set(self.F)}\n"
         )
 
-    def get_transition_table_str(self):
-      
+    def get_transition_table_header(self):
+
         header = ["Estado"] + sorted(list(self.Sigma))
+        compiled = self.compiled
         if self.tipo == "AFN":
-            if any("epsilon" in k[0] or "epsilon" in k[1] for k in self.delta.keys()):
+            if compiled is not None:
+                if compiled.has_epsilon:
+                    header.append("epsilon")
+            elif any("epsilon" in k[0] or "epsilon" in k[1] for k in self.delta.keys()):
                  header.append("epsilon")
-        
+        return header
+
+    def get_transition_table_row(self, state, header):
+        # Uma linha da tabela, montada na hora (a tabela visual só pede as linhas visíveis)
+        compiled = self.compiled
+        row = [state]
+        for symbol in header[1:]:
+            if compiled is not None:
+                transition = compiled.cell(compiled.state_index[state], symbol)
+            else:
+                transition = self.delta.get((state, symbol), "Ø")
+            if isinstance(transition, set):
+                row.append(self._format_set(transition) or "Ø")
+            else:
+                row.append(str(transition))
+        return row
+
+    def get_transition_table_str(self):
+      
+        header = self.get_transition_table_header()
         table_str = "\t".join(header) + "\n"
         table_str += "-" * (len(table_str) * 2) + "\n"
 
         for state in sorted(list(self.Q)):
-            row = [state]
-            for symbol in header[1:]:
-                transition = self.delta.get((state, symbol), "Ø")
-                if isinstance(transition, set):
-                    row.append(self._format_set(transition) or "Ø")
-                else:
-                    row.append(str(transition))
-            table_str += "\t".join(row) + "\n"
+            table_str += "\t".join(self.get_transition_table_row(state, header)) + "\n"
         return table_str
 
+    def compile(self):
+        # Gera a forma compilada usada por validate, accepts,
+        # get_transition_table_str e convert_to_afd. Ela não acompanha
+        # mudanças posteriores em Q, Sigma, delta ou F: quem as fizer chama
+        # compile() de novo (ou zera self.compiled).
+        self.compiled = CompiledDelta(self, deterministic=self.tipo == "AFD")
+        return self.compiled
+
     def _format_set(self, s):
 
         if not s:
@@ -118,18 +285,21 @@ class Automaton:
 
         raise NotImplementedError("O método 'validate' deve ser implementado por uma subclasse (AFD ou AFN).")
 
+    def accepts(self, input_string):
+
+        raise NotImplementedError("O método 'accepts' deve ser implementado por uma subclasse (AFD ou AFN).")
+
     def _calculate_positions(self, width, height):
-       
-        self.state_positions = {}
-        center_x, center_y = width / 2, height / 2
-        radius = min(width, height) / 2 - 50  
-        num_states = len(self.Q)
-        
-        for i, state in enumerate(sorted(list(self.Q))):
-            angle = (2 * math.pi / num_states) * i
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-            self.state_positions[state] = (x, y)
+        # O layout em camadas fica guardado no autômato; um redimensionamento
+        # só reescala as posições, e estados novos entram sem mover os antigos.
+        edges = []
+        for (state, _), targets in self.delta.items():
+            if isinstance(targets, str):
+                targets = [targets]
+            edges.extend((state, target) for target in targets)
+        self.layout.atualizar(sorted(self.Q), edges, self.q0)
+        self.position_transform = self.layout.transformacao(width, height)
+        self.state_positions = self.layout.encaixar(width, height)
 
 class AFD(Automaton):
   
@@ -138,6 +308,9 @@ class AFD(Automaton):
 
     def validate(self, input_string):
     
+        if self.compiled is not None:
+            return self._validate_compiled(input_string)
+
         current_state = self.q0
         path = [current_state]
 
@@ -158,6 +331,143 @@ class AFD(Automaton):
         is_accepted = current_state in self.F
         return is_accepted, path, f"Processamento concluído. Estado final: {current_state}."
 
+    def _validate_compiled(self, input_string):
+
+        compiled = self.compiled
+        table = compiled.table
+        width = compiled.width
+        symbol_index = compiled.symbol_index
+        states = compiled.states
+        current = compiled.start
+        path = [states[current]]
+
+        for symbol in input_string:
+            j = symbol_index.get(symbol)
+            if j is None:
+                return False, path, f"Símbolo '{symbol}' não está no alfabeto Σ."
+
+            current = table[current * width + j]
+
+            if current < 0:
+                path.append("REJEITA (Trap)")
+                return False, path, f"Transição não definida de {path[-2]} com '{symbol}'."
+
+            path.append(states[current])
+
+        is_accepted = bool(compiled.final[current])
+        return is_accepted, path, f"Processamento concluído. Estado final: {states[current]}."
+
+    def accepts(self, input_string):
+        # Mesmo resultado de validate()[0], sem montar o caminho nem a mensagem.
+        compiled = self.compiled
+        if compiled is not None:
+            table = compiled.table
+            width = compiled.width
+            symbol_index = compiled.symbol_index
+            current = compiled.start
+            for symbol in input_string:
+                j = symbol_index.get(symbol)
+                if j is None:
+                    return False
+                current = table[current * width + j]
+                if current < 0:
+                    return False
+            return bool(compiled.final[current])
+
+        delta = self.delta
+        sigma = self.Sigma
+        current_state = self.q0
+
+        for symbol in input_string:
+            if symbol not in sigma:
+                return False
+            current_state = delta.get((current_state, symbol))
+            if current_state is None:
+                return False
+
+        return current_state in self.F
+
+    def minimize(self):
+        # Hopcroft: estados inalcançáveis são descartados e transições ausentes
+        # vão para um estado armadilha implícito (None), removido no final.
+        sigma = sorted(self.Sigma)
+        reachable = [self.q0]
+        seen = {self.q0}
+        for state in reachable:
+            for symbol in sigma:
+                next_state = self.delta.get((state, symbol))
+                if next_state is not None and next_state not in seen:
+                    seen.add(next_state)
+                    reachable.append(next_state)
+
+        inverse = {}
+        for state in reachable + [None]:
+            for symbol in sigma:
+                dest = self.delta.get((state, symbol)) if state is not None else None
+                inverse.setdefault((symbol, dest), []).append(state)
+
+        finals = {state for state in reachable if state in self.F}
+        others = (seen - finals) | {None}
+        partition = [block for block in (finals, others) if block]
+        block_of = {}
+        for index, block in enumerate(partition):
+            for state in block:
+                block_of[state] = index
+
+        pending = list(range(len(partition)))
+        pending_set = set(pending)
+        while pending:
+            splitter_index = pending.pop()
+            pending_set.discard(splitter_index)
+            splitter = list(partition[splitter_index])
+
+            for symbol in sigma:
+                touched = {}
+                for dest in splitter:
+                    for source in inverse.get((symbol, dest), ()):
+                        touched.setdefault(block_of[source], set()).add(source)
+
+                for index, inside in touched.items():
+                    block = partition[index]
+                    if len(inside) == len(block):
+                        continue
+                    outside = block - inside
+                    partition[index] = inside
+                    new_index = len(partition)
+                    partition.append(outside)
+                    for state in outside:
+                        block_of[state] = new_index
+
+                    if index in pending_set:
+                        chosen = new_index
+                    else:
+                        chosen = index if len(inside) <= len(outside) else new_index
+                    pending.append(chosen)
+                    pending_set.add(chosen)
+
+        trap_block = block_of[None]
+        start_block = block_of[self.q0]
+        if start_block == trap_block:
+            return AFD({"q0"}, self.Sigma, {}, "q0", set())
+
+        names = {start_block: "q0"}
+        order = [start_block]
+        min_delta = {}
+        for block_index in order:
+            representative = next(iter(partition[block_index]))
+            for symbol in sigma:
+                dest = self.delta.get((representative, symbol))
+                if dest is None or block_of[dest] == trap_block:
+                    continue
+                dest_block = block_of[dest]
+                if dest_block not in names:
+                    names[dest_block] = f"q{len(names)}"
+                    order.append(dest_block)
+                min_delta[(names[block_index], symbol)] = names[dest_block]
+
+        min_F = {names[index] for index in order if partition[index] & self.F}
+        return AFD(set(names.values()), self.Sigma, min_delta, "q0", min_F)
+
 class AFN(Automaton):
    
     def __init__(self, Q, Sigma, delta, q0, F):
@@ -227,27 +537,68 @@ class AFN(Automaton):
         
         return is_accepted, path, f"Processamento concluído. Estados finais: {self._format_set(current_states)}."
 
+    def accepts(self, input_string):
+        # Mesmo resultado de validate()[0], sem copiar os conjuntos de estados a cada símbolo.
+        compiled = self.compiled
+        if compiled is not None:
+            symbol_index = compiled.symbol_index
+            current = compiled.initial()
+            for symbol in input_string:
+                j = symbol_index.get(symbol)
+                if j is None:
+                    return False
+                current = compiled.step(current, j)
+                if not current:
+                    return False
+            return compiled.is_final(current)
+
+        sigma = self.Sigma
+        current_states = self.epsilon_closure({self.q0})
+
+        for symbol in input_string:
+            if symbol not in sigma:
+                return False
+            current_states = self.epsilon_closure(self.move(current_states, symbol))
+            if not current_states:
+                return False
+
+        return not self.F.isdisjoint(current_states)
+
     def convert_to_afd(self):
        
         print("Iniciando conversão AFN -> AFD...")
+
+        if self.compiled is not None:
+            afd_Q, afd_delta, q0_afd, afd_F = self._subsets_compiled(self.compiled)
+        else:
+            afd_Q, afd_delta, q0_afd, afd_F = self._subsets()
+                    
+        print(f"Conversão concluída. Q={afd_Q}")
         
+        if not afd_Q:
+            
+             q0_afd = "q0_vazio"
+             afd_Q = {q0_afd}
+             return AFD(afd_Q, self.Sigma, {}, q0_afd, set())
+             
+        return AFD(afd_Q, self.Sigma, afd_delta, q0_afd, afd_F)
+
+    def _subsets(self):
+        # Construção dos subconjuntos direto sobre delta (conjuntos de nomes)
         afd_Q = set()
         afd_delta = {}
         afd_F = set()
         
-        q0_afn = self.q0
-        q0_afd_states = self.epsilon_closure({q0_afn})
+        q0_afd_states = self.epsilon_closure({self.q0})
         
         q0_afd = self._set_to_state_name(q0_afd_states)
         
         afd_Q.add(q0_afd)
         
-        queue = [q0_afd_states]
-
-        processed = {q0_afd}
+        queue = deque([q0_afd_states])
 
         while queue:
-            current_afn_states = queue.pop(0)
+            current_afn_states = queue.popleft()
             current_afd_state_name = self._set_to_state_name(current_afn_states)
 
             if not self.F.isdisjoint(current_afn_states):
@@ -255,9 +606,7 @@ class AFN(Automaton):
 
             for symbol in self.Sigma:
     
-                moved_states = self.move(current_afn_states, symbol)
-               
-                next_afn_states = self.epsilon_closure(moved_states)
+                next_afn_states = self.epsilon_closure(self.move(current_afn_states, symbol))
                 
                 if not next_afn_states:
                 
@@ -267,21 +616,59 @@ class AFN(Automaton):
                 
                 afd_delta[(current_afd_state_name, symbol)] = next_afd_state_name
                 
-                if next_afd_state_name not in processed:
+                if next_afd_state_name not in afd_Q:
                    
                     afd_Q.add(next_afd_state_name)
-                    processed.add(next_afd_state_name)
                     queue.append(next_afn_states)
-                    
-        print(f"Conversão concluída. Q={afd_Q}")
-        
-        if not afd_Q:
-            
-             q0_afd = "q0_vazio"
-             afd_Q = {q0_afd}
-             return AFD(afd_Q, self.Sigma, {}, q0_afd, set())
-             
-        return AFD(afd_Q, self.Sigma, afd_delta, q0_afd, afd_F)
+
+        return afd_Q, afd_delta, q0_afd, afd_F
+
+    def _subsets_compiled(self, compiled):
+        # Mesma construção sobre a forma compilada: subconjuntos são frozensets
+        # de índices e, como compiled.states está ordenado, os nomes saem
+        # iguais aos de _set_to_state_name.
+        states = compiled.states
+
+        def subset_name(subset):
+            return "{" + ",".join(states[i] for i in sorted(subset)) + "}"
+
+        afd_Q = set()
+        afd_delta = {}
+        afd_F = set()
+
+        q0_subset = compiled.initial()
+        q0_afd = subset_name(q0_subset)
+        afd_Q.add(q0_afd)
+
+        queue = deque([q0_subset])
+        names = {q0_subset: q0_afd}
+
+        while queue:
+            current = queue.popleft()
+            current_name = names[current]
+
+            if compiled.is_final(current):
+                afd_F.add(current_name)
+
+            # Só os símbolos que saem de algum estado do subconjunto
+            symbols = set()
+            for i in current:
+                symbols.update(compiled.rows[i])
+
+            for j in sorted(symbols):
+                next_subset = compiled.step(current, j)
+                if not next_subset:
+                    continue
+
+                next_name = names.get(next_subset)
+                if next_name is None:
+                    next_name = names[next_subset] = subset_name(next_subset)
+                    afd_Q.add(next_name)
+                    queue.append(next_subset)
+
+                afd_delta[(current_name, compiled.symbols[j])] = next_name
+
+        return afd_Q, afd_delta, q0_afd, afd_F
 
     def _set_to_state_name(self, states_set):
         
@@ -305,7 +692,9 @@ class AutomatonApp:
         self.current_automaton = None
         self.animation_step = 0
         self.animation_path = []
-        self.canvas_elements = {"states": {}, "transitions": {}}
+        self.animation_job = None
+        self.canvas_elements = {"states": {}, "transitions": {}, "circles": {}}
+        self.state_colors = {}  # estado -> cor atual (ausente = branco)
 
         self.control_frame = ttk.Frame(root, padding=10, width=250)
         self.control_frame.pack(side=tk.LEFT, fill=tk.Y, expand=False)
@@ -341,6 +730,11 @@ class AutomatonApp:
             command=self.load_automaton
         )
         self.load_button.pack(fill=tk.X, pady=10)
+
+        file_frame = ttk.Frame(self.control_frame)
+        file_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Button(file_frame, text="Abrir JSON", command=self.load_file).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 5))
+        ttk.Button(file_frame, text="Salvar JSON", command=self.save_file).pack(side=tk.LEFT, expand=True, fill=tk.X)
         
         ttk.Separator(self.control_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
         
@@ -372,6 +766,24 @@ class AutomatonApp:
         )
         self.run_button.pack(fill=tk.X, pady=10)
 
+        # Velocidade em escala log: 10**valor passos por segundo (0,5 a 1000)
+        self.speed_var = tk.DoubleVar(value=math.log10(1.25))
+        self.speed_label = ttk.Label(self.control_frame)
+        self.speed_label.pack(anchor=tk.W)
+        ttk.Scale(
+            self.control_frame, from_=math.log10(0.5), to=3, variable=self.speed_var,
+            command=lambda _: self._update_speed_label()
+        ).pack(fill=tk.X, pady=2)
+        self._update_speed_label()
+
+        self.skip_button = ttk.Button(
+            self.control_frame,
+            text="Pular para o Resultado",
+            command=self.skip_animation,
+            state=tk.DISABLED
+        )
+        self.skip_button.pack(fill=tk.X, pady=5)
+
         ttk.Label(self.control_frame, text="Status da Validação:", style="Header.TLabel").pack(pady=10, anchor=tk.W)
         self.status_label = ttk.Label(
             self.control_frame, 
@@ -407,10 +819,36 @@ class AutomatonApp:
         self.info_text.config(state=tk.DISABLED)
         
         ttk.Label(self.info_frame, text="Tabela de Transição (δ)", style="Header.TLabel").pack(pady=10, anchor=tk.W)
-        self.table_text = tk.Text(self.info_frame, height=15, width=40, font=("Courier", 10), wrap=tk.NONE)
-        self.table_text.pack(fill=tk.X, expand=False)
-        self.table_text.insert(tk.END, "")
-        self.table_text.config(state=tk.DISABLED)
+
+        search_frame = ttk.Frame(self.info_frame)
+        search_frame.pack(fill=tk.X)
+        ttk.Label(search_frame, text="Buscar estado:").pack(side=tk.LEFT)
+        self.table_search = tk.StringVar()
+        self.table_search.trace_add("write", lambda *_: self._filter_table())
+        ttk.Entry(search_frame, textvariable=self.table_search).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
+        # Tabela virtualizada: a Treeview só tem as table_rows linhas visíveis,
+        # preenchidas na hora a partir da tabela compilada; a barra de rolagem
+        # é nossa e só muda o deslocamento
+        table_frame = ttk.Frame(self.info_frame)
+        table_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.table_view = ttk.Treeview(table_frame, show="headings", height=TABLE_ROWS, selectmode="none")
+        table_scroll_y = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self._scroll_table)
+        table_scroll_x = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL, command=self.table_view.xview)
+        self.table_view.configure(xscrollcommand=table_scroll_x.set)
+        self.table_scroll_y = table_scroll_y
+        table_scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
+        table_scroll_x.pack(side=tk.BOTTOM, fill=tk.X)
+        self.table_view.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.table_view.bind(sequence, self._table_wheel)
+        self.table_view.bind("<Configure>", self._table_resize)
+
+        self.table_header = []
+        self.table_states = []
+        self.table_all_states = []
+        self.table_offset = 0
+        self.table_rows = TABLE_ROWS
 
     def load_automaton(self):
        
@@ -426,36 +864,73 @@ class AutomatonApp:
         self._load_automaton_data(automaton_data, f"Autômato '{key}' carregado.")
 
 
+    def load_file(self):
+        # Aceita o formato comum (comum/formato.py) e os JSON antigos deste simulador
+        fname = filedialog.askopenfilename(filetypes=[("JSON", "*.json")])
+        if not fname:
+            return
+        try:
+            automaton = carregar(fname)
+            if getattr(automaton, "tipo", None) not in ("AFD", "AFN"):
+                raise ValueError("o arquivo não descreve um AFD nem um AFN")
+        except Exception as e:
+            messagebox.showerror("Erro ao Carregar", f"Não foi possível carregar o autômato: {e}")
+            return
+        self._show_automaton(automaton, f"Autômato carregado de {os.path.basename(fname)}.")
+
+    def save_file(self):
+
+        if not self.current_automaton:
+            messagebox.showwarning("Ação Inválida", "Carregue um autômato primeiro.")
+            return
+        fname = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if not fname:
+            return
+        try:
+            salvar(self.current_automaton, fname)
+        except Exception as e:
+            messagebox.showerror("Erro ao Salvar", f"Não foi possível salvar o autômato: {e}")
+            return
+        self.status_label.config(text=f"Autômato salvo em {os.path.basename(fname)}.")
+
     def _load_automaton_data(self, automaton_data, load_message):
        
         try:
-           
-            self.current_automaton = None 
-            
             if automaton_data["tipo"] == "AFD":
-                self.current_automaton = AFD(
+                automaton = AFD(
                     automaton_data["Q"],
                     automaton_data["Sigma"],
                     automaton_data["delta"],
                     automaton_data["q0"],
                     automaton_data["F"]
                 )
-               
-                self.convert_button.config(state=tk.DISABLED)
                 
             elif automaton_data["tipo"] == "AFN":
-                self.current_automaton = AFN(
+                automaton = AFN(
                     automaton_data["Q"],
                     automaton_data["Sigma"],
                     automaton_data["delta"],
                     automaton_data["q0"],
                     automaton_data["F"]
                 )
-               
-                self.convert_button.config(state=tk.NORMAL)
                 
             else:
                 raise ValueError("Tipo de autômato desconhecido.")
+        except Exception as e:
+            self._stop_animation()
+            self._load_failed(e)
+            return
+
+        self._show_automaton(automaton, load_message)
+
+    def _show_automaton(self, automaton, load_message):
+
+        try:
+            self._stop_animation()
+            self.current_automaton = automaton
+            self.convert_button.config(state=tk.NORMAL if automaton.tipo == "AFN" else tk.DISABLED)
+
+            self.current_automaton.compile()
                 
             self.run_button.config(state=tk.NORMAL)
             self.status_label.config(text=load_message)
@@ -466,10 +941,14 @@ class AutomatonApp:
             self._draw_automaton()
 
         except Exception as e:
-            messagebox.showerror("Erro ao Carregar", f"Não foi possível carregar o autômato: {e}")
-            self.current_automaton = None
-            self.run_button.config(state=tk.DISABLED)
-            self.convert_button.config(state=tk.DISABLED)
+            self._load_failed(e)
+
+    def _load_failed(self, error):
+
+        messagebox.showerror("Erro ao Carregar", f"Não foi possível carregar o autômato: {error}")
+        self.current_automaton = None
+        self.run_button.config(state=tk.DISABLED)
+        self.convert_button.config(state=tk.DISABLED)
 
     def _update_info_panel(self):
         
@@ -481,22 +960,109 @@ class AutomatonApp:
         self.info_text.insert(tk.END, self.current_automaton.get_quintupla_info())
         self.info_text.config(state=tk.DISABLED)
         
-        self.table_text.config(state=tk.NORMAL)
-        self.table_text.delete(1.0, tk.END)
-        self.table_text.insert(tk.END, self.current_automaton.get_transition_table_str())
-        self.table_text.config(state=tk.DISABLED)
+        automaton = self.current_automaton
+        self.table_header = automaton.get_transition_table_header()
+        self.table_all_states = automaton.compiled.states if automaton.compiled is not None else sorted(automaton.Q)
+        columns = [f"c{i}" for i in range(len(self.table_header))]
+        self.table_view.configure(columns=columns)
+        for column, title in zip(columns, self.table_header):
+            self.table_view.heading(column, text=title)
+            self.table_view.column(column, width=90, minwidth=50, stretch=False)
+        self._filter_table()
+
+    def _filter_table(self):
+
+        if self.current_automaton is None:
+            self.table_all_states = []
+        text = self.table_search.get().strip().lower()
+        if text:
+            self.table_states = [state for state in self.table_all_states if text in state.lower()]
+        else:
+            self.table_states = self.table_all_states
+        self.table_offset = 0
+        self._fill_table()
+
+    def _table_resize(self, event):
+        # Recalcula quantas linhas cabem quando a janela muda de tamanho
+        rows = self._visible_table_rows(event.height)
+        if rows != self.table_rows:
+            self.table_rows = rows
+            self._fill_table()
+
+    def _visible_table_rows(self, height):
+
+        children = self.table_view.get_children()
+        box = self.table_view.bbox(children[0]) if children else ""
+        if box:
+            # y da primeira linha = altura do cabeçalho
+            header_height, row_height = box[1], box[3]
+        else:
+            row_height = int(self.style.lookup("Treeview", "rowheight") or 20)
+            header_height = row_height
+        return max(1, (height - header_height) // max(row_height, 1))
+
+    def _fill_table(self):
+        # Só as linhas visíveis existem na Treeview
+        total = len(self.table_states)
+        self.table_offset = max(0, min(self.table_offset, total - self.table_rows))
+        self.table_view.delete(*self.table_view.get_children())
+        for state in self.table_states[self.table_offset:self.table_offset + self.table_rows]:
+            self.table_view.insert("", tk.END, values=self.current_automaton.get_transition_table_row(state, self.table_header))
+        if total:
+            self.table_scroll_y.set(self.table_offset / total, min(1.0, (self.table_offset + self.table_rows) / total))
+        else:
+            self.table_scroll_y.set(0, 1)
+
+    def _scroll_table(self, action, amount, unit=None):
+        # Mesmo protocolo do yview de um widget: ("moveto", fração) ou ("scroll", n, "units"/"pages")
+        if action == "moveto":
+            self.table_offset = int(float(amount) * len(self.table_states))
+        else:
+            step = self.table_rows if unit == "pages" else 1
+            self.table_offset += int(amount) * step
+        self._fill_table()
+
+    def _table_wheel(self, event):
+
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_table("scroll", -3, "units")
+        else:
+            self._scroll_table("scroll", 3, "units")
+        return "break"
 
     def on_canvas_resize(self, event):
         
-        if self.current_automaton:
-           
-            self.current_automaton.state_positions = {}
+        automaton = self.current_automaton
+        if not automaton:
+            return
+        if automaton.position_transform is None or not self.canvas_elements["states"]:
+            automaton.state_positions = {}
             self._draw_automaton()
+            return
+
+        # Em vez de apagar e recriar tudo, reescala e move os itens que já
+        # estão no canvas para a nova transformação do layout
+        old_scale, old_x, old_y = automaton.position_transform
+        automaton._calculate_positions(event.width, event.height)
+        new_scale, new_x, new_y = automaton.position_transform
+        factor = new_scale / old_scale
+        if factor != 1:
+            self.canvas.scale("all", 0, 0, factor, factor)
+            # scale() não muda o tamanho das fontes
+            state_font, label_font = self._diagram_fonts(new_scale)
+            self.canvas.itemconfig("state_text", font=state_font)
+            self.canvas.itemconfig("transition_text", font=label_font)
+        self.canvas.move("all", new_x - factor * old_x, new_y - factor * old_y)
+
+    def _diagram_fonts(self, scale):
+
+        return ("Inter", max(6, round(STATE_FONT_SIZE * scale)), "bold"), ("Inter", max(6, round(LABEL_FONT_SIZE * scale)))
 
     def _draw_automaton(self):
         
         self.canvas.delete("all")
-        self.canvas_elements = {"states": {}, "transitions": {}}
+        self.canvas_elements = {"states": {}, "transitions": {}, "circles": {}}
+        self.state_colors = {}
         
         if not self.current_automaton:
             return
@@ -504,36 +1070,39 @@ class AutomatonApp:
         width = self.canvas.winfo_width()
         height = self.canvas.winfo_height()
         
-        if not self.current_automaton.state_positions:
+        if not self.current_automaton.state_positions or self.current_automaton.position_transform is None:
              self.current_automaton._calculate_positions(width, height)
         
         positions = self.current_automaton.state_positions
-        radius = 30 
+        # Mesma escala que on_canvas_resize aplica aos itens já desenhados, para
+        # um redesenho sair do mesmo tamanho que os itens reescalados
+        scale = self.current_automaton.position_transform[0]
+        radius = STATE_RADIUS * scale
+        state_font, label_font = self._diagram_fonts(scale)
         
-        self._draw_transitions(positions, radius)
+        self._draw_transitions(positions, radius, scale, label_font)
 
         for state in self.current_automaton.Q:
             x, y = positions[state]
             
+            circles = [self.canvas.create_oval(x - radius, y - radius, x + radius, y + radius, outline="black", width=2, fill="white", tags=(state, "state_circle"))]
             if state in self.current_automaton.F:
-                self.canvas.create_oval(x - radius, y - radius, x + radius, y + radius, outline="black", width=2, fill="white", tags=(state, "state_circle"))
-                self.canvas.create_oval(x - radius + 4, y - radius + 4, x + radius - 4, y + radius - 4, outline="black", width=2, fill="white", tags=(state, "state_circle"))
-            else:
-                self.canvas.create_oval(x - radius, y - radius, x + radius, y + radius, outline="black", width=2, fill="white", tags=(state, "state_circle"))
+                circles.append(self.canvas.create_oval(x - radius + 4 * scale, y - radius + 4 * scale, x + radius - 4 * scale, y + radius - 4 * scale, outline="black", width=2, fill="white", tags=(state, "state_circle")))
+            self.canvas_elements["circles"][state] = circles
 
-            self.canvas.create_text(x, y, text=state, font=("Inter", 12, "bold"), tags=(state, "state_text"))
+            self.canvas.create_text(x, y, text=state, font=state_font, tags=(state, "state_text"))
             
             if state == self.current_automaton.q0:
                
-                start_x_arrow = x - radius - 40
+                start_x_arrow = x - radius - 40 * scale
                 if start_x_arrow < 10:
                     start_x_arrow = 10
                 
-                self.canvas.create_line(start_x_arrow, y, x - radius - 5, y, arrow=tk.LAST, width=2, tags=(state, "start_arrow"))
+                self.canvas.create_line(start_x_arrow, y, x - radius - 5 * scale, y, arrow=tk.LAST, width=2, tags=(state, "start_arrow"))
                 
             self.canvas_elements["states"][state] = self.canvas.find_withtag(state)
 
-    def _draw_transitions(self, positions, radius):
+    def _draw_transitions(self, positions, radius, scale, label_font):
         
         grouped_transitions = {}
         
@@ -558,7 +1127,7 @@ class AutomatonApp:
                     x1 - radius, y1 - radius - (radius * 1.5), x1 + radius, y1 - (radius * 0.5),
                     start=270, extent=270, style=tk.ARC, width=2, outline="#555555", tags="transition_line"
                 )
-                self.canvas.create_text(x1, y1 - radius * 1.5, text=label, fill="#333333", tags="transition_text")
+                self.canvas.create_text(x1, y1 - radius * 1.5, text=label, fill="#333333", font=label_font, tags="transition_text")
             else:
                
                 angle = math.atan2(y2 - y1, x2 - x1)
@@ -575,12 +1144,12 @@ class AutomatonApp:
                 mid_x = (start_x + end_x) / 2
                 mid_y = (start_y + end_y) / 2
                 
-                offset = 10
+                offset = 10 * scale
                 angle_perp = angle + math.pi / 2
                 label_x = mid_x + offset * math.cos(angle_perp)
                 label_y = mid_y + offset * math.sin(angle_perp)
 
-                self.canvas.create_text(label_x, label_y, text=label, fill="#333333", tags="transition_text")
+                self.canvas.create_text(label_x, label_y, text=label, fill="#333333", font=label_font, tags="transition_text")
 
     def run_conversion(self):
       
@@ -620,8 +1189,10 @@ class AutomatonApp:
             
         input_string = self.string_entry.get()
         
+        self._stop_animation()
         self._reset_canvas_colors()
         self.animation_step = 0
+        self.animation_input = input_string
         self.result_label.config(text="")
         
         is_accepted, path, message = self.current_automaton.validate(input_string)
@@ -630,42 +1201,82 @@ class AutomatonApp:
         self.final_result = (is_accepted, message)
         
         self.status_label.config(text=f"Iniciando validação para: '{input_string}'")
-        
+        self.skip_button.config(state=tk.NORMAL)
+
+        # Crédito de passos: o primeiro é desenhado já
+        self.animation_credit = 1.0
+        self.animation_clock = time.perf_counter()
         self._animate_step()
 
+    def _steps_per_second(self):
+        return 10 ** self.speed_var.get()
+
+    def _update_speed_label(self):
+        self.speed_label.config(text=f"Velocidade: {self._steps_per_second():.3g} passos/s")
+
+    def _stop_animation(self):
+        if self.animation_job is not None:
+            self.root.after_cancel(self.animation_job)
+            self.animation_job = None
+        self.skip_button.config(state=tk.DISABLED)
+
+    def skip_animation(self):
+        # Vai direto ao último passo e ao resultado
+        self._stop_animation()
+        if self.animation_path:
+            self.animation_step = len(self.animation_path) - 1
+            self._render_step(self.animation_step)
+        self._show_final_result()
+
     def _animate_step(self):
-        
-        if self.animation_step >= len(self.animation_path):
-            
-            self._show_final_result()
-            return
-            
-        
-        self._reset_canvas_colors()
-        
-        current_step_data = self.animation_path[self.animation_step]
+        # O passo lógico avança conforme o tempo e a velocidade; no máximo um
+        # quadro por atualização de tela (FRAME_MS) é desenhado, e os passos
+        # intermediários de um mesmo quadro são pulados
+        self.animation_job = None
+        speed = self._steps_per_second()
+        now = time.perf_counter()
+        self.animation_credit += (now - self.animation_clock) * speed
+        self.animation_clock = now
+
+        advance = int(self.animation_credit)
+        if advance:
+            self.animation_credit -= advance
+            self.animation_step += advance - 1
+            if self.animation_step >= len(self.animation_path):
+                # Pulou (ou já passou) do último passo: desenha ele antes do
+                # resultado, como skip_animation, para não sobrar destaque velho
+                self._stop_animation()
+                self.animation_step = len(self.animation_path) - 1
+                self._render_step(self.animation_step)
+                self._show_final_result()
+                return
+            self._render_step(self.animation_step)
+            self.animation_step += 1
+
+        self.animation_job = self.root.after(max(FRAME_MS, int(1000 / speed)), self._animate_step)
+
+    def _render_step(self, step):
+
+        current_step_data = self.animation_path[step]
         
         symbol = ""
-        input_str = self.string_entry.get()
-        if self.animation_step > 0 and self.animation_step <= len(input_str):
-            symbol = f" (lendo '{input_str[self.animation_step - 1]}')"
+        input_str = self.animation_input
+        if step > 0 and step <= len(input_str):
+            symbol = f" (lendo '{input_str[step - 1]}')"
             
+        # Só os estados que mudam de cor em relação ao passo anterior são reconfigurados
         if self.current_automaton.tipo == "AFD":
             if current_step_data in self.canvas_elements["states"]:
-                self._highlight_state(current_step_data, "yellow")
-                self.status_label.config(text=f"Passo {self.animation_step}{symbol}: Estado atual -> {current_step_data}")
+                self._paint_states({current_step_data: "yellow"})
+                self.status_label.config(text=f"Passo {step}{symbol}: Estado atual -> {current_step_data}")
+            else:
+                self._paint_states({})
         
         elif self.current_automaton.tipo == "AFN":
             if isinstance(current_step_data, set):
                 states_str = self.current_automaton._format_set(current_step_data)
-                self.status_label.config(text=f"Passo {self.animation_step}{symbol}: Estados ativos -> {states_str}")
-                for state in current_step_data:
-                    if state in self.canvas_elements["states"]:
-                        self._highlight_state(state, "yellow")
-            
-        self.animation_step += 1
-        
-        self.root.after(800, self._animate_step) 
+                self.status_label.config(text=f"Passo {step}{symbol}: Estados ativos -> {states_str}")
+                self._paint_states({state: "yellow" for state in current_step_data if state in self.canvas_elements["states"]})
 
     def _show_final_result(self):
       
@@ -696,15 +1307,25 @@ class AutomatonApp:
 
     def _reset_canvas_colors(self):
        
-        for state_id in self.canvas.find_withtag("state_circle"):
-            self.canvas.itemconfig(state_id, fill="white")
+        self._paint_states({})
+
+    def _paint_states(self, colors):
+        # colors: estado -> cor; quem não aparece volta ao branco
+        for state in [s for s in self.state_colors if s not in colors]:
+            self._highlight_state(state, "white")
+        for state, color in colors.items():
+            self._highlight_state(state, color)
             
     def _highlight_state(self, state, color):
         
-        state_ovals = self.canvas.find_withtag(state)
-        for item_id in state_ovals:
-            if "state_circle" in self.canvas.gettags(item_id):
-                 self.canvas.itemconfig(item_id, fill=color)
+        if self.state_colors.get(state, "white") == color:
+            return
+        for item_id in self.canvas_elements["circles"].get(state, ()):
+            self.canvas.itemconfig(item_id, fill=color)
+        if color == "white":
+            del self.state_colors[state]
+        else:
+            self.state_colors[state] = color
 
 if __name__ == "__main__":
     try:
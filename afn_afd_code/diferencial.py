@@ -0,0 +1,220 @@
+"""
+Teste diferencial entre os motores de AFN/AFD: gera AFNs aleatórios e cadeias
+(todas até o comprimento k, depois amostras mais longas) e compara o veredito
+de cada motor com o de referência (AFN.validate, direto no dicionário).
+Divergências são reduzidas a um contraexemplo mínimo: cadeia mais curta e
+autômato com o menor número de transições e finais que ainda diverge.
+
+Uso: python diferencial.py [--casos N] [--estados N] [--k K] [--processos N]
+"""
+import argparse
+import io
+import json
+import os
+import random
+import sys
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+from afn_afd import AFN
+
+# Geradores compartilhados (pasta comum/)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum import geradores
+
+
+# -------------------------
+# Motores comparados (dados -> função cadeia -> bool)
+# -------------------------
+def _afn(dados, compilar=False):
+    afn = AFN(dados["Q"], dados["Sigma"], {k: set(v) for k, v in dados["delta"].items()}, dados["q0"], dados["F"])
+    if compilar:
+        afn.compile()
+    return afn
+
+
+def _convertido(dados, compilar=False):
+    with redirect_stdout(io.StringIO()):  # convert_to_afd imprime o andamento
+        afd = _afn(dados).convert_to_afd()
+    if compilar:
+        afd.compile()
+    return afd
+
+
+def motor_afn_validate(dados):
+    afn = _afn(dados)
+    return lambda cadeia: afn.validate(cadeia)[0]
+
+
+def motor_afn_accepts(dados):
+    return _afn(dados).accepts
+
+
+def motor_afn_compilado(dados):
+    return _afn(dados, compilar=True).accepts
+
+
+def motor_afd_validate(dados):
+    afd = _convertido(dados)
+    return lambda cadeia: afd.validate(cadeia)[0]
+
+
+def motor_afd_compilado(dados):
+    return _convertido(dados, compilar=True).accepts
+
+
+def motor_afd_minimizado(dados):
+    minimo = _convertido(dados).minimize()
+    minimo.compile()
+    return minimo.accepts
+
+
+# O primeiro é a referência; um motor novo entra aqui (função de módulo, para ir ao pool)
+MOTORES = {
+    "AFN.validate": motor_afn_validate,
+    "AFN.accepts": motor_afn_accepts,
+    "AFN compilado": motor_afn_compilado,
+    "AFD convertido": motor_afd_validate,
+    "AFD convertido compilado": motor_afd_compilado,
+    "AFD minimizado": motor_afd_minimizado,
+}
+
+
+# -------------------------
+# Geração
+# -------------------------
+def afn_aleatorio(rng, estados=5, simbolos=2):
+    """AFN de geradores.afn_aleatorio como dados (Q, Sigma, delta, q0, F), que reduzir() edita."""
+    afn = geradores.afn_aleatorio(estados, simbolos, densidade=1.2, taxa_epsilon=0.15, semente=rng)
+    return {"Q": sorted(afn.Q), "Sigma": sorted(afn.Sigma), "delta": afn.delta, "q0": afn.q0, "F": set(afn.F)}
+
+
+def cadeias(alfabeto, k, amostras=0, comprimento_max=20, rng=None):
+    """Todas as cadeias até o comprimento k, em ordem de tamanho, e depois amostras de k+1 a comprimento_max."""
+    for tamanho in range(k + 1):
+        for letras in product(alfabeto, repeat=tamanho):
+            yield "".join(letras)
+    rng = rng or random.Random(0)
+    for _ in range(amostras if comprimento_max > k else 0):
+        tamanho = rng.randint(k + 1, comprimento_max)
+        yield "".join(rng.choice(alfabeto) for _ in range(tamanho))
+
+
+# -------------------------
+# Comparação e redução
+# -------------------------
+def divergencia(dados, cadeia, motores=None):
+    """Vereditos de cada motor se algum discorda da referência; None se todos concordam."""
+    motores = motores or MOTORES
+    resultados = {}
+    for nome, fabrica in motores.items():
+        try:
+            resultados[nome] = bool(fabrica(dados)(cadeia))
+        except Exception as e:
+            resultados[nome] = f"{type(e).__name__}: {e}"
+    if len(set(resultados.values())) > 1:
+        return resultados
+    return None
+
+
+def reduzir(dados, cadeia, motores=None):
+    """Encolhe cadeia e autômato enquanto a divergência continua (remoção gulosa, até um ponto fixo)."""
+    diverge = lambda d, w: divergencia(d, w, motores) is not None
+
+    mudou = True
+    while mudou:
+        mudou = False
+        for i in range(len(cadeia)):
+            menor = cadeia[:i] + cadeia[i + 1:]
+            if diverge(dados, menor):
+                cadeia, mudou = menor, True
+                break
+
+        for chave in sorted(dados["delta"]):
+            for destino in sorted(dados["delta"].get(chave, ())):
+                delta = {k: set(v) for k, v in dados["delta"].items()}
+                delta[chave].discard(destino)
+                if not delta[chave]:
+                    del delta[chave]
+                candidato = dict(dados, delta=delta)
+                if diverge(candidato, cadeia):
+                    dados, mudou = candidato, True
+
+        for final in sorted(dados["F"]):
+            candidato = dict(dados, F=set(dados["F"]) - {final})
+            if diverge(candidato, cadeia):
+                dados, mudou = candidato, True
+
+    return dados, cadeia
+
+
+def verificar(semente, estados=5, simbolos=2, k=6, amostras=200, comprimento_max=30, motores=None):
+    """Um caso: AFN da semente contra todas as cadeias; devolve o contraexemplo mínimo ou None."""
+    rng = random.Random(semente)
+    dados = afn_aleatorio(rng, estados, simbolos)
+    motores = motores or MOTORES
+    funcoes = {}
+    for nome, fabrica in motores.items():
+        try:
+            funcoes[nome] = fabrica(dados)
+        except Exception as e:
+            return relatorio(semente, dados, "", {nome: f"{type(e).__name__}: {e}"})
+
+    for cadeia in cadeias(dados["Sigma"], k, amostras, comprimento_max, rng):
+        vereditos = set()
+        for funcao in funcoes.values():
+            try:
+                vereditos.add(bool(funcao(cadeia)))
+            except Exception:
+                vereditos.add(None)
+        if len(vereditos) > 1:
+            dados, cadeia = reduzir(dados, cadeia, motores)
+            return relatorio(semente, dados, cadeia, divergencia(dados, cadeia, motores))
+    return None
+
+
+def relatorio(semente, dados, cadeia, resultados):
+    automato = {
+        "Q": dados["Q"], "Sigma": dados["Sigma"], "q0": dados["q0"], "F": sorted(dados["F"]),
+        "delta": {f"{origem},{simbolo}": sorted(destinos) for (origem, simbolo), destinos in sorted(dados["delta"].items())},
+    }
+    return {"semente": semente, "automato": automato, "cadeia": cadeia, "resultados": resultados}
+
+
+def _verificar_argumentos(argumentos):
+    return verificar(*argumentos)
+
+
+def rodar(casos=200, semente=0, estados=5, simbolos=2, k=6, amostras=200, comprimento_max=30, processos=None):
+    """Roda os casos (em paralelo se processos != 1) e devolve a lista de contraexemplos."""
+    argumentos = [(semente + i, estados, simbolos, k, amostras, comprimento_max) for i in range(casos)]
+    if processos == 1:
+        resultados = map(_verificar_argumentos, argumentos)
+        return [r for r in resultados if r is not None]
+    with ProcessPoolExecutor(processos) as pool:
+        return [r for r in pool.map(_verificar_argumentos, argumentos, chunksize=8) if r is not None]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste diferencial AFN x AFD convertido x AFD minimizado")
+    parser.add_argument("--casos", type=int, default=200)
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--estados", type=int, default=5)
+    parser.add_argument("--simbolos", type=int, default=2, help="tamanho do alfabeto (a, b, c, ...)")
+    parser.add_argument("--k", type=int, default=6, help="comprimento máximo das cadeias exaustivas")
+    parser.add_argument("--amostras", type=int, default=200, help="cadeias aleatórias mais longas por caso")
+    parser.add_argument("--comprimento-max", type=int, default=30)
+    parser.add_argument("--processos", type=int, default=None)
+    args = parser.parse_args()
+
+    falhas = rodar(args.casos, args.semente, args.estados, args.simbolos, args.k,
+                   args.amostras, args.comprimento_max, args.processos)
+    for falha in falhas:
+        print(json.dumps(falha, ensure_ascii=False))
+    print(f"{args.casos} casos, {len(falhas)} divergência(s).")
+    raise SystemExit(1 if falhas else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+from afn_afd import AFN
+
+# Sintaxe aceita:
+#   ab      concatenação
+#   a|b     união
+#   a* a+ a?  fecho de Kleene, uma ou mais vezes, opcional
+#   ( )     agrupamento
+#   ε       cadeia vazia (também vale alternativa vazia, ex.: "(a|)")
+#   \x      usa x como símbolo literal (ex.: "\*", "\ ")
+# Espaços sem escape são ignorados.
+
+EPSILON_SYMBOL = "ε"
+
+_LITERAL = "lit"
+_EPSILON = "eps"
+_CONCAT = "."
+_UNION = "|"
+_POSTFIX = {"*", "+", "?"}
+_PRECEDENCE = {_UNION: 1, _CONCAT: 2}
+
+
+def _tokenize(pattern):
+
+    tokens = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            if i + 1 >= len(pattern):
+                raise ValueError("Expressão regular inválida: '\\' no final do padrão.")
+            tokens.append((_LITERAL, pattern[i + 1]))
+            i += 2
+            continue
+        if char.isspace():
+            pass
+        elif char == EPSILON_SYMBOL:
+            tokens.append((_EPSILON, None))
+        elif char in "()|" or char in _POSTFIX:
+            tokens.append((char, None))
+        else:
+            tokens.append((_LITERAL, char))
+        i += 1
+    return tokens
+
+
+def _to_postfix(tokens):
+
+    # Shunting-yard com concatenação implícita; alternativas vazias viram ε.
+    output = []
+    operators = []
+    previous = None
+
+    def push_operator(op):
+        while operators and operators[-1] != "(" and _PRECEDENCE[operators[-1]] >= _PRECEDENCE[op]:
+            output.append((operators.pop(), None))
+        operators.append(op)
+
+    for kind, value in tokens:
+        starts_operand = kind in (_LITERAL, _EPSILON, "(")
+        ends_operand = previous in (_LITERAL, _EPSILON, ")") or previous in _POSTFIX
+
+        if starts_operand and ends_operand:
+            push_operator(_CONCAT)
+
+        if kind in (_LITERAL, _EPSILON):
+            output.append((kind, value))
+        elif kind in _POSTFIX:
+            if not ends_operand:
+                raise ValueError(f"Expressão regular inválida: '{kind}' sem operando.")
+            output.append((kind, None))
+        elif kind == "(":
+            operators.append("(")
+        elif kind == ")":
+            if not ends_operand:
+                output.append((_EPSILON, None))
+            while operators and operators[-1] != "(":
+                output.append((operators.pop(), None))
+            if not operators:
+                raise ValueError("Expressão regular inválida: ')' sem '(' correspondente.")
+            operators.pop()
+        elif kind == _UNION:
+            if not ends_operand:
+                output.append((_EPSILON, None))
+            push_operator(_UNION)
+        previous = kind
+
+    if previous is None or not (previous in (_LITERAL, _EPSILON, ")") or previous in _POSTFIX):
+        output.append((_EPSILON, None))
+
+    while operators:
+        op = operators.pop()
+        if op == "(":
+            raise ValueError("Expressão regular inválida: '(' sem ')' correspondente.")
+        output.append((op, None))
+    return output
+
+
+class _ThompsonBuilder:
+
+    def __init__(self):
+        self.count = 0
+        self.delta = {}
+        self.symbols = set()
+
+    def new_state(self):
+        self.count += 1
+        return self.count - 1
+
+    def add(self, source, symbol, dest):
+        self.delta.setdefault((source, symbol), set()).add(dest)
+
+    def build(self, postfix):
+        # Cada fragmento é (início, aceitação, é_união). Uniões seguidas
+        # reaproveitam o mesmo par início/aceitação, então "a1|a2|...|an"
+        # gera um leque plano em vez de uma cadeia de n níveis de ε.
+        stack = []
+        for kind, value in postfix:
+            if kind in (_LITERAL, _EPSILON):
+                start, accept = self.new_state(), self.new_state()
+                if kind == _LITERAL:
+                    self.symbols.add(value)
+                    self.add(start, value, accept)
+                else:
+                    self.add(start, "epsilon", accept)
+                stack.append((start, accept, False))
+                continue
+
+            if kind in _POSTFIX:
+                inner_start, inner_accept, _ = stack.pop()
+                start, accept = self.new_state(), self.new_state()
+                self.add(start, "epsilon", inner_start)
+                self.add(inner_accept, "epsilon", accept)
+                if kind in ("*", "+"):
+                    self.add(inner_accept, "epsilon", inner_start)
+                if kind in ("*", "?"):
+                    self.add(start, "epsilon", accept)
+                stack.append((start, accept, False))
+                continue
+
+            if len(stack) < 2:
+                raise ValueError("Expressão regular inválida: operador sem operandos suficientes.")
+            right_start, right_accept, _ = stack.pop()
+            left_start, left_accept, left_is_union = stack.pop()
+
+            if kind == _CONCAT:
+                self.add(left_accept, "epsilon", right_start)
+                stack.append((left_start, right_accept, False))
+            elif left_is_union:
+                self.add(left_start, "epsilon", right_start)
+                self.add(right_accept, "epsilon", left_accept)
+                stack.append((left_start, left_accept, True))
+            else:
+                start, accept = self.new_state(), self.new_state()
+                for branch_start, branch_accept in ((left_start, left_accept), (right_start, right_accept)):
+                    self.add(start, "epsilon", branch_start)
+                    self.add(branch_accept, "epsilon", accept)
+                stack.append((start, accept, True))
+
+        if len(stack) != 1:
+            raise ValueError("Expressão regular inválida.")
+        start, accept, _ = stack[0]
+        return start, accept
+
+
+def regex_to_afn(pattern, Sigma=None):
+
+    builder = _ThompsonBuilder()
+    start, accept = builder.build(_to_postfix(_tokenize(pattern)))
+
+    def name(state):
+        return f"q{state}"
+
+    delta = {
+        (name(source), symbol): {name(dest) for dest in dests}
+        for (source, symbol), dests in builder.delta.items()
+    }
+    Q = {name(state) for state in range(builder.count)}
+    alphabet = set(builder.symbols) | set(Sigma or ())
+    return AFN(Q, alphabet, delta, name(start), {name(accept)})
+
+
+def regex_to_afd(pattern, Sigma=None, minimize=True):
+
+    afd = regex_to_afn(pattern, Sigma).convert_to_afd()
+    return afd.minimize() if minimize else afd
@@ -0,0 +1,168 @@
+import io
+from collections import deque
+from contextlib import redirect_stdout
+
+from afn_afd import AFD, CompiledDelta
+
+# Operações sobre linguagens regulares. AFNs são convertidos para AFD antes do
+# produto; os produtos trabalham sobre a forma compilada (índices inteiros,
+# -1 = armadilha) e só visitam os pares alcançáveis a partir do inicial.
+
+TRAP_NAME = "Ø"
+
+
+def _compiled_afd(automaton):
+    # Não mexe no autômato de quem chamou: usa a forma compilada só se ele já
+    # a tiver, senão compila uma cópia local
+    if automaton.tipo == "AFN":
+        with redirect_stdout(io.StringIO()):  # convert_to_afd imprime o andamento
+            automaton = automaton.convert_to_afd()
+    if automaton.compiled is not None:
+        return automaton.compiled
+    return CompiledDelta(automaton, deterministic=True)
+
+
+def _explore_product(a, b, accept, Sigma=None, stop_on_accept=False):
+    # BFS sobre pares (estado de a, estado de b). Com stop_on_accept, devolve a
+    # menor cadeia que leva a um par aceito (ou None); senão devolve o grafo
+    # de pares (pares, transições, aceitos).
+    ca = _compiled_afd(a)
+    cb = _compiled_afd(b)
+    symbols = sorted(set(ca.symbols) | set(cb.symbols) | set(Sigma or ()))
+    columns = [(ca.symbol_index.get(symbol, -1), cb.symbol_index.get(symbol, -1)) for symbol in symbols]
+    keep_trap = accept(False, False)
+
+    def is_final(compiled, state):
+        return state >= 0 and bool(compiled.final[state])
+
+    start = (ca.start, cb.start)
+    index = {start: 0}
+    pairs = [start]
+    parents = [(-1, None)]
+    transitions = []
+    accepted = set()
+    queue = deque([0])
+
+    while queue:
+        current = queue.popleft()
+        p, q = pairs[current]
+
+        if accept(is_final(ca, p), is_final(cb, q)):
+            if stop_on_accept:
+                word = []
+                while parents[current][0] >= 0:
+                    current, symbol = parents[current]
+                    word.append(symbol)
+                return "".join(reversed(word))
+            accepted.add(current)
+
+        for symbol, (col_a, col_b) in zip(symbols, columns):
+            next_p = ca.table[p * ca.width + col_a] if p >= 0 and col_a >= 0 else -1
+            next_q = cb.table[q * cb.width + col_b] if q >= 0 and col_b >= 0 else -1
+            if next_p < 0 and next_q < 0 and not keep_trap:
+                continue
+
+            pair = (next_p, next_q)
+            target = index.get(pair)
+            if target is None:
+                target = len(pairs)
+                index[pair] = target
+                pairs.append(pair)
+                parents.append((current, symbol))
+                queue.append(target)
+            transitions.append((current, symbol, target))
+
+    if stop_on_accept:
+        return None
+    return (ca, cb, symbols), pairs, transitions, accepted
+
+
+def product(a, b, accept, Sigma=None):
+
+    (ca, cb, symbols), pairs, transitions, accepted = _explore_product(a, b, accept, Sigma)
+
+    def name(compiled, state):
+        return compiled.states[state] if state >= 0 else TRAP_NAME
+
+    names = [f"({name(ca, p)},{name(cb, q)})" for p, q in pairs]
+    delta = {(names[source], symbol): names[target] for source, symbol, target in transitions}
+    return AFD(set(names), symbols, delta, names[0], {names[i] for i in accepted})
+
+
+def union(a, b):
+
+    return product(a, b, lambda x, y: x or y)
+
+
+def intersection(a, b):
+
+    return product(a, b, lambda x, y: x and y)
+
+
+def difference(a, b):
+
+    return product(a, b, lambda x, y: x and not y)
+
+
+def symmetric_difference(a, b):
+
+    return product(a, b, lambda x, y: x != y)
+
+
+def complement(a, Sigma=None):
+
+    compiled = _compiled_afd(a)
+    symbols = sorted(set(compiled.symbols) | set(Sigma or ()))
+    columns = [compiled.symbol_index.get(symbol, -1) for symbol in symbols]
+
+    def name(state):
+        return compiled.states[state] if state >= 0 else TRAP_NAME
+
+    seen = {compiled.start}
+    queue = deque([compiled.start])
+    delta = {}
+    while queue:
+        state = queue.popleft()
+        for symbol, column in zip(symbols, columns):
+            target = compiled.table[state * compiled.width + column] if state >= 0 and column >= 0 else -1
+            delta[(name(state), symbol)] = name(target)
+            if target not in seen:
+                seen.add(target)
+                queue.append(target)
+
+    F = {name(state) for state in seen if state < 0 or not compiled.final[state]}
+    return AFD({name(state) for state in seen}, symbols, delta, name(compiled.start), F)
+
+
+def shortest_accepted(automaton):
+    # Menor cadeia aceita (BFS sobre o AFD), ou None se a linguagem é vazia.
+    return _explore_product(automaton, automaton, lambda x, y: x, stop_on_accept=True)
+
+
+def is_empty(automaton):
+    # Alcançabilidade direto no grafo de delta: não precisa determinizar.
+    seen = {automaton.q0}
+    stack = [automaton.q0]
+    successors = {}
+    for (state, _), dest in automaton.delta.items():
+        successors.setdefault(state, []).extend(dest if isinstance(dest, set) else (dest,))
+
+    while stack:
+        state = stack.pop()
+        if state in automaton.F:
+            return False
+        for dest in successors.get(state, ()):
+            if dest not in seen:
+                seen.add(dest)
+                stack.append(dest)
+    return True
+
+
+def counterexample(a, b):
+    # Menor cadeia aceita por exatamente um dos dois, ou None se equivalentes.
+    return _explore_product(a, b, lambda x, y: x != y, stop_on_accept=True)
+
+
+def equivalent(a, b):
+
+    return counterexample(a, b) is None
@@ -0,0 +1,116 @@
+from collections import deque
+
+from afn_afd import AFD
+
+
+class KeywordAFD(AFD):
+    # AFD de Aho–Corasick: as ligações de falha já estão embutidas em delta,
+    # então cada símbolo da entrada custa exatamente uma transição.
+    # validate/accepts aceitam as cadeias que terminam em alguma palavra-chave;
+    # como em scan, um símbolo fora do alfabeto das palavras volta à raiz.
+
+    def __init__(self, Q, Sigma, delta, q0, F, rows, ends, output_links):
+        super().__init__(Q, Sigma, delta, q0, F)
+        self._rows = rows
+        self._ends = ends
+        self._output_links = output_links
+
+    def _is_final(self, state):
+
+        return self._ends[state] is not None or self._output_links[state] >= 0
+
+    def validate(self, input_string):
+
+        rows = self._rows
+        state = 0
+        path = ["q0"]
+        for symbol in input_string:
+            state = rows[state].get(symbol, 0)
+            path.append(f"q{state}")
+        return self._is_final(state), path, f"Processamento concluído. Estado final: q{state}."
+
+    def accepts(self, input_string):
+
+        rows = self._rows
+        state = 0
+        for symbol in input_string:
+            state = rows[state].get(symbol, 0)
+        return self._is_final(state)
+
+    def scan(self, text):
+        # Gera (posição inicial, palavra) para toda ocorrência, em uma única passada.
+        rows = self._rows
+        ends = self._ends
+        output_links = self._output_links
+        state = 0
+
+        for position, symbol in enumerate(text):
+            state = rows[state].get(symbol, 0)
+            match = state if ends[state] is not None else output_links[state]
+            while match >= 0:
+                keyword = ends[match]
+                yield position - len(keyword) + 1, keyword
+                match = output_links[match]
+
+    def matches(self, text):
+
+        return {keyword for _, keyword in self.scan(text)}
+
+
+def build_keyword_afd(keywords, Sigma=None):
+
+    keywords = list(dict.fromkeys(keywords))
+    if any(keyword == "" for keyword in keywords):
+        raise ValueError("Palavra-chave vazia não é permitida.")
+
+    alphabet = set(Sigma or ())
+    for keyword in keywords:
+        alphabet.update(keyword)
+
+    # Trie
+    goto = [{}]
+    ends = [None]
+    for keyword in keywords:
+        state = 0
+        for symbol in keyword:
+            next_state = goto[state].get(symbol)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][symbol] = next_state
+                goto.append({})
+                ends.append(None)
+            state = next_state
+        ends[state] = keyword
+
+    # Ligações de falha em BFS; a linha completa de cada estado copia a do
+    # estado de falha e sobrescreve os filhos da trie.
+    count = len(goto)
+    fail = [0] * count
+    output_links = [-1] * count
+    rows = [None] * count
+    rows[0] = {symbol: goto[0].get(symbol, 0) for symbol in alphabet}
+
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        failure = fail[state]
+        output_links[state] = failure if ends[failure] is not None else output_links[failure]
+
+        row = dict(rows[failure])
+        for symbol, child in goto[state].items():
+            fail[child] = rows[failure][symbol]
+            row[symbol] = child
+            queue.append(child)
+        rows[state] = row
+
+    def name(state):
+        return f"q{state}"
+
+    Q = {name(state) for state in range(count)}
+    delta = {
+        (name(state), symbol): name(dest)
+        for state, row in enumerate(rows)
+        for symbol, dest in row.items()
+    }
+    F = {name(state) for state in range(count) if ends[state] is not None or output_links[state] >= 0}
+    return KeywordAFD(Q, alphabet, delta, name(0), F, rows, ends, output_links)
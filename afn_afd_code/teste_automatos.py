@@ -1,6 +1,14 @@
+import io
+import time
 import unittest
+from contextlib import redirect_stdout
+from itertools import product
 try:
     from afn_afd import AFD, AFN, PREDEFINED_AUTOMATA
+    from expressao_regular import regex_to_afn, regex_to_afd
+    from palavras_chave import build_keyword_afd
+    import operacoes
+    import diferencial
 except ImportError:
     raise ImportError("se esse erro aparecer, eh pq nao ta na mesma pasta, verificar isso")
 
@@ -109,6 +117,225 @@ class TestAutomatonValidation(unittest.TestCase):
             with self.subTest(cadeia=cadeia, tipo="AFD Convertido (Rejeita)"):
                 self.assertFalse(afd_convertido.validate(cadeia)[0], f"AFD Convertido deveria rejeitar: '{cadeia}'")
 
+    def test_accepts_igual_validate(self):
+        for nome, automato in self.automata.items():
+            simbolos = sorted(automato.Sigma) + ["a"]
+            for tamanho in range(5):
+                for letras in product(simbolos, repeat=tamanho):
+                    cadeia = "".join(letras)
+                    with self.subTest(automato=nome, cadeia=cadeia):
+                        self.assertEqual(automato.accepts(cadeia), automato.validate(cadeia)[0])
+
+    def test_minimizacao_afd_2(self):
+        afd = self.automata["afd_2"]
+        minimo = afd.minimize()
+        self.assertEqual(len(minimo.Q), 3)
+        for tamanho in range(6):
+            for letras in product("01", repeat=tamanho):
+                cadeia = "".join(letras)
+                with self.subTest(cadeia=cadeia):
+                    self.assertEqual(minimo.accepts(cadeia), afd.accepts(cadeia))
+
+    def test_linha_da_tabela_sob_demanda(self):
+        for nome, automato in self.automata.items():
+            automato.compile()
+            cabecalho = automato.get_transition_table_header()
+            linhas = automato.get_transition_table_str().splitlines()[2:]
+            with self.subTest(automato=nome):
+                self.assertEqual(linhas, ["\t".join(automato.get_transition_table_row(q, cabecalho)) for q in sorted(automato.Q)])
+
+    def test_forma_compilada_igual_dicionario(self):
+        for nome, automato in self.automata.items():
+            tabela = automato.get_transition_table_str()
+            simbolos = sorted(automato.Sigma) + ["a"]
+            cadeias = ["".join(letras) for tamanho in range(5) for letras in product(simbolos, repeat=tamanho)]
+            resultados = [automato.validate(cadeia) for cadeia in cadeias]
+
+            automato.compile()
+            with self.subTest(automato=nome):
+                self.assertEqual(automato.get_transition_table_str(), tabela)
+            for cadeia, resultado in zip(cadeias, resultados):
+                with self.subTest(automato=nome, cadeia=cadeia):
+                    self.assertEqual(automato.accepts(cadeia), resultado[0])
+                    if automato.tipo == "AFD":
+                        self.assertEqual(automato.validate(cadeia), resultado)
+
+    def test_conversao_compilada_igual_conjuntos(self):
+        afn = self.automata["afn_2"]
+        afd = afn.convert_to_afd()
+        self.assertEqual(afd.q0, afn._set_to_state_name(afn.epsilon_closure({afn.q0})))
+        for (estado, simbolo), destino in afd.delta.items():
+            origem = set(estado.strip("{}").split(","))
+            esperado = afn.epsilon_closure(afn.move(origem, simbolo))
+            with self.subTest(estado=estado, simbolo=simbolo):
+                self.assertEqual(destino, afn._set_to_state_name(esperado))
+
+        afn.compile()
+        compilado = afn.convert_to_afd()
+        self.assertEqual((compilado.Q, compilado.delta, compilado.q0, compilado.F),
+                         (afd.Q, afd.delta, afd.q0, afd.F))
+
+class TestExpressaoRegular(unittest.TestCase):
+
+    def assertMesmaLinguagem(self, automato, referencia, simbolos, tamanho_max=5):
+        for tamanho in range(tamanho_max + 1):
+            for letras in product(simbolos, repeat=tamanho):
+                cadeia = "".join(letras)
+                with self.subTest(cadeia=cadeia):
+                    self.assertEqual(automato.accepts(cadeia), referencia.accepts(cadeia))
+
+    def test_regex_igual_afd_predefinido(self):
+        dados = PREDEFINED_AUTOMATA["AFD: L = 0(0|1)*1"]
+        afd = AFD(dados["Q"], dados["Sigma"], dados["delta"], dados["q0"], dados["F"])
+        self.assertMesmaLinguagem(regex_to_afn("0(0|1)*1"), afd, "01")
+
+        minimo = regex_to_afd("0(0|1)*1")
+        self.assertEqual(len(minimo.Q), 3)
+        self.assertMesmaLinguagem(minimo, afd, "01")
+
+    def test_regex_igual_afn_predefinido(self):
+        dados = PREDEFINED_AUTOMATA["AFN (com ε): L = 0*1*2* "]
+        afn = AFN(dados["Q"], dados["Sigma"], dados["delta"], dados["q0"], dados["F"])
+        self.assertMesmaLinguagem(regex_to_afd("0*1*2*"), afn, "012")
+
+    def test_regex_operadores(self):
+        afn = regex_to_afn("(ab|ε)+c?|\\*")
+        for cadeia in ["", "ab", "abab", "abc", "c", "*"]:
+            with self.subTest(cadeia=cadeia):
+                self.assertTrue(afn.accepts(cadeia))
+        for cadeia in ["a", "abca", "cc", "**"]:
+            with self.subTest(cadeia=cadeia):
+                self.assertFalse(afn.accepts(cadeia))
+
+    def test_regex_muitas_alternativas(self):
+        palavras = [format(i, "b") + "x" for i in range(3000)]
+        afn = regex_to_afn("|".join(palavras))
+        self.assertTrue(afn.accepts(palavras[1234]))
+        self.assertFalse(afn.accepts("x1"))
+
+    def test_regex_to_afd_muitas_alternativas(self):
+        # A conversão tem de crescer com o número de transições, não com estados² · |Σ|
+        palavras = [format(i, "b") + "x" for i in range(4000)]
+        inicio = time.perf_counter()
+        with redirect_stdout(io.StringIO()):  # convert_to_afd imprime o andamento
+            afd = regex_to_afd("|".join(palavras))
+        self.assertLess(time.perf_counter() - inicio, 10)
+        self.assertLessEqual(len(afd.Q), 2 * len(format(4000, "b")))
+        self.assertTrue(afd.accepts(palavras[3999]))
+        self.assertFalse(afd.accepts(format(4000, "b") + "x"))
+
+    def test_regex_invalida(self):
+        for padrao in ["(a", "a)", "*a", "a\\"]:
+            with self.subTest(padrao=padrao):
+                with self.assertRaises(ValueError):
+                    regex_to_afn(padrao)
+
+class TestPalavrasChave(unittest.TestCase):
+
+    def test_scan_encontra_todas_ocorrencias(self):
+        afd = build_keyword_afd(["he", "she", "his", "hers"])
+        self.assertEqual(
+            sorted(afd.scan("ushers")),
+            [(1, "she"), (2, "he"), (2, "hers")]
+        )
+
+    def test_scan_igual_busca_ingenua(self):
+        palavras = ["ab", "b", "abc", "bca", "cab", "aa"]
+        afd = build_keyword_afd(palavras)
+        texto = "aabcabcaabxbca"
+        esperado = sorted(
+            (i, p) for p in palavras for i in range(len(texto)) if texto.startswith(p, i)
+        )
+        self.assertEqual(sorted(afd.scan(texto)), esperado)
+        self.assertEqual(afd.matches("xxbca"), {"b", "bca"})
+
+    def test_validate_aceita_sufixo_palavra(self):
+        afd = build_keyword_afd(["01", "110"])
+        for cadeia in ["01", "0001", "1110", "0110"]:
+            with self.subTest(cadeia=cadeia):
+                self.assertTrue(afd.validate(cadeia)[0])
+                self.assertTrue(afd.accepts(cadeia))
+        for cadeia in ["", "0", "011", "1100"]:
+            with self.subTest(cadeia=cadeia):
+                self.assertFalse(afd.accepts(cadeia))
+
+    def test_simbolo_fora_do_alfabeto_volta_a_raiz(self):
+        afd = build_keyword_afd(["he", "she"])
+        self.assertEqual(afd.matches("xshe"), {"he", "she"})
+        for cadeia in ["xshe", "shxhe", "x he"]:
+            with self.subTest(cadeia=cadeia):
+                self.assertTrue(afd.accepts(cadeia))
+                self.assertTrue(afd.validate(cadeia)[0])
+        for cadeia in ["hex", "x", "shx"]:
+            with self.subTest(cadeia=cadeia):
+                self.assertFalse(afd.accepts(cadeia))
+                self.assertFalse(afd.validate(cadeia)[0])
+
+    def test_palavra_vazia_invalida(self):
+        with self.assertRaises(ValueError):
+            build_keyword_afd(["a", ""])
+
+class TestOperacoes(unittest.TestCase):
+
+    def setUp(self):
+        dados = PREDEFINED_AUTOMATA["AFD: L = 0(0|1)*1"]
+        self.termina_em_1 = AFD(dados["Q"], dados["Sigma"], dados["delta"], dados["q0"], dados["F"])
+        self.par_de_zeros = regex_to_afd("(1*01*0)*1*")
+        self.cadeias = ["".join(letras) for tamanho in range(6) for letras in product("01", repeat=tamanho)]
+
+    def test_operacoes_booleanas(self):
+        a, b = self.termina_em_1, self.par_de_zeros
+        uniao = operacoes.union(a, b)
+        intersecao = operacoes.intersection(a, b)
+        diferenca = operacoes.difference(a, b)
+        complemento = operacoes.complement(a)
+        for cadeia in self.cadeias:
+            x, y = a.accepts(cadeia), b.accepts(cadeia)
+            with self.subTest(cadeia=cadeia):
+                self.assertEqual(uniao.accepts(cadeia), x or y)
+                self.assertEqual(intersecao.accepts(cadeia), x and y)
+                self.assertEqual(diferenca.accepts(cadeia), x and not y)
+                self.assertEqual(complemento.accepts(cadeia), not x)
+
+    def test_vazio_e_equivalencia(self):
+        a = self.termina_em_1
+        self.assertTrue(operacoes.is_empty(operacoes.intersection(a, operacoes.complement(a))))
+        self.assertFalse(operacoes.is_empty(a))
+        self.assertTrue(operacoes.equivalent(a, regex_to_afn("0(0|1)*1")))
+        self.assertTrue(operacoes.equivalent(a, a.minimize()))
+        self.assertEqual(operacoes.shortest_accepted(a), "01")
+
+    def test_contraexemplo_minimo(self):
+        self.assertEqual(operacoes.counterexample(self.termina_em_1, regex_to_afn("0(0|1)*")), "0")
+        self.assertIsNone(operacoes.counterexample(self.par_de_zeros, regex_to_afn("1*(01*01*)*")))
+
+    def test_operacoes_nao_alteram_os_argumentos(self):
+        a = self.termina_em_1
+        saida = io.StringIO()
+        with redirect_stdout(saida):
+            operacoes.equivalent(a, regex_to_afn("0(0|1)*1"))
+            operacoes.union(a, self.par_de_zeros)
+        self.assertIsNone(a.compiled)
+        self.assertEqual(saida.getvalue(), "")
+
+def motor_quebrado(dados):
+    # Erra de propósito toda cadeia com "bb"
+    certo = diferencial.motor_afn_validate(dados)
+    return lambda cadeia: certo(cadeia) != ("bb" in cadeia)
+
+class TestDiferencial(unittest.TestCase):
+
+    def test_motores_concordam(self):
+        self.assertEqual(diferencial.rodar(casos=15, k=4, amostras=20, processos=1), [])
+
+    def test_contraexemplo_minimo(self):
+        motores = dict(diferencial.MOTORES, quebrado=motor_quebrado)
+        falha = diferencial.verificar(3, k=5, amostras=0, motores=motores)
+        self.assertEqual(falha["cadeia"], "bb")
+        self.assertNotEqual(falha["resultados"]["quebrado"], falha["resultados"]["AFN.validate"])
+        # Sem transições nem finais a divergência continua: o autômato reduzido fica vazio
+        self.assertEqual((falha["automato"]["delta"], falha["automato"]["F"]), ({}, []))
+
 if __name__ == '__main__':
     unittest.main()
     
@@ -0,0 +1,5 @@
+"""
+Código compartilhado pelos simuladores (AFD/AFN, autômato a pilha e máquina
+de Turing). Os scripts de cada pasta importam daqui com a raiz do projeto no
+sys.path, por exemplo: from comum.formato import carregar, salvar
+"""
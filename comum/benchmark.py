@@ -0,0 +1,295 @@
+"""
+Benchmarks de desempenho dos simuladores, com linhas de base em JSON por
+commit. Cada caso mede a vazão (unidades por segundo: símbolos lidos, passos
+da MT ou conversões) numa grade de parâmetros: tamanho do autômato, tamanho
+do alfabeto e comprimento da entrada.
+
+    python benchmark.py                  # roda e compara com a base do ancestral mais próximo
+    python benchmark.py --salvar         # grava benchmarks/<commit>.json
+    python benchmark.py --base abc1234   # compara com um commit específico
+    python benchmark.py --rapido         # grade menor
+
+Sai com código 1 se algum caso ficar mais lento que a base além do limiar.
+"""
+import argparse
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from contextlib import redirect_stdout
+from itertools import product
+
+try:
+    from . import geradores
+    from .formato import RAIZ, usar_pasta
+except ImportError:
+    import geradores
+    from formato import RAIZ, usar_pasta
+
+PASTA_BASELINES = os.path.join(RAIZ, "benchmarks")
+LIMIAR = 0.20           # queda de vazão tolerada (20%)
+MAX_ANCESTRAIS = 1000   # commits percorridos atrás de uma linha de base
+REPETICOES = 5          # mede várias vezes e fica com a melhor
+TEMPO_MINIMO = 0.05     # cada medida repete a carga até durar pelo menos isso (s)
+
+
+# -------------------------
+# Cargas de trabalho: parâmetros -> (função sem argumentos, unidades por chamada)
+# -------------------------
+def _afd(estados, simbolos, rng):
+    afd = geradores.afd_aleatorio(estados, simbolos, taxa_finais=0.5, semente=rng)
+    afd.compile()
+    return afd
+
+
+def _afn(estados, simbolos, rng, densidade=2.0):
+    afn = geradores.afn_aleatorio(estados, simbolos, densidade, taxa_epsilon=0.1 / estados,
+                                  taxa_finais=0.2, semente=rng)
+    afn.compile()
+    return afn
+
+
+def carga_afd_validate(estados, simbolos, comprimento, rng):
+    afd = _afd(estados, simbolos, rng)
+    w = geradores.entrada_aleatoria(afd.Sigma, comprimento, rng)
+    return lambda: afd.validate(w), comprimento
+
+
+def carga_afd_accepts(estados, simbolos, comprimento, rng):
+    afd = _afd(estados, simbolos, rng)
+    w = geradores.entrada_aleatoria(afd.Sigma, comprimento, rng)
+    return lambda: afd.accepts(w), comprimento
+
+
+def carga_afn_validate(estados, simbolos, comprimento, rng):
+    afn = _afn(estados, simbolos, rng)
+    w = geradores.entrada_aleatoria(afn.Sigma, comprimento, rng)
+    return lambda: afn.validate(w), comprimento
+
+
+def carga_afn_accepts(estados, simbolos, comprimento, rng):
+    afn = _afn(estados, simbolos, rng)
+    w = geradores.entrada_aleatoria(afn.Sigma, comprimento, rng)
+    return lambda: afn.accepts(w), comprimento
+
+
+def _conversao(afn):
+    # comprimento não se aplica; a unidade é uma conversão
+    def converter():
+        afn.compile()  # a compilação faz parte da conversão
+        with redirect_stdout(io.StringIO()):  # convert_to_afd imprime o andamento
+            afn.convert_to_afd()
+    return converter, 1
+
+
+def carga_afn_convert(estados, simbolos, comprimento, rng):
+    return _conversao(_afn(estados, simbolos, rng, densidade=1.0))
+
+
+def carga_afn_convert_explosivo(estados, simbolos, comprimento, rng):
+    # estados = n do AFN "n-ésimo símbolo do fim é a": o AFD tem 2^n estados
+    return _conversao(geradores.afn_explosivo(estados, simbolos))
+
+
+def carga_pda_palindromo(estados, simbolos, comprimento, rng):
+    # Pior caso da busca: o meio da palavra é um palpite (o autômato tem sempre 3 estados)
+    ap = geradores.ap_palindromo(simbolos)
+    metade = geradores.entrada_aleatoria(geradores.alfabeto(simbolos), comprimento // 2, rng)
+    w = metade + metade[::-1]
+    return lambda: ap.simular(w), len(w)
+
+
+def carga_pda_ambiguo(estados, simbolos, comprimento, rng):
+    # a^n b^m com n <= m <= 2n: 2^n caminhos até a aceitação
+    ap = geradores.ap_ambiguo()
+    n = comprimento // 3
+    w = "a" * n + "b" * (comprimento - n)
+    return lambda: ap.simular(w), len(w)
+
+
+def _carga_mt(mt, entrada, passos):
+    usar_pasta("MT")
+    from simulador import SimuladorTM
+    mt.compile()
+    sim = SimuladorTM(mt, timeout_steps=passos + 1)
+
+    def executar():
+        sim.reset(entrada)
+        while sim.step() is not None:
+            pass
+        return sim.step_count
+
+    return executar, passos
+
+
+def carga_mt_contador(estados, simbolos, comprimento, rng):
+    # Contador binário de comprimento bits: a unidade é um passo da máquina
+    return _carga_mt(geradores.mt_contador(), "0" * comprimento, geradores.passos_contador(comprimento))
+
+
+def carga_mt_busy_beaver(estados, simbolos, comprimento, rng):
+    passos, _ = geradores.BUSY_BEAVER[estados]
+    return _carga_mt(geradores.mt_busy_beaver(estados), "", passos)
+
+
+# nome -> (carga, grade de (estados, símbolos, comprimento), grade rápida)
+CASOS = {
+    "AFD.validate": (carga_afd_validate, product((10, 1000), (2, 8), (1000, 10000)), [(10, 2, 1000)]),
+    "AFD.accepts": (carga_afd_accepts, product((10, 1000), (2, 8), (1000, 10000)), [(10, 2, 1000)]),
+    "AFN.validate": (carga_afn_validate, product((10, 100), (2, 8), (1000,)), [(10, 2, 200)]),
+    "AFN.accepts": (carga_afn_accepts, product((10, 100), (2, 8), (1000,)), [(10, 2, 200)]),
+    "AFN.convert_to_afd": (carga_afn_convert, product((8, 14), (2, 4), (0,)), [(8, 2, 0)]),
+    "AFN.convert_to_afd explosivo": (carga_afn_convert_explosivo, product((8, 12), (2,), (0,)), [(6, 2, 0)]),
+    "PDA.simular palindromo": (carga_pda_palindromo, product((3,), (2, 4), (50, 200)), [(3, 2, 50)]),
+    "PDA.simular ambiguo": (carga_pda_ambiguo, product((3,), (2,), (30, 90)), [(3, 2, 30)]),
+    "SimuladorTM contador": (carga_mt_contador, product((4,), (2,), (8, 12)), [(4, 2, 6)]),
+    "SimuladorTM busy beaver": (carga_mt_busy_beaver, [(4, 2, 0)], [(4, 2, 0)]),
+}
+CASOS = {nome: (carga, list(grade), rapida) for nome, (carga, grade, rapida) in CASOS.items()}
+
+
+# -------------------------
+# Medição
+# -------------------------
+def medir(funcao, unidades, repeticoes=REPETICOES):
+    """Vazão em unidades/s: melhor de várias medidas, cada uma repetindo a carga por TEMPO_MINIMO."""
+    vezes = 1
+    while True:
+        inicio = time.perf_counter()
+        for _ in range(vezes):
+            funcao()
+        tempo = time.perf_counter() - inicio
+        if tempo >= TEMPO_MINIMO:
+            break
+        vezes *= 2
+
+    melhor = tempo
+    for _ in range(repeticoes - 1):
+        inicio = time.perf_counter()
+        for _ in range(vezes):
+            funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return unidades * vezes / melhor
+
+
+def rodar(rapido=False, filtro=None, semente=0, repeticoes=REPETICOES):
+    """Mede todos os casos; devolve {"<caso>[estados,símbolos,comprimento]": vazão}."""
+    resultados = {}
+    for nome, (carga, grade, rapida) in CASOS.items():
+        if filtro and filtro not in nome:
+            continue
+        for parametros in (rapida if rapido else grade):
+            funcao, unidades = carga(*parametros, random.Random(semente))
+            chave = f"{nome}[{','.join(map(str, parametros))}]"
+            resultados[chave] = medir(funcao, unidades, repeticoes)
+    return resultados
+
+
+# -------------------------
+# Linhas de base
+# -------------------------
+def commit_atual():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        sujo = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=RAIZ,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "sem-git"
+    return commit + ("-sujo" if sujo else "")
+
+
+def salvar_base(resultados, commit, pasta=PASTA_BASELINES):
+    os.makedirs(pasta, exist_ok=True)
+    caminho = os.path.join(pasta, f"{commit}.json")
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump({"commit": commit, "data": time.strftime("%Y-%m-%d %H:%M:%S"),
+                   "python": sys.version.split()[0], "resultados": resultados}, f, indent=2, sort_keys=True)
+    return caminho
+
+
+def ancestrais(limite=MAX_ANCESTRAIS):
+    """Hashes completos de HEAD para trás (HEAD primeiro); None sem git."""
+    try:
+        saida = subprocess.run(["git", "rev-list", f"--max-count={limite}", "HEAD"], cwd=RAIZ,
+                               capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return saida.split()
+
+
+def carregar_base(commit=None, pasta=PASTA_BASELINES, excluir=None):
+    """
+    Base de um commit ou, sem commit, a do ancestral mais próximo de HEAD que
+    tenha uma (fora excluir); sem git, a gravada por último. None se não houver.
+    """
+    if commit:
+        caminho = os.path.join(pasta, f"{commit}.json")
+    else:
+        if not os.path.isdir(pasta):
+            return None
+        nomes = [a[:-len(".json")] for a in os.listdir(pasta)
+                 if a.endswith(".json") and a != f"{excluir}.json"]
+        if not nomes:
+            return None
+        commits = ancestrais()
+        if commits is None:
+            nome = max(nomes, key=lambda n: os.path.getmtime(os.path.join(pasta, f"{n}.json")))
+        else:
+            # Os arquivos têm o hash curto; bases "-sujo" não são de um commit e ficam de fora
+            nome = next((n for c in commits for n in nomes if c.startswith(n)), None)
+            if nome is None:
+                return None
+        caminho = os.path.join(pasta, f"{nome}.json")
+    with open(caminho, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def comparar(resultados, base, limiar=LIMIAR):
+    """Lista de (caso, vazão da base, vazão atual) dos casos que caíram mais que o limiar."""
+    regressoes = []
+    for chave, atual in sorted(resultados.items()):
+        anterior = base["resultados"].get(chave)
+        if anterior and atual < anterior * (1 - limiar):
+            regressoes.append((chave, anterior, atual))
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks dos simuladores com linhas de base por commit")
+    parser.add_argument("--rapido", action="store_true", help="grade reduzida")
+    parser.add_argument("--filtro", help="só casos cujo nome contém este texto")
+    parser.add_argument("--salvar", action="store_true", help="grava a linha de base do commit atual")
+    parser.add_argument("--base", help="commit da linha de base para comparar (padrão: a do ancestral mais próximo)")
+    parser.add_argument("--limiar", type=float, default=LIMIAR, help="queda de vazão tolerada (fração)")
+    parser.add_argument("--repeticoes", type=int, default=REPETICOES)
+    args = parser.parse_args()
+
+    commit = commit_atual()
+    resultados = rodar(args.rapido, args.filtro, repeticoes=args.repeticoes)
+    base = carregar_base(args.base, excluir=commit)
+
+    for chave, vazao in resultados.items():
+        anterior = base["resultados"].get(chave) if base else None
+        variacao = f"  ({(vazao / anterior - 1) * 100:+.1f}%)" if anterior else ""
+        print(f"{chave:45s} {vazao:14,.0f}/s{variacao}")
+
+    if args.salvar:
+        print(f"Linha de base salva em {salvar_base(resultados, commit)}")
+
+    if base is None:
+        print("Sem linha de base para comparar.")
+        return
+    regressoes = comparar(resultados, base, args.limiar)
+    for chave, anterior, atual in regressoes:
+        print(f"REGRESSÃO {chave}: {anterior:,.0f}/s -> {atual:,.0f}/s (base {base['commit']})")
+    if regressoes:
+        raise SystemExit(1)
+    print(f"Sem regressões em relação a {base['commit']} (limiar {args.limiar:.0%}).")
+
+
+if __name__ == "__main__":
+    main()
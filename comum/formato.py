@@ -0,0 +1,302 @@
+"""
+Formato único de troca (JSON versionado) para AFD/AFN, autômato a pilha e
+máquina de Turing, leitura dos formatos antigos de cada módulo e cache em
+disco da forma compilada, indexado pelo hash do conteúdo do arquivo.
+
+Versão 1:
+    {"formato": "automatos", "versao": 1, "tipo": "AFD" | "AFN" | "AP" | "MT",
+     "estados": [...], "inicial": "q0", "finais": [...], "transicoes": [...]}
+  AFD/AFN: "alfabeto" e transições {"origem", "simbolo", "destino"}; no AFN,
+           símbolo "ε" para transição vazia e uma entrada por destino.
+  AP:      transições {"origem", "destino", "entrada", "pilha", "empilha"}.
+  MT:      "alfabeto", "alfabeto_fita", "branco", "rejeicao" e transições
+           {"origem", "le", "destino", "escreve", "move"}; finais = aceitação.
+"""
+import hashlib
+import json
+import os
+import pickle
+import sys
+
+FORMATO = "automatos"
+VERSAO = 1
+# Versão da forma compilada que vai para o cache (CompiledDelta, índices do
+# PDA, tabela da MT). Suba sempre que esse layout mudar: o pickle antigo
+# ainda carregaria, mas com atributos que o código novo não usa mais.
+VERSAO_COMPILADA = 2
+TIPOS = ("AFD", "AFN", "AP", "MT")
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASTAS = {"AFD": "afn_afd_code", "AFN": "afn_afd_code", "AP": "Automato-à-pilha", "MT": "MT"}
+
+# Pode ser trocada pela variável de ambiente AUTOMATOS_CACHE
+PASTA_CACHE = os.environ.get("AUTOMATOS_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "automatos"))
+
+
+def usar_pasta(tipo):
+    """Põe no sys.path a pasta do simulador do tipo, para importar seus módulos."""
+    pasta = os.path.join(RAIZ, PASTAS[tipo])
+    if pasta not in sys.path:
+        sys.path.append(pasta)
+
+
+def _classes(tipo):
+    usar_pasta(tipo)
+    if tipo in ("AFD", "AFN"):
+        from afn_afd import AFD, AFN
+        return AFD, AFN
+    if tipo == "AP":
+        from pda import PDA
+        return PDA
+    from maquina_turing import MaquinaTuring, Transicao
+    return MaquinaTuring, Transicao
+
+
+# -------------------------
+# Formatos antigos -> versão 1
+# -------------------------
+def normalizar(dados):
+    """Converte qualquer formato conhecido para a versão 1 (e valida)."""
+    if dados.get("formato") == FORMATO:
+        if dados.get("versao", 0) > VERSAO:
+            raise ValueError(f"Arquivo na versão {dados['versao']}, mais nova que a suportada ({VERSAO}).")
+        validar(dados)
+        return dados
+
+    if dados.get("tipo") in ("AFD", "AFN") and "delta" in dados:
+        novo = _de_finito(dados)
+    elif isinstance(dados.get("estados"), dict) and "transicoes" in dados:
+        novo = _de_pilha(dados)
+    elif "gamma" in dados and "transitions" in dados:
+        novo = _de_turing(dados)
+    else:
+        raise ValueError("Formato de autômato não reconhecido.")
+    validar(novo)
+    return novo
+
+
+def _de_finito(dados):
+    # delta com chaves (estado, símbolo), como em PREDEFINED_AUTOMATA, ou
+    # aninhado {estado: {símbolo: destino(s)}}, como no JSON de "afn_afd copy.py"
+    pares = []
+    for chave, valor in dados["delta"].items():
+        if isinstance(chave, tuple):
+            pares.append((chave, valor))
+        else:
+            pares.extend(((chave, simbolo), destino) for simbolo, destino in valor.items())
+
+    transicoes = []
+    for (origem, simbolo), destinos in pares:
+        simbolo = "ε" if simbolo == "epsilon" else simbolo
+        if isinstance(destinos, str):
+            destinos = [destinos]
+        for destino in sorted(destinos):
+            transicoes.append({"origem": origem, "simbolo": simbolo, "destino": destino})
+
+    return {
+        "formato": FORMATO, "versao": VERSAO, "tipo": dados["tipo"],
+        "estados": sorted(dados["Q"]), "inicial": dados["q0"], "finais": sorted(dados["F"]),
+        "alfabeto": sorted(dados["Sigma"]), "transicoes": transicoes,
+    }
+
+
+def _de_pilha(dados):
+    # PDA.to_json: {"estados": {nome: {"inicial", "final"}}, "transicoes": [...]}
+    estados = dados["estados"]
+    return {
+        "formato": FORMATO, "versao": VERSAO, "tipo": "AP",
+        "estados": list(estados),
+        "inicial": next((e for e, info in estados.items() if info.get("inicial")), None),
+        "finais": [e for e, info in estados.items() if info.get("final")],
+        "transicoes": [
+            {chave: t[chave] for chave in ("origem", "destino", "entrada", "pilha", "empilha")}
+            for t in dados["transicoes"]
+        ],
+    }
+
+
+def _de_turing(dados):
+    # MaquinaTuring.to_json
+    return {
+        "formato": FORMATO, "versao": VERSAO, "tipo": "MT",
+        "estados": sorted(dados["Q"]), "inicial": dados["q0"],
+        "finais": sorted(dados["q_accept"]), "rejeicao": sorted(dados["q_reject"]),
+        "alfabeto": sorted(dados["sigma"]), "alfabeto_fita": sorted(dados["gamma"]),
+        "branco": dados["blank"],
+        "transicoes": [
+            {"origem": t["from"], "le": t["read"], "destino": t["to"], "escreve": t["write"], "move": t["move"]}
+            for t in dados["transitions"]
+        ],
+    }
+
+
+CAMPOS = {
+    "AFD": ("origem", "simbolo", "destino"),
+    "AFN": ("origem", "simbolo", "destino"),
+    "AP": ("origem", "destino", "entrada", "pilha", "empilha"),
+    "MT": ("origem", "le", "destino", "escreve", "move"),
+}
+
+# Chaves obrigatórias além das comuns a todos os tipos
+EXTRAS = {
+    "AFD": ("alfabeto",),
+    "AFN": ("alfabeto",),
+    "MT": ("alfabeto_fita", "branco"),
+}
+
+
+def validar(dados):
+    tipo = dados.get("tipo")
+    if tipo not in TIPOS:
+        raise ValueError(f"Tipo desconhecido: {tipo}")
+    for chave in ("estados", "inicial", "finais", "transicoes"):
+        if chave not in dados:
+            raise ValueError(f"Faltando chave obrigatória: {chave}")
+
+    estados = set(dados["estados"])
+    if dados["inicial"] is None and tipo in ("AFD", "AFN"):
+        raise ValueError("Autômato finito sem estado inicial.")
+    if dados["inicial"] is not None and dados["inicial"] not in estados:
+        raise ValueError(f"Estado inicial {dados['inicial']} não está em estados.")
+    for chave in EXTRAS.get(tipo, ()):
+        if chave not in dados:
+            raise ValueError(f"Faltando chave obrigatória para {tipo}: {chave}")
+
+    simbolos = set(dados["alfabeto"]) if tipo in ("AFD", "AFN") else None
+    if tipo == "AFN":
+        simbolos.add("ε")
+    for t in dados["transicoes"]:
+        faltando = [campo for campo in CAMPOS[tipo] if campo not in t]
+        if faltando:
+            raise ValueError(f"Transição {t} sem {', '.join(faltando)}.")
+        if t["origem"] not in estados or t["destino"] not in estados:
+            raise ValueError(f"Transição {t} usa estado inexistente.")
+        if simbolos is not None and t["simbolo"] not in simbolos:
+            raise ValueError(f"Transição {t} usa símbolo fora do alfabeto.")
+
+
+# -------------------------
+# Versão 1 <-> objetos dos simuladores
+# -------------------------
+def de_formato(dados):
+    """Cria o AFD, AFN, PDA ou MaquinaTuring descrito (em qualquer formato conhecido)."""
+    dados = normalizar(dados)
+    tipo = dados["tipo"]
+
+    if tipo in ("AFD", "AFN"):
+        AFD, AFN = _classes(tipo)
+        delta = {}
+        for t in dados["transicoes"]:
+            simbolo = t["simbolo"]
+            if tipo == "AFD":
+                delta[(t["origem"], simbolo)] = t["destino"]
+            else:
+                simbolo = "epsilon" if simbolo == "ε" else simbolo
+                delta.setdefault((t["origem"], simbolo), set()).add(t["destino"])
+        classe = AFD if tipo == "AFD" else AFN
+        return classe(dados["estados"], dados["alfabeto"], delta, dados["inicial"], dados["finais"])
+
+    if tipo == "AP":
+        PDA = _classes(tipo)
+        ap = PDA()
+        finais = set(dados["finais"])
+        for nome in dados["estados"]:
+            ap.adicionar_estado(nome, nome == dados["inicial"], nome in finais)
+        for t in dados["transicoes"]:
+            ap.adicionar_transicao(t["origem"], t["destino"], t["entrada"], t["pilha"], t["empilha"])
+        return ap
+
+    MaquinaTuring, Transicao = _classes(tipo)
+    mt = MaquinaTuring()
+    for nome in dados["estados"]:
+        mt.add_state(nome)
+    mt.set_initial(dados["inicial"])
+    for nome in dados["finais"]:
+        mt.add_accept(nome)
+    for nome in dados.get("rejeicao", ()):
+        mt.add_reject(nome)
+    mt.set_alphabets(dados.get("alfabeto", ()), dados.get("alfabeto_fita", ()), dados.get("branco"))
+    for t in dados["transicoes"]:
+        mt.add_transition(Transicao(t["origem"], t["le"], t["destino"], t["escreve"], t["move"]))
+    return mt
+
+
+def para_formato(maquina):
+    """Descrição na versão 1 de um AFD, AFN, PDA ou MaquinaTuring."""
+    if getattr(maquina, "tipo", None) in ("AFD", "AFN"):
+        return _de_finito({"tipo": maquina.tipo, "Q": maquina.Q, "Sigma": maquina.Sigma,
+                           "delta": maquina.delta, "q0": maquina.q0, "F": maquina.F})
+    if hasattr(maquina, "transicoes"):
+        return _de_pilha(maquina.to_json())
+    if hasattr(maquina, "transitions"):
+        return _de_turing(maquina.to_json())
+    raise ValueError(f"Não sei converter {type(maquina).__name__} para o formato.")
+
+
+def compilar(maquina):
+    """Prepara a forma compilada (índices inteiros / tabelas) usada nas simulações."""
+    if hasattr(maquina, "transicoes"):
+        maquina.indice()
+        maquina.deterministico()
+    else:
+        maquina.compile()
+    return maquina
+
+
+# -------------------------
+# Arquivos e cache
+# -------------------------
+def hash_conteudo(bruto):
+    """Chave do cache: sha256 do conteúdo (bytes) mais a versão do formato."""
+    return hashlib.sha256(f"{FORMATO}:{VERSAO}:".encode() + bruto).hexdigest()
+
+
+def hash_maquina(dados):
+    """Mesma ideia para uma descrição em memória: hash do JSON canônico."""
+    texto = json.dumps(normalizar(dados), sort_keys=True, ensure_ascii=False)
+    return hash_conteudo(texto.encode("utf-8"))
+
+
+def carregar_bytes(bruto, cache=True, pasta_cache=None):
+    """
+    Máquina compilada a partir do conteúdo de um arquivo JSON. Com cache, o
+    resultado fica em <pasta_cache>/<sha256>.c<VERSAO_COMPILADA>.pickle e uma
+    leitura do mesmo conteúdo, com a mesma versão da forma compilada, pula o
+    parse e a compilação. O cache é local do usuário: só carregue pickles de
+    pastas em que você confia.
+    """
+    pasta = pasta_cache or PASTA_CACHE
+    arquivo_cache = os.path.join(pasta, f"{hash_conteudo(bruto)}.c{VERSAO_COMPILADA}.pickle")
+
+    if cache and os.path.exists(arquivo_cache):
+        # Os módulos das classes precisam estar importáveis para o pickle
+        for tipo in TIPOS:
+            usar_pasta(tipo)
+        try:
+            with open(arquivo_cache, "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            pass  # cache corrompido ou de outra versão do código: refaz
+
+    maquina = compilar(de_formato(json.loads(bruto.decode("utf-8"))))
+
+    if cache:
+        try:
+            os.makedirs(pasta, exist_ok=True)
+            temporario = f"{arquivo_cache}.{os.getpid()}.tmp"
+            with open(temporario, "wb") as f:
+                pickle.dump(maquina, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporario, arquivo_cache)
+        except OSError:
+            pass  # sem cache, mas a máquina carregou
+    return maquina
+
+
+def carregar(caminho, cache=True, pasta_cache=None):
+    with open(caminho, "rb") as f:
+        return carregar_bytes(f.read(), cache, pasta_cache)
+
+
+def salvar(maquina, caminho):
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(para_formato(maquina), f, ensure_ascii=False, indent=2)
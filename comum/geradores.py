@@ -0,0 +1,188 @@
+"""
+Geradores de cargas para benchmarks e testes de estresse: AFD/AFN aleatórios,
+AFNs que explodem na conversão para AFD, autômatos a pilha ambíguos e
+máquinas de Turing com número de passos conhecido. Tudo é montado com os
+construtores de cada simulador, então para_formato/salvar (formato.py)
+funcionam direto na saída.
+
+O parâmetro semente aceita um inteiro, None ou um random.Random já criado.
+"""
+import random
+
+try:
+    from .formato import usar_pasta
+except ImportError:
+    from formato import usar_pasta
+
+# Busy beavers de 2 símbolos: estados -> (passos até parar, uns na fita). Com 2
+# e 4 estados a mesma máquina é campeã de passos e de uns; com 3, esta é a de
+# uns (Σ = 6; a campeã de passos faz 21)
+BUSY_BEAVER = {2: (6, 4), 3: (14, 6), 4: (107, 13)}
+
+_TABELAS_BUSY_BEAVER = {
+    # (estado, lido) -> (escreve, move, próximo); H = parada
+    2: {("A", "0"): ("1", "R", "B"), ("A", "1"): ("1", "L", "B"),
+        ("B", "0"): ("1", "L", "A"), ("B", "1"): ("1", "R", "H")},
+    3: {("A", "0"): ("1", "R", "B"), ("A", "1"): ("1", "R", "H"),
+        ("B", "0"): ("0", "R", "C"), ("B", "1"): ("1", "R", "B"),
+        ("C", "0"): ("1", "L", "C"), ("C", "1"): ("1", "L", "A")},
+    4: {("A", "0"): ("1", "R", "B"), ("A", "1"): ("1", "L", "B"),
+        ("B", "0"): ("1", "L", "A"), ("B", "1"): ("0", "L", "C"),
+        ("C", "0"): ("1", "R", "H"), ("C", "1"): ("1", "L", "D"),
+        ("D", "0"): ("1", "R", "D"), ("D", "1"): ("0", "R", "A")},
+}
+
+
+def _rng(semente):
+    return semente if isinstance(semente, random.Random) else random.Random(semente)
+
+
+def alfabeto(simbolos):
+    """Os primeiros símbolos de a, b, c, ... (s26, s27, ... depois do z)."""
+    return [chr(ord("a") + j) if j < 26 else f"s{j}" for j in range(simbolos)]
+
+
+def entrada_aleatoria(simbolos, comprimento, semente=None):
+    rng = _rng(semente)
+    simbolos = sorted(simbolos)
+    return "".join(rng.choice(simbolos) for _ in range(comprimento))
+
+
+# -------------------------
+# AFD / AFN
+# -------------------------
+def afd_aleatorio(estados=10, simbolos=2, densidade=1.0, taxa_finais=0.3, semente=None):
+    """AFD com cada transição definida com probabilidade densidade (1.0 = completo)."""
+    usar_pasta("AFD")
+    from afn_afd import AFD
+    rng = _rng(semente)
+    Q = [f"q{i}" for i in range(estados)]
+    Sigma = alfabeto(simbolos)
+    delta = {(q, s): rng.choice(Q) for q in Q for s in Sigma if rng.random() < densidade}
+    F = {q for q in Q if rng.random() < taxa_finais}
+    return AFD(Q, Sigma, delta, "q0", F)
+
+
+def afn_aleatorio(estados=10, simbolos=2, densidade=1.5, taxa_epsilon=0.1, taxa_finais=0.3, semente=None):
+    """
+    AFN com, em média, densidade destinos por (estado, símbolo) e
+    taxa_epsilon * estados transições ε saindo de cada estado.
+    """
+    usar_pasta("AFN")
+    from afn_afd import AFN
+    rng = _rng(semente)
+    Q = [f"q{i}" for i in range(estados)]
+    delta = {}
+    for origem in Q:
+        for simbolo in alfabeto(simbolos) + ["epsilon"]:
+            chance = densidade / estados if simbolo != "epsilon" else taxa_epsilon
+            destinos = {q for q in Q if rng.random() < chance}
+            if destinos:
+                delta[(origem, simbolo)] = destinos
+    F = {q for q in Q if rng.random() < taxa_finais}
+    return AFN(Q, alfabeto(simbolos), delta, "q0", F)
+
+
+def afn_explosivo(n, simbolos=2):
+    """
+    "O n-ésimo símbolo a partir do fim é a": n + 1 estados, mas o AFD
+    equivalente (e o mínimo) tem 2^n estados.
+    """
+    usar_pasta("AFN")
+    from afn_afd import AFN
+    Sigma = alfabeto(simbolos)
+    Q = [f"q{i}" for i in range(n + 1)]
+    delta = {("q0", s): {"q0"} for s in Sigma}
+    delta[("q0", "a")] = {"q0", "q1"}
+    for i in range(1, n):
+        for s in Sigma:
+            delta[(f"q{i}", s)] = {f"q{i + 1}"}
+    return AFN(Q, Sigma, delta, "q0", {f"q{n}"})
+
+
+# -------------------------
+# Autômato a pilha
+# -------------------------
+def ap_ambiguo():
+    """
+    L = { a^n b^m | n <= m <= 2n }: cada a empilha um ou dois A, então há
+    2^n caminhos e O(n²) configurações para a busca explorar.
+    """
+    usar_pasta("AP")
+    from pda import PDA
+    ap = PDA()
+    ap.adicionar_estado("q0", inicial=True)
+    ap.adicionar_estado("q1")
+    ap.adicionar_estado("q2", final=True)
+    ap.adicionar_transicao("q0", "q0", "a", "ε", "A")
+    ap.adicionar_transicao("q0", "q0", "a", "ε", "AA")
+    ap.adicionar_transicao("q0", "q1", "ε", "ε", "ε")
+    ap.adicionar_transicao("q1", "q1", "b", "A", "ε")
+    ap.adicionar_transicao("q1", "q2", "ε", "Z", "ε")
+    return ap
+
+
+def ap_palindromo(simbolos=2):
+    """Palíndromos de tamanho par: o meio da palavra é um palpite não determinístico."""
+    usar_pasta("AP")
+    from pda import PDA
+    ap = PDA()
+    ap.adicionar_estado("q0", inicial=True)
+    ap.adicionar_estado("q1")
+    ap.adicionar_estado("q2", final=True)
+    for s in alfabeto(simbolos):
+        ap.adicionar_transicao("q0", "q0", s, "ε", s.upper())
+        ap.adicionar_transicao("q1", "q1", s, s.upper(), "ε")
+    ap.adicionar_transicao("q0", "q1", "ε", "ε", "ε")
+    ap.adicionar_transicao("q1", "q2", "ε", "Z", "ε")
+    return ap
+
+
+# -------------------------
+# Máquinas de Turing
+# -------------------------
+def mt_busy_beaver(estados):
+    """Busy beaver de 2 a 4 estados (branco "0"); passos e uns esperados em BUSY_BEAVER."""
+    usar_pasta("MT")
+    from maquina_turing import MaquinaTuring, Transicao
+    tabela = _TABELAS_BUSY_BEAVER[estados]
+    mt = MaquinaTuring()
+    mt.set_alphabets(sigma=[], gamma=["0", "1"], blank="0")
+    for nome in sorted({origem for origem, _ in tabela}) + ["H"]:
+        mt.add_state(nome)
+    mt.set_initial("A")
+    mt.add_accept("H")
+    for (origem, lido), (escreve, move, destino) in tabela.items():
+        mt.add_transition(Transicao(origem, lido, destino, escreve, move))
+    return mt
+
+
+def passos_contador(bits):
+    """Passos de mt_contador() na entrada "0" * bits: 2^bits ciclos de 2·bits + 2 passos."""
+    return (bits + 1) * 2 ** (bits + 1)
+
+
+def mt_contador():
+    """
+    Contador binário: na entrada "0" * bits soma 1 até estourar, voltando ao
+    início da fita a cada incremento; para (aceita) no estouro, depois de
+    passos_contador(bits) passos.
+    """
+    usar_pasta("MT")
+    from maquina_turing import MaquinaTuring, Transicao
+    branco = "λ"
+    mt = MaquinaTuring()
+    mt.set_alphabets(sigma=["0", "1"], gamma=["0", "1", branco], blank=branco)
+    for nome in ("ir", "somar", "voltar", "fim"):
+        mt.add_state(nome)
+    mt.set_initial("ir")
+    mt.add_accept("fim")
+    for b in "01":
+        mt.add_transition(Transicao("ir", b, "ir", b, "R"))        # vai até o fim do número
+        mt.add_transition(Transicao("voltar", b, "voltar", b, "L"))  # volta ao início
+    mt.add_transition(Transicao("ir", branco, "somar", branco, "L"))
+    mt.add_transition(Transicao("somar", "1", "somar", "0", "L"))    # vai um
+    mt.add_transition(Transicao("somar", "0", "voltar", "1", "L"))
+    mt.add_transition(Transicao("somar", branco, "fim", branco, "S"))  # estourou
+    mt.add_transition(Transicao("voltar", branco, "ir", branco, "R"))
+    return mt
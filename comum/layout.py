@@ -0,0 +1,195 @@
+"""
+Layout em camadas dos diagramas (AFD/AFN, autômato a pilha e máquina de
+Turing) e índice espacial para desenhar só o que aparece na tela. Sem Tk:
+só aritmética, pode ser testado sem display.
+"""
+from collections import deque
+
+
+class LayoutCamadas:
+    """
+    Estados em colunas pela distância (BFS) ao estado inicial; dentro de cada
+    coluna, a ordem vem de algumas passadas de baricentro, que reduzem os
+    cruzamentos. O resultado fica em cache em posicoes até o grafo mudar, e
+    estados novos entram sem mover os que já estão na tela.
+    """
+
+    def __init__(self, dx=180, dy=140, margem=120, max_por_camada=5, passadas=4):
+        self.dx = dx
+        self.dy = dy
+        self.margem = margem
+        self.max_por_camada = max_por_camada
+        self.passadas = passadas
+        self.posicoes = {}
+        self.camadas = []
+        self._chave = None
+
+    def calcular(self, estados, arestas, inicial=None):
+        estados = list(estados)
+        arestas = [(o, d) for o, d in arestas if o != d]  # laços não mudam o layout
+        chave = (tuple(estados), tuple(arestas), inicial)
+        if chave == self._chave:
+            return self.posicoes
+        self._chave = chave
+
+        sucessores = {e: [] for e in estados}
+        vizinhos = {e: [] for e in estados}
+        for o, d in arestas:
+            if o in sucessores and d in sucessores:
+                sucessores[o].append(d)
+                vizinhos[o].append(d)
+                vizinhos[d].append(o)
+
+        # Camada = distância ao inicial; o que ele não alcança começa outra BFS
+        camada_de = {}
+        raizes = ([inicial] if inicial in sucessores else []) + estados
+        for raiz in raizes:
+            if raiz in camada_de:
+                continue
+            camada_de[raiz] = 0
+            fila = deque([raiz])
+            while fila:
+                e = fila.popleft()
+                for d in sucessores[e]:
+                    if d not in camada_de:
+                        camada_de[d] = camada_de[e] + 1
+                        fila.append(d)
+
+        camadas = [[] for _ in range(max(camada_de.values(), default=-1) + 1)]
+        for e in estados:
+            camadas[camada_de[e]].append(e)
+        ordem = {e: i for camada in camadas for i, e in enumerate(camada)}
+
+        # Baricentro: alternando ida e volta, cada coluna se ordena pela posição
+        # média dos vizinhos na coluna anterior
+        for passada in range(self.passadas):
+            ida = passada % 2 == 0
+            sequencia = camadas[1:] if ida else camadas[-2::-1]
+            for camada in sequencia:
+                referencia = camada_de[camada[0]] + (-1 if ida else 1)
+
+                def baricentro(e):
+                    posicoes = [ordem[v] for v in vizinhos[e] if camada_de[v] == referencia]
+                    return sum(posicoes) / len(posicoes) if posicoes else ordem[e]
+
+                camada.sort(key=baricentro)
+                for i, e in enumerate(camada):
+                    ordem[e] = i
+
+        # Colunas centralizadas em relação à mais alta
+        altura = max((len(camada) for camada in camadas), default=0)
+        self.posicoes.clear()
+        for k, camada in enumerate(camadas):
+            deslocamento = (altura - len(camada)) * self.dy / 2
+            for i, e in enumerate(camada):
+                self.posicoes[e] = (self.margem + k * self.dx, self.margem + deslocamento + i * self.dy)
+        self.camadas = camadas
+        return self.posicoes
+
+    def adicionar(self, nome):
+        """Posiciona um estado novo no fim da última coluna (ou numa coluna nova)."""
+        if nome in self.posicoes:
+            return self.posicoes[nome]
+        if not self.camadas or len(self.camadas[-1]) >= self.max_por_camada:
+            self.camadas.append([])
+        camada = self.camadas[-1]
+        x = self.margem + (len(self.camadas) - 1) * self.dx
+        y = max(self.posicoes[e][1] for e in camada) + self.dy if camada else self.margem
+        camada.append(nome)
+        self.posicoes[nome] = (x, y)
+        self._chave = None
+        return self.posicoes[nome]
+
+    def atualizar(self, estados, arestas, inicial=None):
+        """
+        Como calcular(), mas se já existe um layout só posiciona os estados
+        novos (e esquece os removidos), sem mover os que já estão na tela.
+        """
+        estados = list(estados)
+        if not self.posicoes:
+            return self.calcular(estados, arestas, inicial)
+        presentes = set(estados)
+        for e in [e for e in self.posicoes if e not in presentes]:
+            del self.posicoes[e]
+        for camada in self.camadas:
+            camada[:] = [e for e in camada if e in presentes]
+        for e in estados:
+            self.adicionar(e)
+        return self.posicoes
+
+    def transformacao(self, largura, altura, margem=50):
+        """
+        (escala, ox, oy) que leva as posições para dentro de largura x altura,
+        centralizadas e sem aumentar: a tela mostra (ox + x * escala, oy + y * escala).
+        """
+        limites = self.limites() or (0, 0, 0, 0)
+        x0, y0, x1, y1 = limites
+        escala = min(1.0, (largura - 2 * margem) / max(x1 - x0, 1), (altura - 2 * margem) / max(y1 - y0, 1))
+        escala = max(escala, 0.05)
+        ox = (largura - (x1 - x0) * escala) / 2 - x0 * escala
+        oy = (altura - (y1 - y0) * escala) / 2 - y0 * escala
+        return escala, ox, oy
+
+    def encaixar(self, largura, altura, margem=50):
+        """Posições já transformadas (ver transformacao) para caber em largura x altura."""
+        escala, ox, oy = self.transformacao(largura, altura, margem)
+        return {e: (ox + x * escala, oy + y * escala) for e, (x, y) in self.posicoes.items()}
+
+    def limites(self):
+        """(x0, y0, x1, y1) dos centros dos estados, ou None sem estados."""
+        if not self.posicoes:
+            return None
+        xs = [x for x, _ in self.posicoes.values()]
+        ys = [y for _, y in self.posicoes.values()]
+        return min(xs), min(ys), max(xs), max(ys)
+
+
+class GradeEspacial:
+    """
+    Índice espacial em grade uniforme: cada chave é guardada com sua caixa nas
+    células que ela cobre, e consultar() devolve as chaves cujas caixas
+    cruzam um retângulo olhando só as células dele.
+    """
+
+    def __init__(self, tamanho=300):
+        self.tamanho = tamanho
+        self._celulas = {}
+        self._caixas = {}
+
+    def _cobertura(self, x0, y0, x1, y1):
+        t = self.tamanho
+        for i in range(int(x0 // t), int(x1 // t) + 1):
+            for j in range(int(y0 // t), int(y1 // t) + 1):
+                yield i, j
+
+    def inserir(self, chave, x0, y0, x1, y1):
+        self.remover(chave)
+        self._caixas[chave] = (x0, y0, x1, y1)
+        for celula in self._cobertura(x0, y0, x1, y1):
+            self._celulas.setdefault(celula, set()).add(chave)
+
+    def remover(self, chave):
+        caixa = self._caixas.pop(chave, None)
+        if caixa is None:
+            return
+        for celula in self._cobertura(*caixa):
+            chaves = self._celulas.get(celula)
+            if chaves is not None:
+                chaves.discard(chave)
+                if not chaves:
+                    del self._celulas[celula]
+
+    def limpar(self):
+        self._celulas.clear()
+        self._caixas.clear()
+
+    def consultar(self, x0, y0, x1, y1):
+        encontradas = set()
+        for celula in self._cobertura(x0, y0, x1, y1):
+            for chave in self._celulas.get(celula, ()):
+                if chave in encontradas:
+                    continue
+                cx0, cy0, cx1, cy1 = self._caixas[chave]
+                if cx0 <= x1 and x0 <= cx1 and cy0 <= y1 and y0 <= cy1:
+                    encontradas.add(chave)
+        return encontradas
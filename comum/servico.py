@@ -0,0 +1,287 @@
+"""
+Serviço HTTP/JSON local (só biblioteca padrão: asyncio) que roda os
+simuladores em lote. Uso: python servico.py [--host H] [--porta P] [--processos N]
+
+  GET  /saude     -> {"ok": true}
+  POST /simular   corpo {"maquina": <descrição em qualquer formato de
+                  formato.py>, "entradas": [...], "opcoes": {...}}; no lugar de
+                  "maquina" pode vir "maquina_hash", devolvido no cabeçalho
+                  X-Maquina-Hash de uma requisição anterior.
+                  Resposta em NDJSON por partes (chunked), na ordem das
+                  entradas: {"entrada": ..., "resultado": ...} por linha.
+
+opcoes: "aceitacao" para AP (critério de pda.py) e "limite_passos" para MT.
+A leitura do corpo (JSON, normalização e hash) e as execuções vão para um
+pool de processos, então o laço de eventos nunca bloqueia. Cada processo
+guarda as máquinas compiladas pelo hash do conteúdo; a definição só é enviada
+a um processo que ainda não tem a máquina.
+"""
+import argparse
+import asyncio
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .formato import compilar, de_formato, hash_maquina, normalizar
+except ImportError:
+    from formato import compilar, de_formato, hash_maquina, normalizar
+
+TAMANHO_LOTE = 256              # entradas por tarefa enviada ao pool
+MAX_MAQUINAS = 64               # máquinas compiladas guardadas por processo
+MAX_CORPO = 64 * 1024 * 1024    # bytes
+
+MOTIVOS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class ErroHTTP(Exception):
+    def __init__(self, status, mensagem):
+        super().__init__(mensagem)
+        self.status = status
+
+    def __reduce__(self):
+        # Volta inteira dos processos do pool (o padrão só guardaria a mensagem)
+        return ErroHTTP, (self.status, str(self))
+
+
+class MaquinaAusente(KeyError):
+    """O processo do pool não tem a máquina da chave (nunca recebeu ou já descartou)."""
+
+
+# -------------------------
+# Lado dos processos do pool
+# -------------------------
+_maquinas = OrderedDict()
+
+
+def _maquina(chave, dados):
+    item = _maquinas.get(chave)
+    if item is None:
+        if dados is None:
+            raise MaquinaAusente(chave)
+        item = (dados["tipo"], compilar(de_formato(dados)))
+        _maquinas[chave] = item
+        if len(_maquinas) > MAX_MAQUINAS:
+            _maquinas.popitem(last=False)
+    else:
+        _maquinas.move_to_end(chave)
+    return item
+
+
+def ler_pedido(corpo):
+    """Decodifica e valida o corpo de /simular: (chave, dados normalizados ou None se veio só o hash, entradas, opcoes)."""
+    try:
+        pedido = json.loads(corpo.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ErroHTTP(400, f"JSON inválido: {e}")
+    if not isinstance(pedido, dict) or not isinstance(pedido.get("entradas"), list):
+        raise ErroHTTP(400, "o corpo precisa ter a lista \"entradas\"")
+    entradas = [str(w) for w in pedido["entradas"]]
+    opcoes = pedido.get("opcoes") or {}
+
+    if "maquina" not in pedido:
+        return pedido.get("maquina_hash"), None, entradas, opcoes
+    try:
+        dados = normalizar(pedido["maquina"])
+        chave = hash_maquina(dados)
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise ErroHTTP(400, f"máquina inválida: {e}")
+    return chave, dados, entradas, opcoes
+
+
+def rodar_lote(chave, dados, entradas, opcoes):
+    """
+    Executa um pedaço do lote num processo do pool; devolve um resultado por
+    entrada. dados pode ser None se o processo já tiver a máquina da chave;
+    senão levanta MaquinaAusente e o pedaço é reenviado com a definição.
+    """
+    tipo, maquina = _maquina(chave, dados)
+
+    if tipo in ("AFD", "AFN"):
+        return [{"resultado": "ACEITA" if maquina.accepts(w) else "REJEITA"} for w in entradas]
+
+    if tipo == "AP":
+        vereditos = maquina.simular_lote(entradas, aceitacao=opcoes.get("aceitacao", "final_e_pilha"))
+        return [{"resultado": v} for v in vereditos]
+
+    from simulador import SimuladorTM  # a pasta MT já está no sys.path (de_formato)
+    limite = int(opcoes.get("limite_passos", 1000))
+    resultados = []
+    for w in entradas:
+        sim = SimuladorTM(maquina)
+        sim.reset(w)
+        while sim.step_count < limite and sim.step() is not None:
+            pass
+        if sim.is_accept():
+            resultado = "ACEITA"
+        elif sim.is_reject() or sim.current_state is None:
+            resultado = "REJEITA"
+        else:
+            resultado = "INDECIDIDO: limite atingido"
+        fita = sim.fita
+        celulas = "".join(fita.tape[i] for i in sorted(fita.tape)).strip(maquina.blank)
+        resultados.append({"resultado": resultado, "fita": celulas, "passos": sim.step_count})
+    return resultados
+
+
+# -------------------------
+# Servidor
+# -------------------------
+class Servico:
+
+    def __init__(self, host="127.0.0.1", porta=8765, processos=None, tamanho_lote=TAMANHO_LOTE):
+        self.host = host
+        self.porta = porta
+        self.processos = processos
+        self.tamanho_lote = tamanho_lote
+        self._definicoes = OrderedDict()  # hash -> descrição normalizada
+        self._pool = None
+        self._servidor = None
+
+    async def iniciar(self):
+        self._pool = ProcessPoolExecutor(self.processos)
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.porta)
+        self.porta = self._servidor.sockets[0].getsockname()[1]  # porta 0 = qualquer livre
+        return self
+
+    async def fechar(self):
+        self._servidor.close()
+        await self._servidor.wait_closed()
+        self._pool.shutdown()
+
+    async def servir(self):
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    async def _atender(self, leitor, escritor):
+        try:
+            metodo, caminho, corpo = await self._ler_requisicao(leitor)
+            if caminho == "/saude":
+                await self._responder(escritor, 200, {"ok": True})
+            elif caminho == "/simular":
+                if metodo != "POST":
+                    raise ErroHTTP(405, "use POST em /simular")
+                await self._simular(escritor, corpo)
+            else:
+                raise ErroHTTP(404, f"caminho desconhecido: {caminho}")
+        except ErroHTTP as e:
+            await self._responder(escritor, e.status, {"erro": str(e)})
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            escritor.close()
+
+    async def _ler_requisicao(self, leitor):
+        try:
+            cabecalho = await leitor.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError:
+            raise ErroHTTP(413, "cabeçalho grande demais")
+        linhas = cabecalho.decode("latin-1").split("\r\n")
+        partes = linhas[0].split()
+        if len(partes) != 3:
+            raise ErroHTTP(400, "linha de requisição inválida")
+        metodo, caminho, _ = partes
+
+        tamanho = 0
+        for linha in linhas[1:]:
+            nome, _, valor = linha.partition(":")
+            if nome.strip().lower() == "content-length":
+                try:
+                    tamanho = int(valor.strip() or 0)
+                except ValueError:
+                    raise ErroHTTP(400, "Content-Length inválido")
+        if tamanho > MAX_CORPO:
+            raise ErroHTTP(413, "corpo grande demais")
+        corpo = await leitor.readexactly(tamanho) if tamanho else b""
+        return metodo, caminho.split("?")[0], corpo
+
+    async def _responder(self, escritor, status, objeto):
+        dados = json.dumps(objeto, ensure_ascii=False).encode("utf-8")
+        escritor.write(
+            f"HTTP/1.1 {status} {MOTIVOS[status]}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(dados)}\r\nConnection: close\r\n\r\n".encode("latin-1") + dados
+        )
+        await escritor.drain()
+
+    def _definicao(self, chave, dados):
+        # Guarda a definição (para pedidos só com o hash e para reenviar a
+        # processos que não têm a máquina) ou recupera a de um pedido anterior
+        if dados is not None:
+            self._definicoes[chave] = dados
+            if len(self._definicoes) > MAX_MAQUINAS:
+                self._definicoes.popitem(last=False)
+        else:
+            dados = self._definicoes.get(chave) if isinstance(chave, str) else None
+            if dados is None:
+                raise ErroHTTP(400, "envie \"maquina\" ou um \"maquina_hash\" conhecido")
+        self._definicoes.move_to_end(chave)
+        return dados
+
+    async def _simular(self, escritor, corpo):
+        # Corpos de até MAX_CORPO: decodificar no laço de eventos travaria as outras conexões
+        loop = asyncio.get_running_loop()
+        chave, dados, entradas, opcoes = await loop.run_in_executor(self._pool, ler_pedido, corpo)
+        dados = self._definicao(chave, dados)
+
+        escritor.write(
+            f"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson; charset=utf-8\r\n"
+            f"Transfer-Encoding: chunked\r\nX-Maquina-Hash: {chave}\r\nConnection: close\r\n\r\n".encode("latin-1")
+        )
+
+        # Poucas tarefas em voo por vez: o pool trabalha enquanto as respostas
+        # anteriores são escritas, sem enfileirar o lote inteiro na memória.
+        # Os pedaços vão só com a chave; a definição segue apenas num reenvio
+        # para o processo que responder MaquinaAusente
+        def enviar(pedaco, definicao=None):
+            return loop.run_in_executor(self._pool, rodar_lote, chave, definicao, pedaco, opcoes)
+
+        pedacos = [entradas[i:i + self.tamanho_lote] for i in range(0, len(entradas), self.tamanho_lote)]
+        em_voo = []
+        proximo = 0
+        limite = 2 * (self.processos or os.cpu_count() or 1)
+        try:
+            while proximo < len(pedacos) or em_voo:
+                while proximo < len(pedacos) and len(em_voo) < limite:
+                    tarefa = enviar(pedacos[proximo])
+                    em_voo.append((pedacos[proximo], tarefa))
+                    proximo += 1
+                pedaco, tarefa = em_voo.pop(0)
+                try:
+                    try:
+                        resultados = await tarefa
+                    except MaquinaAusente:
+                        resultados = await enviar(pedaco, dados)
+                except Exception as e:
+                    resultados = [{"erro": f"{type(e).__name__}: {e}"}] * len(pedaco)
+                linhas = "".join(
+                    json.dumps({"entrada": w, **r}, ensure_ascii=False) + "\n" for w, r in zip(pedaco, resultados)
+                ).encode("utf-8")
+                escritor.write(f"{len(linhas):x}\r\n".encode("latin-1") + linhas + b"\r\n")
+                await escritor.drain()
+            escritor.write(b"0\r\n\r\n")
+            await escritor.drain()
+        finally:
+            for _, tarefa in em_voo:
+                tarefa.cancel()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Serviço HTTP dos simuladores de autômatos")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--processos", type=int, default=None)
+    args = parser.parse_args()
+
+    servico = await Servico(args.host, args.porta, args.processos).iniciar()
+    print(f"Servindo em http://{servico.host}:{servico.porta}")
+    try:
+        await servico.servir()
+    finally:
+        await servico.fechar()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
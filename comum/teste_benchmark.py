@@ -0,0 +1,56 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+try:
+    import benchmark
+except ImportError:
+    raise ImportError("se esse erro aparecer, eh pq nao ta na mesma pasta, verificar isso")
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_rodar_grade_rapida(self):
+        resultados = benchmark.rodar(rapido=True, filtro="accepts", repeticoes=1)
+        self.assertEqual(sorted(resultados), ["AFD.accepts[10,2,1000]", "AFN.accepts[10,2,200]"])
+        self.assertTrue(all(vazao > 0 for vazao in resultados.values()))
+
+    def test_cargas_executam(self):
+        for nome, (carga, _, rapida) in benchmark.CASOS.items():
+            with self.subTest(caso=nome):
+                funcao, unidades = carga(*rapida[0], benchmark.random.Random(0))
+                funcao()
+                self.assertGreater(unidades, 0)
+
+    def test_base_por_commit_e_regressao(self):
+        with tempfile.TemporaryDirectory() as pasta:
+            benchmark.salvar_base({"A[1]": 1000.0, "B[1]": 1000.0}, "abc1234", pasta)
+            base = benchmark.carregar_base("abc1234", pasta)
+            self.assertEqual(base["commit"], "abc1234")
+            self.assertTrue(os.path.exists(os.path.join(pasta, "abc1234.json")))
+
+            # Sem commit: a do ancestral mais próximo, mesmo que outra base seja mais nova
+            benchmark.salvar_base({}, "def5678", pasta)
+            benchmark.salvar_base({}, "fff0000-sujo", pasta)
+            agora = time.time()
+            os.utime(os.path.join(pasta, "abc1234.json"), (agora - 20, agora - 20))
+            os.utime(os.path.join(pasta, "def5678.json"), (agora - 10, agora - 10))
+            historico = ["fff0000" + "0" * 33, "999" + "0" * 37, "abc1234" + "0" * 33, "def5678" + "0" * 33]
+            with mock.patch.object(benchmark, "ancestrais", return_value=historico):
+                self.assertEqual(benchmark.carregar_base(pasta=pasta)["commit"], "abc1234")
+                self.assertEqual(benchmark.carregar_base(pasta=pasta, excluir="abc1234")["commit"], "def5678")
+            with mock.patch.object(benchmark, "ancestrais", return_value=historico[:2]):
+                self.assertIsNone(benchmark.carregar_base(pasta=pasta))
+            # Sem git: a gravada por último
+            with mock.patch.object(benchmark, "ancestrais", return_value=None):
+                self.assertEqual(benchmark.carregar_base(pasta=pasta)["commit"], "fff0000-sujo")
+                self.assertEqual(benchmark.carregar_base(pasta=pasta, excluir="fff0000-sujo")["commit"], "def5678")
+
+        regressoes = benchmark.comparar({"A[1]": 850.0, "B[1]": 700.0, "C[1]": 1.0}, base, limiar=0.2)
+        self.assertEqual(regressoes, [("B[1]", 1000.0, 700.0)])
+
+if __name__ == '__main__':
+    unittest.main()
+
+# py -m unittest teste_benchmark --> para testar
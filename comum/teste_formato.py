@@ -0,0 +1,133 @@
+import json
+import os
+import tempfile
+import unittest
+from itertools import product
+from unittest import mock
+try:
+    import formato
+    from formato import carregar, de_formato, hash_maquina, normalizar, para_formato, salvar
+except ImportError:
+    raise ImportError("se esse erro aparecer, eh pq nao ta na mesma pasta, verificar isso")
+
+formato.usar_pasta("AFD")
+formato.usar_pasta("AP")
+formato.usar_pasta("MT")
+from afn_afd import PREDEFINED_AUTOMATA, AFD, AFN
+from pda import PDA, ACEITA
+from maquina_turing import MaquinaTuring
+from exemplos import exemplo_incrementador_binario
+from simulador import SimuladorTM
+
+
+def cadeias(alfabeto, tamanho=4):
+    for n in range(tamanho + 1):
+        for letras in product(sorted(alfabeto), repeat=n):
+            yield "".join(letras)
+
+
+def roda_mt(mt, entrada):
+    sim = SimuladorTM(mt)
+    sim.reset(entrada)
+    while sim.step():
+        pass
+    return sim.current_state, "".join(sim.fita.tape[i] for i in sorted(sim.fita.tape))
+
+
+class TestFormato(unittest.TestCase):
+
+    def test_predefinidos_ida_e_volta(self):
+        for nome, dados in PREDEFINED_AUTOMATA.items():
+            with self.subTest(automato=nome):
+                classe = AFD if dados["tipo"] == "AFD" else AFN
+                original = classe(dados["Q"], dados["Sigma"], dados["delta"], dados["q0"], dados["F"])
+                carregado = de_formato(dados)
+                self.assertEqual(carregado.delta, original.delta)
+                # Passa por JSON de verdade: tudo serializável
+                copia = de_formato(json.loads(json.dumps(para_formato(carregado))))
+                self.assertEqual(copia.delta, original.delta)
+                for cadeia in cadeias(dados["Sigma"]):
+                    self.assertEqual(copia.validate(cadeia)[0], original.validate(cadeia)[0])
+
+    def test_json_aninhado_antigo(self):
+        # Formato da janela "Criar Novo Autômato" de afn_afd copy.py
+        dados = {"tipo": "AFN", "Q": ["q0", "q1"], "Sigma": ["a"], "q0": "q0", "F": ["q1"],
+                 "delta": {"q0": {"a": ["q0", "q1"], "epsilon": ["q1"]}}}
+        afn = de_formato(dados)
+        self.assertEqual(afn.delta, {("q0", "a"): {"q0", "q1"}, ("q0", "epsilon"): {"q1"}})
+        self.assertEqual(normalizar(dados)["transicoes"][-1], {"origem": "q0", "simbolo": "ε", "destino": "q1"})
+
+    def test_pilha_e_turing(self):
+        ap = PDA()
+        ap.adicionar_estado("q0", inicial=True)
+        ap.adicionar_estado("q1", final=True)
+        ap.adicionar_transicao("q0", "q0", "a", "ε", "A")
+        ap.adicionar_transicao("q0", "q1", "b", "A", "ε")
+        for dados in (ap.to_json(), para_formato(ap)):
+            copia = de_formato(dados)
+            self.assertEqual(copia.to_json(), ap.to_json())
+            self.assertEqual(copia.simular("ab"), ACEITA)
+
+        mt = exemplo_incrementador_binario()
+        for dados in (mt.to_json(), para_formato(mt)):
+            copia = de_formato(dados)
+            self.assertIsInstance(copia, MaquinaTuring)
+            self.assertEqual(roda_mt(copia, "1011"), roda_mt(mt, "1011"))
+
+    def test_erros(self):
+        with self.assertRaises(ValueError):
+            normalizar({"formato": "automatos", "versao": 99, "tipo": "AFD"})
+        with self.assertRaises(ValueError):
+            normalizar({"qualquer": 1})
+        with self.assertRaises(ValueError):
+            de_formato({"tipo": "AFD", "Q": ["q0"], "Sigma": ["a"], "q0": "q0", "F": [],
+                        "delta": {"q0": {"a": "q9"}}})
+
+        # Versão 1 incompleta ou incoerente: ValueError já na validação, não KeyError depois
+        afd = {"formato": "automatos", "versao": 1, "tipo": "AFD", "estados": ["q0"], "inicial": "q0",
+               "finais": [], "transicoes": [{"origem": "q0", "simbolo": "a", "destino": "q0"}]}
+        mt = para_formato(exemplo_incrementador_binario())
+        invalidos = {
+            "AFD sem alfabeto": afd,
+            "símbolo fora do alfabeto": dict(afd, alfabeto=["b"]),
+            "ε em AFD": dict(afd, alfabeto=["a"], transicoes=[{"origem": "q0", "simbolo": "ε", "destino": "q0"}]),
+            "MT sem alfabeto_fita": {k: v for k, v in mt.items() if k != "alfabeto_fita"},
+            "MT sem branco": {k: v for k, v in mt.items() if k != "branco"},
+        }
+        for nome, dados in invalidos.items():
+            with self.subTest(nome):
+                with self.assertRaises(ValueError):
+                    de_formato(dados)
+        afn = dict(afd, tipo="AFN", alfabeto=["a"], transicoes=[{"origem": "q0", "simbolo": "ε", "destino": "q0"}])
+        self.assertEqual(de_formato(afn).delta, {("q0", "epsilon"): {"q0"}})
+
+    def test_cache_pula_parse_e_compilacao(self):
+        dados = PREDEFINED_AUTOMATA["AFD: L = 0(0|1)*1"]
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "afd.json")
+            salvar(de_formato(dados), caminho)
+            cache = os.path.join(pasta, "cache")
+
+            primeiro = carregar(caminho, pasta_cache=cache)
+            self.assertIsNotNone(primeiro.compiled)
+            self.assertEqual(len(os.listdir(cache)), 1)
+
+            with mock.patch.object(formato, "de_formato", side_effect=AssertionError("não deveria parsear")):
+                segundo = carregar(caminho, pasta_cache=cache)
+            self.assertEqual(segundo.delta, primeiro.delta)
+            self.assertEqual(list(segundo.compiled.table), list(primeiro.compiled.table))
+            self.assertTrue(segundo.accepts("0101"))
+
+            # Forma compilada de outra versão do código: o cache antigo não serve
+            with mock.patch.object(formato, "VERSAO_COMPILADA", formato.VERSAO_COMPILADA + 1), \
+                 mock.patch.object(formato, "de_formato", wraps=formato.de_formato) as parse:
+                carregar(caminho, pasta_cache=cache)
+            parse.assert_called_once()
+            self.assertEqual(len(os.listdir(cache)), 2)
+
+        self.assertEqual(hash_maquina(dados), hash_maquina(para_formato(de_formato(dados))))
+
+if __name__ == '__main__':
+    unittest.main()
+
+# py -m unittest teste_formato --> para testar
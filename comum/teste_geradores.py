@@ -0,0 +1,69 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from itertools import product
+try:
+    import geradores
+    from formato import de_formato, para_formato, usar_pasta
+except ImportError:
+    raise ImportError("se esse erro aparecer, eh pq nao ta na mesma pasta, verificar isso")
+
+usar_pasta("MT")
+from simulador import SimuladorTM
+
+
+def rodar_mt(mt, entrada):
+    sim = SimuladorTM(mt, timeout_steps=10 ** 6)
+    sim.reset(entrada)
+    while sim.step() is not None:
+        pass
+    return sim
+
+
+class TestGeradores(unittest.TestCase):
+
+    def test_busy_beaver_passos_e_uns(self):
+        for estados, (passos, uns) in geradores.BUSY_BEAVER.items():
+            with self.subTest(estados=estados):
+                sim = rodar_mt(geradores.mt_busy_beaver(estados), "")
+                self.assertTrue(sim.is_accept())
+                self.assertEqual(sim.step_count, passos)
+                self.assertEqual(list(sim.fita.tape.values()).count("1"), uns)
+
+    def test_contador_passos_conhecidos(self):
+        for bits in range(1, 8):
+            with self.subTest(bits=bits):
+                sim = rodar_mt(geradores.mt_contador(), "0" * bits)
+                self.assertTrue(sim.is_accept())
+                self.assertEqual(sim.step_count, geradores.passos_contador(bits))
+
+    def test_afn_explosivo(self):
+        for n in range(1, 7):
+            with redirect_stdout(io.StringIO()):
+                afd = geradores.afn_explosivo(n).convert_to_afd()
+            self.assertEqual(len(afd.minimize().Q), 2 ** n)
+
+    def test_ap_ambiguo(self):
+        ap = geradores.ap_ambiguo()
+        for tamanho in range(9):
+            for letras in product("ab", repeat=tamanho):
+                cadeia = "".join(letras)
+                n, m = cadeia.count("a"), cadeia.count("b")
+                esperado = cadeia == "a" * n + "b" * m and n <= m <= 2 * n
+                self.assertEqual(ap.simular(cadeia) == "ACEITA", esperado, cadeia)
+
+    def test_aleatorios_reprodutiveis_e_no_formato(self):
+        afd = geradores.afd_aleatorio(20, 3, semente=7)
+        self.assertEqual(len(afd.delta), 60)  # densidade 1.0: completo
+        self.assertEqual(afd.delta, geradores.afd_aleatorio(20, 3, semente=7).delta)
+        maquinas = [afd, geradores.afn_aleatorio(15, 2, semente=1), geradores.ap_palindromo(3),
+                    geradores.mt_busy_beaver(3)]
+        for maquina in maquinas:
+            with self.subTest(tipo=type(maquina).__name__):
+                descricao = para_formato(maquina)
+                self.assertEqual(para_formato(de_formato(descricao)), descricao)
+
+if __name__ == '__main__':
+    unittest.main()
+
+# py -m unittest teste_geradores --> para testar
@@ -0,0 +1,55 @@
+import unittest
+try:
+    from layout import GradeEspacial, LayoutCamadas
+except ImportError:
+    raise ImportError("se esse erro aparecer, eh pq nao ta na mesma pasta, verificar isso")
+
+# a^n b^n: q0 -a-> q0, q0 -b-> q1, q1 -b-> q1, q1 -ε-> q2
+ESTADOS = ["q0", "q1", "q2"]
+ARESTAS = [("q0", "q0"), ("q0", "q1"), ("q1", "q1"), ("q1", "q2")]
+
+
+class TestLayout(unittest.TestCase):
+
+    def test_camadas_pela_distancia_ao_inicial(self):
+        layout = LayoutCamadas(dx=100, dy=50, margem=0)
+        posicoes = layout.calcular(ESTADOS, ARESTAS, "q0")
+        self.assertEqual([posicoes[e][0] for e in ("q0", "q1", "q2")], [0, 100, 200])
+        # Em cache: o mesmo grafo devolve o mesmo dicionário sem recalcular
+        self.assertIs(layout.calcular(ESTADOS, ARESTAS, "q0"), posicoes)
+
+    def test_estados_novos_nao_movem_os_antigos(self):
+        layout = LayoutCamadas(max_por_camada=3)
+        for k in range(40):
+            layout.adicionar(f"q{k}")
+        antes = dict(layout.posicoes)
+        layout.adicionar("novo")
+        self.assertEqual({e: p for e, p in layout.posicoes.items() if e != "novo"}, antes)
+        self.assertEqual(len({x for x, _ in layout.posicoes.values()}), 14)
+        self.assertEqual(len(set(layout.posicoes.values())), 41)
+
+    def test_atualizar_e_encaixar(self):
+        layout = LayoutCamadas(dx=100, dy=50, margem=0)
+        layout.atualizar(ESTADOS, ARESTAS, "q0")
+        antes = dict(layout.posicoes)
+        # Estado e aresta novos: nada do que já existia se move; removido some
+        layout.atualizar(["q0", "q1", "q3"], ARESTAS[:3] + [("q1", "q3")], "q0")
+        self.assertEqual(set(layout.posicoes), {"q0", "q1", "q3"})
+        self.assertEqual({e: layout.posicoes[e] for e in ("q0", "q1")}, {e: antes[e] for e in ("q0", "q1")})
+
+        encaixadas = layout.encaixar(120, 100, margem=10)
+        for x, y in encaixadas.values():
+            self.assertTrue(10 <= x <= 110 and 10 <= y <= 90)
+
+    def test_grade_consulta_so_o_retangulo(self):
+        grade = GradeEspacial(tamanho=100)
+        for k in range(50):
+            grade.inserir(k, k * 150, 0, k * 150 + 70, 70)
+        self.assertEqual(grade.consultar(0, 0, 400, 100), {0, 1, 2})
+        grade.remover(1)
+        self.assertEqual(grade.consultar(0, 0, 400, 100), {0, 2})
+
+if __name__ == '__main__':
+    unittest.main()
+
+# py -m unittest teste_layout --> para testar
@@ -0,0 +1,120 @@
+import asyncio
+import json
+import pickle
+import unittest
+try:
+    import formato
+    from formato import para_formato, de_formato, hash_maquina, normalizar
+    from servico import ErroHTTP, MaquinaAusente, Servico, ler_pedido, rodar_lote
+except ImportError:
+    raise ImportError("se esse erro aparecer, eh pq nao ta na mesma pasta, verificar isso")
+
+formato.usar_pasta("AFD")
+formato.usar_pasta("MT")
+from afn_afd import PREDEFINED_AUTOMATA
+from exemplos import exemplo_incrementador_binario
+
+
+async def requisitar(porta, metodo, caminho, objeto=None):
+    """Cliente HTTP mínimo: devolve (status, cabeçalhos, corpo), juntando as partes chunked."""
+    leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+    corpo = json.dumps(objeto).encode("utf-8") if objeto is not None else b""
+    escritor.write(f"{metodo} {caminho} HTTP/1.1\r\nHost: localhost\r\n"
+                   f"Content-Length: {len(corpo)}\r\n\r\n".encode("latin-1") + corpo)
+    await escritor.drain()
+
+    linhas = (await leitor.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    status = int(linhas[0].split()[1])
+    cabecalhos = {nome.lower(): valor.strip() for nome, _, valor in (l.partition(":") for l in linhas[1:] if l)}
+    if cabecalhos.get("transfer-encoding") == "chunked":
+        resposta = b""
+        while True:
+            tamanho = int((await leitor.readline()).strip(), 16)
+            if tamanho == 0:
+                break
+            resposta += await leitor.readexactly(tamanho)
+            await leitor.readline()
+    else:
+        resposta = await leitor.readexactly(int(cabecalhos["content-length"]))
+    escritor.close()
+    return status, cabecalhos, resposta.decode("utf-8")
+
+
+class TestServico(unittest.TestCase):
+
+    def rodar(self, rotina):
+        async def com_servico():
+            servico = await Servico(porta=0, processos=2, tamanho_lote=3).iniciar()
+            try:
+                return await rotina(servico.porta)
+            finally:
+                await servico.fechar()
+        return asyncio.run(com_servico())
+
+    def test_afd_em_lote_e_por_hash(self):
+        afd = de_formato(PREDEFINED_AUTOMATA["AFD: L = 0(0|1)*1"])
+        entradas = ["01", "0", "011", "1", "0101", "", "001"]
+
+        async def rotina(porta):
+            status, cabecalhos, corpo = await requisitar(porta, "POST", "/simular",
+                                                         {"maquina": para_formato(afd), "entradas": entradas})
+            self.assertEqual(status, 200)
+            linhas = [json.loads(l) for l in corpo.splitlines()]
+            self.assertEqual([l["entrada"] for l in linhas], entradas)
+            self.assertEqual([l["resultado"] == "ACEITA" for l in linhas], [afd.accepts(w) for w in entradas])
+
+            # Segunda vez só com o hash: a máquina já está no cache
+            _, _, corpo2 = await requisitar(porta, "POST", "/simular",
+                                            {"maquina_hash": cabecalhos["x-maquina-hash"], "entradas": entradas})
+            self.assertEqual(corpo2, corpo)
+        self.rodar(rotina)
+
+    def test_pilha_e_turing(self):
+        ap = {"estados": {"q0": {"inicial": True, "final": False}, "q1": {"inicial": False, "final": True}},
+              "transicoes": [{"origem": "q0", "destino": "q0", "entrada": "a", "pilha": "ε", "empilha": "A"},
+                             {"origem": "q0", "destino": "q1", "entrada": "b", "pilha": "A", "empilha": "ε"}]}
+        mt = exemplo_incrementador_binario().to_json()
+
+        async def rotina(porta):
+            _, _, corpo = await requisitar(porta, "POST", "/simular", {"maquina": ap, "entradas": ["ab", "b", "aab"]})
+            self.assertEqual([json.loads(l)["resultado"] for l in corpo.splitlines()], ["ACEITA", "REJEITA", "REJEITA"])
+            _, _, corpo = await requisitar(porta, "POST", "/simular", {"maquina": mt, "entradas": ["1011", "111"]})
+            self.assertEqual([json.loads(l)["fita"] for l in corpo.splitlines()], ["1100", "1000"])
+        self.rodar(rotina)
+
+    def test_erros(self):
+        async def rotina(porta):
+            self.assertEqual((await requisitar(porta, "GET", "/saude"))[0], 200)
+            self.assertEqual((await requisitar(porta, "GET", "/nada"))[0], 404)
+            self.assertEqual((await requisitar(porta, "GET", "/simular"))[0], 405)
+            status, _, corpo = await requisitar(porta, "POST", "/simular", {"maquina": {"x": 1}, "entradas": []})
+            self.assertEqual(status, 400)
+            self.assertIn("erro", json.loads(corpo))
+            self.assertEqual((await requisitar(porta, "POST", "/simular", {"maquina_hash": "abc", "entradas": []}))[0], 400)
+            sem_alfabeto = {"formato": "automatos", "versao": 1, "tipo": "AFD", "estados": ["q0"], "inicial": "q0",
+                            "finais": [], "transicoes": [{"origem": "q0", "simbolo": "a", "destino": "q0"}]}
+            self.assertEqual((await requisitar(porta, "POST", "/simular", {"maquina": sem_alfabeto, "entradas": ["a"]}))[0], 400)
+        self.rodar(rotina)
+
+    def test_definicao_so_quando_o_processo_nao_tem(self):
+        dados = normalizar(PREDEFINED_AUTOMATA["AFD: L = a*b+a+b* "])
+        chave = hash_maquina(dados)
+        with self.assertRaises(MaquinaAusente):
+            rodar_lote(chave, None, ["ba"], {})
+        self.assertEqual(rodar_lote(chave, dados, ["ba"], {}), [{"resultado": "ACEITA"}])
+        self.assertEqual(rodar_lote(chave, None, ["ba", "a"], {}), [{"resultado": "ACEITA"}, {"resultado": "REJEITA"}])
+
+    def test_ler_pedido(self):
+        maquina = para_formato(de_formato(PREDEFINED_AUTOMATA["AFD: L = a*b+a+b* "]))
+        corpo = json.dumps({"maquina": maquina, "entradas": ["ba", 1]})
+        chave, dados, entradas, opcoes = ler_pedido(corpo.encode("utf-8"))
+        self.assertEqual((chave, entradas, opcoes), (hash_maquina(dados), ["ba", "1"], {}))
+        with self.assertRaises(ErroHTTP) as erro:
+            ler_pedido(b"{nao e json")
+        # O erro volta do processo do pool com o status
+        self.assertEqual(pickle.loads(pickle.dumps(erro.exception)).status, 400)
+
+if __name__ == '__main__':
+    unittest.main()
+
+# py -m unittest teste_servico --> para testar